@@ -0,0 +1,93 @@
+"""Benchmark the steps that parse an ABS workbook, on synthetic workbooks of increasing size.
+
+These benchmarks are offline: the workbooks are synthesised locally (see
+synthetic_inputs.py). Each step is timed at several sizes along one axis,
+and the scaling curves are reported at the end of the run.
+"""
+
+from collections.abc import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from synthetic_inputs import CAT, TABLE, cat_module, data_sheet, grab_module, meta, sheets, workbook
+
+from readabs.read_support import HYPHEN
+
+PERIODS = (120, 480, 1920)  # months of history: 10, 40 and 160 years
+SERIES = (10, 40, 160)  # series in a table
+DATA_SHEETS = (1, 2, 4, 8)  # Data sheets holding the same 160 series
+HEADER_ROWS = (10, 11, 12)  # the Excel rows of the Index sheet header that _capture_meta() looks for
+Record = Callable[[str, int], None]  # the scaling fixture: record(axis, size)
+
+
+# --- benchmarks
+@pytest.mark.benchmark(group="_add_excel_bytes, by periods")
+@pytest.mark.parametrize("n_periods", PERIODS)
+def bench_add_excel_bytes_periods(benchmark: BenchmarkFixture, scaling: Record, n_periods: int) -> None:
+    """Read the sheets of a workbook of 20 series, as history grows."""
+    raw = workbook(n_periods=n_periods)
+    result = benchmark(grab_module._add_excel_bytes, {}, raw, TABLE, {})  # noqa: SLF001
+    scaling("periods", n_periods)
+    assert len(result) == 2
+
+
+@pytest.mark.benchmark(group="_add_excel_bytes, by series")
+@pytest.mark.parametrize("n_series", SERIES)
+def bench_add_excel_bytes_series(benchmark: BenchmarkFixture, scaling: Record, n_series: int) -> None:
+    """Read the sheets of a workbook of 20 years of months, as the series grow."""
+    raw = workbook(n_series=n_series)
+    result = benchmark(grab_module._add_excel_bytes, {}, raw, TABLE, {})  # noqa: SLF001
+    scaling("series", n_series)
+    assert len(result) == 2
+
+
+@pytest.mark.benchmark(group="_capture_meta, by series")
+@pytest.mark.parametrize("n_series", SERIES)
+def bench_capture_meta_series(benchmark: BenchmarkFixture, scaling: Record, n_series: int) -> None:
+    """Capture the metadata from the Index sheet, as the series grow."""
+    from_dict = sheets(n_series=n_series)
+    result = benchmark(cat_module._capture_meta, CAT, from_dict, f"{TABLE}{HYPHEN}Index")  # noqa: SLF001
+    scaling("series", n_series)
+    assert len(result) == n_series
+
+
+@pytest.mark.benchmark(group="_capture_meta, by header row")
+@pytest.mark.parametrize("header_row", HEADER_ROWS)
+def bench_capture_meta_header_row(benchmark: BenchmarkFixture, header_row: int) -> None:
+    """Capture the metadata from an Index sheet with its header on each of the rows searched."""
+    from_dict = sheets(n_series=40, header_row=header_row)
+    result = benchmark(cat_module._capture_meta, CAT, from_dict, f"{TABLE}{HYPHEN}Index")  # noqa: SLF001
+    assert len(result) == 40
+
+
+@pytest.mark.benchmark(group="_capture_data, by periods")
+@pytest.mark.parametrize("n_periods", PERIODS)
+def bench_capture_data_periods(benchmark: BenchmarkFixture, scaling: Record, n_periods: int) -> None:
+    """Stitch the Data sheet of 20 series into a table, as history grows."""
+    from_dict, abs_meta = sheets(n_periods=n_periods), meta(n_periods=n_periods)
+    result = benchmark(cat_module._capture_data, abs_meta, from_dict, list(from_dict))  # noqa: SLF001
+    scaling("periods", n_periods)
+    assert result.shape[1] == 20
+    assert len(result) <= n_periods  # the periods before any series starts are dropped
+
+
+@pytest.mark.benchmark(group="_capture_data, by Data sheets")
+@pytest.mark.parametrize("n_data_sheets", DATA_SHEETS)
+def bench_capture_data_sheets(benchmark: BenchmarkFixture, scaling: Record, n_data_sheets: int) -> None:
+    """Stitch 160 series into a table, as they are split across more Data sheets."""
+    kwargs = {"n_series": 160, "n_data_sheets": n_data_sheets}
+    from_dict, abs_meta = sheets(**kwargs), meta(**kwargs)
+    result = benchmark(cat_module._capture_data, abs_meta, from_dict, list(from_dict))  # noqa: SLF001
+    scaling("Data sheets", n_data_sheets)
+    assert result.shape[1] == 160
+
+
+@pytest.mark.benchmark(group="_index_to_period, by periods")
+@pytest.mark.parametrize("n_periods", PERIODS)
+def bench_index_to_period_periods(benchmark: BenchmarkFixture, scaling: Record, n_periods: int) -> None:
+    """Turn the date column of a Data sheet into a monthly PeriodIndex, as history grows."""
+    name, dates, series_id = data_sheet(n_periods=n_periods)
+    abs_meta = meta(n_periods=n_periods)
+    _rows, index = benchmark(cat_module._index_to_period, dates, series_id, name, abs_meta, verbose=False)  # noqa: SLF001
+    scaling("periods", n_periods)
+    assert index.freqstr == "M"
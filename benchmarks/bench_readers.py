@@ -0,0 +1,66 @@
+"""Benchmark the public readers, end to end, on synthetic ABS catalogues and RBA tables of increasing size.
+
+These benchmarks are offline: read_abs_cat() reads a synthetic zip through
+its zip_file path, and read_rba_table() is handed a synthetic workbook in
+place of a download. The memoised results are dropped before each round,
+so each round parses afresh.
+"""
+
+from collections.abc import Callable, Iterator
+from importlib import import_module
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from synthetic_inputs import CAT, catalogue_zip, rba_table
+
+import readabs as ra
+
+rba_module = import_module("readabs.read_rba_table")  # the module, not the function of the same name
+
+TABLES = (2, 8, 32)  # tables in a catalogue (20 series, 20 years of months each)
+RBA_DAYS = (500, 2000, 8000)  # business days of history in an RBA table (10 series)
+ROUNDS = 5
+Record = Callable[[str, int], None]  # the scaling fixture: record(axis, size)
+
+
+@pytest.fixture(scope="module")
+def folder(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a folder for the synthetic zip files."""
+    return tmp_path_factory.mktemp("catalogues")
+
+
+@pytest.fixture
+def fresh() -> Iterator[None]:
+    """Start and end with no memoised results."""
+    ra.clear_caches()
+    yield
+    ra.clear_caches()
+
+
+# --- benchmarks
+@pytest.mark.benchmark(group="read_abs_cat(zip_file=), by tables")
+@pytest.mark.parametrize("n_tables", TABLES)
+@pytest.mark.usefixtures("fresh")
+def bench_read_abs_cat_zip(benchmark: BenchmarkFixture, scaling: Record, folder: Path, n_tables: int) -> None:
+    """Read a catalogue from a local zip file, as the tables grow."""
+    zip_file = str(catalogue_zip(folder, n_tables))
+    data, meta = benchmark.pedantic(
+        ra.read_abs_cat, args=(CAT,), kwargs={"zip_file": zip_file}, setup=ra.clear_caches, rounds=ROUNDS
+    )
+    scaling("tables", n_tables)
+    assert len(data) == n_tables
+    assert len(meta) == 20 * n_tables
+
+
+@pytest.mark.benchmark(group="read_rba_table, by days")
+@pytest.mark.parametrize("n_periods", RBA_DAYS)
+@pytest.mark.usefixtures("fresh")
+def bench_read_rba_table(benchmark: BenchmarkFixture, scaling: Record, n_periods: int) -> None:
+    """Read a daily RBA table, as history grows."""
+    with mock.patch.object(rba_module, "_get_excel_file", return_value=rba_table(n_periods)):
+        data, meta = benchmark.pedantic(ra.read_rba_table, args=("F9",), setup=ra.clear_caches, rounds=ROUNDS)
+    scaling("days", n_periods)
+    assert data.shape == (n_periods, 10)
+    assert len(meta) == 10
@@ -0,0 +1,48 @@
+"""Shared set-up for the benchmarks: the synthetic data generator, and a report of the scaling curves.
+
+Each benchmark records the size of its input along one axis (eg. the months
+of history in a workbook). At the end of the run, the fastest time at each
+size is reported for each benchmark group, with the exponent of a power-law
+fit, so that a change in how a step scales shows up, not just a change in
+its speed.
+"""
+
+import sys
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "test"))  # for synthetic_abs
+
+# --- (benchmark group, size axis) -> [(size, fastest time in seconds)]
+_CURVES: dict[tuple[str, str], list[tuple[int, float]]] = defaultdict(list)
+
+
+@pytest.fixture
+def scaling(benchmark: BenchmarkFixture) -> Callable[[str, int], None]:
+    """Return a function that records the benchmark's fastest time against the size of its input."""
+
+    def record(axis: str, size: int) -> None:
+        if benchmark.stats is not None:  # None with --benchmark-disable
+            _CURVES[(benchmark.group or benchmark.name, axis)].append((size, benchmark.stats.stats.min))
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """Report each scaling curve: the fastest time at each size, and the fitted exponent."""
+    if not _CURVES:
+        return
+    terminalreporter.section("scaling curves (fastest round)")
+    for (group, axis), points in sorted(_CURVES.items()):
+        points.sort()
+        sizes, seconds = np.array(points).T
+        exponent = np.polyfit(np.log(sizes), np.log(seconds), 1)[0] if len(points) > 1 else np.nan
+        terminalreporter.write_line(f"{group}: time ~ {axis}^{exponent:.2f}")
+        for size, time in points:
+            each = time / size * 1e6
+            terminalreporter.write_line(f"  {axis} {size:>6,}  {time * 1e3:9.2f} ms  {each:8.2f} us each")
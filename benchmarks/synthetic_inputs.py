@@ -0,0 +1,61 @@
+"""Inputs for the benchmarks, built once per size from the synthetic ABS and RBA generator.
+
+Each input is cached, so that a benchmark times the step under test and
+not the synthesis of its data. The steps under test do not change their
+inputs (each copies what it alters).
+"""
+
+from functools import cache
+from importlib import import_module
+from pathlib import Path
+
+from pandas import DataFrame, Series
+from synthetic_abs import abs_workbook, abs_zip, rba_workbook
+
+from readabs.read_support import HYPHEN
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+cat_module = import_module("readabs.read_abs_cat")
+
+CAT = "9999.0"
+TABLE = "9999001"
+DATA_HEADER_ROWS = 9  # rows above the observations on a Data sheet, once read (as _sheet_data() takes them)
+
+
+@cache
+def workbook(*, n_series: int = 20, n_periods: int = 240, n_data_sheets: int = 1, header_row: int = 10) -> bytes:
+    """Return the bytes of a monthly ABS workbook for TABLE."""
+    return abs_workbook(
+        TABLE, n_series=n_series, n_periods=n_periods, n_data_sheets=n_data_sheets, header_row=header_row
+    )
+
+
+@cache
+def sheets(**kwargs: int) -> dict[str, DataFrame]:
+    """Return the raw sheets of the workbook, as _add_excel_bytes() reads them."""
+    return grab_module._add_excel_bytes({}, workbook(**kwargs), TABLE, {})  # noqa: SLF001
+
+
+@cache
+def meta(**kwargs: int) -> DataFrame:
+    """Return the metadata from the workbook's Index sheet."""
+    return cat_module._capture_meta(CAT, sheets(**kwargs), f"{TABLE}{HYPHEN}Index")  # noqa: SLF001
+
+
+def data_sheet(**kwargs: int) -> tuple[str, Series, str]:
+    """Return the name of the workbook's first Data sheet, its date column and its first Series ID."""
+    name = f"{TABLE}{HYPHEN}Data1"
+    raw = sheets(**kwargs)[name]
+    return name, raw.iloc[DATA_HEADER_ROWS:, 0], str(raw.iloc[DATA_HEADER_ROWS - 1, 1])
+
+
+@cache
+def catalogue_zip(folder: Path, n_tables: int) -> Path:
+    """Write a zip of n_tables ABS workbooks (20 series, 20 years of months each) to the folder."""
+    return abs_zip(folder / f"{n_tables}-tables.zip", n_tables=n_tables, n_series=20, n_periods=240)
+
+
+@cache
+def rba_table(n_periods: int) -> bytes:
+    """Return the bytes of a daily RBA workbook with n_periods business days of 10 series."""
+    return rba_workbook(n_series=10, n_periods=n_periods)
@@ -4,54 +4,153 @@ This package provides functions to download and process timeseries data from
 the Australian Bureau of Statistics (ABS) and the Reserve Bank of Australia (RBA).
 """
 
-import importlib.metadata
-
-# ABS related imports
-from readabs.abs_catalogue import abs_catalogue
-from readabs.abs_meta_data import metacol
-
-# Utility imports
-from readabs.datatype import Datatype
-from readabs.grab_abs_url import grab_abs_url, grab_abs_zip
-from readabs.print_abs_catalogue import print_abs_catalogue
-
-# RBA related imports
-from readabs.rba_catalogue import print_rba_catalogue, rba_catalogue
-from readabs.rba_meta_data import rba_metacol
-from readabs.read_abs_by_desc import read_abs_by_desc
-from readabs.read_abs_cat import read_abs_cat
-from readabs.read_abs_series import read_abs_series
-from readabs.read_rba_table import read_rba_ocr, read_rba_table
-from readabs.read_support import ReadArgs
-from readabs.recalibrate import recalibrate, recalibrate_value
-from readabs.search_abs_meta import find_abs_id, search_abs_meta
-from readabs.splice import select, select_and_splice, select_one, splice
-from readabs.utilities import (
-    annualise_percentages,
-    annualise_rates,
-    monthly_to_qtly,
-    percent_change,
-    qtly_to_monthly,
-)
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # ABS related imports
+    from readabs.abs_catalogue import abs_catalogue
+    from readabs.abs_meta_data import metacol
+
+    # Utility imports
+    from readabs.datatype import Datatype
+    from readabs.grab_abs_url import grab_abs_url, grab_abs_zip
+    from readabs.memo import clear_caches, set_cache_limit
+    from readabs.meta_index import MetaIndex
+    from readabs.print_abs_catalogue import print_abs_catalogue
+
+    # RBA related imports
+    from readabs.rba_catalogue import print_rba_catalogue, rba_catalogue
+    from readabs.rba_meta_data import rba_metacol
+    from readabs.read_abs_by_desc import read_abs_by_desc
+    from readabs.read_abs_cat import iter_abs_cat, read_abs_cat, read_abs_meta
+    from readabs.read_abs_cats import read_abs_cats
+    from readabs.read_abs_series import read_abs_panel, read_abs_series
+    from readabs.read_rba_table import read_rba_ocr, read_rba_table
+    from readabs.read_support import ReadArgs
+    from readabs.recalibrate import recalibrate, recalibrate_value
+    from readabs.search_abs_meta import find_abs_id, find_abs_ids, search_abs_meta
+    from readabs.series_directory import directory, lookup_series
+    from readabs.splice import select, select_and_splice, select_one, splice
+    from readabs.utilities import (
+        annualise_percentages,
+        annualise_rates,
+        monthly_to_qtly,
+        percent_change,
+        qtly_to_monthly,
+    )
+
+# The public names are imported on first use (PEP 562), so "import readabs"
+# does not load pandas, numpy or the web libraries until they are needed.
+# The module that holds each public name:
+_EXPORTS = {
+    "Datatype": "readabs.datatype",
+    "MetaIndex": "readabs.meta_index",
+    "ReadArgs": "readabs.read_support",
+    "abs_catalogue": "readabs.abs_catalogue",
+    "annualise_percentages": "readabs.utilities",
+    "annualise_rates": "readabs.utilities",
+    "clear_caches": "readabs.memo",
+    "directory": "readabs.series_directory",
+    "find_abs_id": "readabs.search_abs_meta",
+    "find_abs_ids": "readabs.search_abs_meta",
+    "grab_abs_url": "readabs.grab_abs_url",
+    "grab_abs_zip": "readabs.grab_abs_url",
+    "iter_abs_cat": "readabs.read_abs_cat",
+    "lookup_series": "readabs.series_directory",
+    "metacol": "readabs.abs_meta_data",
+    "monthly_to_qtly": "readabs.utilities",
+    "percent_change": "readabs.utilities",
+    "print_abs_catalogue": "readabs.print_abs_catalogue",
+    "print_rba_catalogue": "readabs.rba_catalogue",
+    "qtly_to_monthly": "readabs.utilities",
+    "rba_catalogue": "readabs.rba_catalogue",
+    "rba_metacol": "readabs.rba_meta_data",
+    "read_abs_by_desc": "readabs.read_abs_by_desc",
+    "read_abs_cat": "readabs.read_abs_cat",
+    "read_abs_cats": "readabs.read_abs_cats",
+    "read_abs_meta": "readabs.read_abs_cat",
+    "read_abs_panel": "readabs.read_abs_series",
+    "read_abs_series": "readabs.read_abs_series",
+    "read_rba_ocr": "readabs.read_rba_table",
+    "read_rba_table": "readabs.read_rba_table",
+    "recalibrate": "readabs.recalibrate",
+    "recalibrate_value": "readabs.recalibrate",
+    "search_abs_meta": "readabs.search_abs_meta",
+    "select": "readabs.splice",
+    "select_and_splice": "readabs.splice",
+    "select_one": "readabs.splice",
+    "set_cache_limit": "readabs.memo",
+    "splice": "readabs.splice",
+}
 
-# Version and author information
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0"  # Fallback for development mode
+# Author information (the version is looked up on first use)
 __author__ = "Bryan Palmer"
 
 
+def _version() -> str:
+    """Return the installed version of readabs."""
+    import importlib.metadata  # noqa: PLC0415 - only when the version is asked for
+
+    try:
+        return importlib.metadata.version(__name__)
+    except importlib.metadata.PackageNotFoundError:
+        return "0.0.0"  # Fallback for development mode
+
+
+def __getattr__(name: str) -> object:
+    """Import a public name on first use, and keep it as an attribute of the package."""
+    if name == "__version__":
+        value: object = _version()
+    elif name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including those not yet imported."""
+    return sorted({*globals(), *_EXPORTS, "__version__"})
+
+
+class _Package(ModuleType):
+    """The readabs package, which keeps its public names when their submodules are imported.
+
+    Several public functions share a name with their submodule (eg. abs_catalogue).
+    Importing a submodule sets it as an attribute of the package, which would
+    hide the function of the same name; here, that attribute is not set (the
+    submodule is still in sys.modules).
+    """
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in _EXPORTS and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
 # Exposed functions and classes
 __all__ = (
     "Datatype",
+    "MetaIndex",
     "ReadArgs",
     "abs_catalogue",
     "annualise_percentages",
     "annualise_rates",
+    "clear_caches",
+    "directory",
     "find_abs_id",
+    "find_abs_ids",
     "grab_abs_url",
     "grab_abs_zip",
+    "iter_abs_cat",
+    "lookup_series",
     "metacol",
     "monthly_to_qtly",
     "percent_change",
@@ -62,6 +161,9 @@ __all__ = (
     "rba_metacol",
     "read_abs_by_desc",
     "read_abs_cat",
+    "read_abs_cats",
+    "read_abs_meta",
+    "read_abs_panel",
     "read_abs_series",
     "read_rba_ocr",
     "read_rba_table",
@@ -71,6 +173,7 @@ __all__ = (
     "select",
     "select_and_splice",
     "select_one",
+    "set_cache_limit",
     "splice",
 )
 __pdoc__ = {
@@ -1,11 +1,13 @@
 """Catalogue map for ABS data."""
 
-from functools import cache
 from io import StringIO
 
+import numpy as np
 from pandas import DataFrame, Index, Series, read_html
 
 from readabs.download_cache import CacheError, HttpError, get_file
+from readabs.memo import memoised
+from readabs.parsed_cache import parsed
 
 # Constants
 ABS_CATALOGUE_URL = "https://www.abs.gov.au/about/data-services/help/abs-time-series-directory"
@@ -14,13 +16,14 @@ EXPECTED_COLUMNS = ["Theme", "Parent Topic", "Topic"]
 CATALOGUE_INDEX_NAME = "Catalogue ID"
 CEASED_MARKER = "Ceased"
 DEFAULT_ENCODING = "utf-8"
+PARSE_VERSION = 1  # bump when the parsed catalogue changes shape, to retire the saved copies
 
 
 class CatalogueError(Exception):
     """Error processing ABS catalogue data."""
 
 
-@cache
+@memoised("abs_catalogue")
 def abs_catalogue(*, cache_only: bool = False, verbose: bool = False) -> DataFrame:
     """Return a DataFrame of ABS Catalogue numbers.
 
@@ -58,56 +61,14 @@ def abs_catalogue(*, cache_only: bool = False, verbose: bool = False) -> DataFra
 
     """
     try:
-        # Download ABS catalogue page
+        # Download ABS catalogue page (only if it has changed since it was cached)
         abs_bytes = get_file(ABS_CATALOGUE_URL, cache_only=cache_only, verbose=verbose)
 
         if not abs_bytes:
             raise CatalogueError("No data retrieved from ABS catalogue URL")
 
-        # Parse HTML content
-        try:
-            html_content = abs_bytes.decode(DEFAULT_ENCODING, errors="replace")
-        except UnicodeDecodeError as e:
-            raise CatalogueError(f"Failed to decode HTML content: {e}") from e
-
-        # Extract tables from HTML
-        try:
-            tables = read_html(StringIO(html_content), extract_links="body")
-            if not tables:
-                raise CatalogueError("No tables found in HTML content")
-            links = tables[-1]  # Get the last table
-        except (ValueError, IndexError) as e:
-            raise CatalogueError(f"Failed to parse HTML tables: {e}") from e
-
-        # Validate required columns exist
-        required_cols = ["Catalogue number", "Topic"]
-        missing_cols = [col for col in required_cols if col not in links.columns]
-        if missing_cols:
-            raise CatalogueError(f"Missing required columns: {missing_cols}")
-
-        # Extract catalogue numbers and URLs
-        try:
-            cats = links["Catalogue number"].apply(Series)[0]
-            urls = links["Topic"].apply(Series)[1]
-        except (KeyError, IndexError) as e:
-            raise CatalogueError(f"Failed to extract catalogue data: {e}") from e
-
-        # Process topic URLs to create hierarchical structure
-        url_snippets = _process_topic_urls(urls)
-
-        # Create main DataFrame with hierarchical topic structure
-        frame = _create_topic_frame(url_snippets)
-        frame["URL"] = urls
-
-        # Align catalogue numbers with processed frame
-        cats = cats[frame.index]
-
-        # Process catalogue status (active vs ceased)
-        cat_index, status = _process_catalogue_status(cats)
-
-        frame["Status"] = status
-        frame.index = Index(cat_index)
-        frame.index.name = CATALOGUE_INDEX_NAME
+        # Parse it, or load what was parsed from the same page in an earlier session
+        frame = parsed("abs-catalogue", abs_bytes, _parse_catalogue, version=PARSE_VERSION, verbose=verbose)
 
     except (HttpError, CacheError, ValueError) as e:
         raise CatalogueError(f"Error retrieving ABS catalogue: {e}") from e
@@ -115,6 +76,57 @@ def abs_catalogue(*, cache_only: bool = False, verbose: bool = False) -> DataFra
     return frame
 
 
+def _parse_catalogue(abs_bytes: bytes) -> DataFrame:
+    """Parse the ABS time-series directory page into the catalogue DataFrame."""
+    # Parse HTML content
+    try:
+        html_content = abs_bytes.decode(DEFAULT_ENCODING, errors="replace")
+    except UnicodeDecodeError as e:
+        raise CatalogueError(f"Failed to decode HTML content: {e}") from e
+
+    # Extract tables from HTML
+    try:
+        tables = read_html(StringIO(html_content), extract_links="body")
+        if not tables:
+            raise CatalogueError("No tables found in HTML content")
+        links = tables[-1]  # Get the last table
+    except (ValueError, IndexError) as e:
+        raise CatalogueError(f"Failed to parse HTML tables: {e}") from e
+
+    # Validate required columns exist
+    required_cols = ["Catalogue number", "Topic"]
+    missing_cols = [col for col in required_cols if col not in links.columns]
+    if missing_cols:
+        raise CatalogueError(f"Missing required columns: {missing_cols}")
+
+    # Extract catalogue numbers and URLs (each cell is a (text, link) pair)
+    cats = _cell_part(links["Catalogue number"], 0)
+    urls = _cell_part(links["Topic"], 1)
+
+    # Process topic URLs to create hierarchical structure
+    url_snippets = _process_topic_urls(urls)
+
+    # Create main DataFrame with hierarchical topic structure
+    frame = _create_topic_frame(url_snippets)
+    frame["URL"] = urls
+
+    # Align catalogue numbers with processed frame
+    cats = cats[frame.index]
+
+    # Process catalogue status (active vs ceased)
+    cat_index, status = _process_catalogue_status(cats)
+
+    frame["Status"] = status
+    frame.index = Index(cat_index)
+    frame.index.name = CATALOGUE_INDEX_NAME
+    return frame
+
+
+def _cell_part(cells: Series, part: int) -> Series:
+    """Return the text (0) or link (1) from each (text, link) cell of a read_html(extract_links=) column."""
+    return Series(cells.str[part], index=cells.index, dtype="str")
+
+
 def _process_topic_urls(urls: Series) -> Series:
     """Process topic URLs to extract clean topic hierarchy."""
     # Remove root URL prefix
@@ -140,9 +152,8 @@ def _process_catalogue_status(cats: Series) -> tuple[Series, Series]:
     cat_index = cats.str.replace(CEASED_MARKER, "", regex=False).str.strip()
 
     # Determine status based on presence of ceased marker
-    status = Series("Active", index=cats.index)
-    ceased_mask = cats.str.contains(CEASED_MARKER, na=False)
-    status.loc[ceased_mask] = "Ceased"
+    ceased_mask = cats.str.contains(CEASED_MARKER, na=False).to_numpy(dtype=bool)
+    status = Series(np.where(ceased_mask, "Ceased", "Active"), index=cats.index, dtype="str")
 
     return cat_index, status
 
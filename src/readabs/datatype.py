@@ -1,7 +1,8 @@
 """Create a TypeVar for either a Series or a DataFrame."""
 
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
-from pandas import DataFrame, Series
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
 
-Datatype = TypeVar("Datatype", Series, DataFrame)
+Datatype = TypeVar("Datatype", "Series", "DataFrame")  # named, so pandas is not imported to define it
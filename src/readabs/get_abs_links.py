@@ -1,18 +1,21 @@
 """Scan an ABS webpage for links to Excel and zip files."""
 
+from collections.abc import Iterable, Mapping
+from hashlib import sha256
 from pathlib import Path
 from typing import NotRequired, Unpack
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup, Tag
-
 # local imports
 from readabs.download_cache import CacheError, FileKwargs, HttpError, get_file
+from readabs.page_links import iter_links
+from readabs.parsed_cache import parsed
 
 # --- Constants
 DEFAULT_ABS_PREFIX = "https://www.abs.gov.au"
 SUPPORTED_FILE_TYPES = (".zip", ".xlsx")  # must be lowercase
 DEFAULT_ENCODING = "utf-8"
+PARSE_VERSION = 1  # bump when the LinkIndex changes shape, to retire the saved copies
 
 
 class LinksKwargs(FileKwargs):
@@ -24,6 +27,45 @@ class LinksKwargs(FileKwargs):
     history: NotRequired[str]
 
 
+class LinkIndex(dict[str, list[str]]):
+    """The links to data files on an ABS webpage, by file type.
+
+    As a dictionary, this maps each file type (eg. ".xlsx") to its URLs, in
+    page order, as get_abs_links() has always returned. It also indexes each
+    type's URLs by table name, so url() finds a table's link without scanning
+    the list. Treat it as read-only: the name index is built once, on creation.
+    """
+
+    __slots__ = ("_names",)
+
+    def __init__(self, links: Mapping[str, list[str]] | None = None) -> None:
+        """Index the links (a mapping of file type to URLs) by table name."""
+        super().__init__(links or {})
+        self._names: dict[str, dict[str, str]] = {}
+        for file_type, urls in self.items():
+            names = self._names.setdefault(file_type, {})
+            for url in urls:
+                names.setdefault(get_table_name(url), url)  # the first link for a name wins
+
+    def url(self, file_type: str, name: str) -> str:
+        """Return the first URL of the file type for the named table, or "" if there is none.
+
+        Args:
+            file_type: The file extension (eg. ".xlsx" or ".zip")
+            name: The table name (the file name without its extension)
+
+        Returns:
+            str: The URL that ends with the name and file type, or an empty string
+
+        """
+        goal = f"{name}{file_type}"
+        url = self._names.get(file_type, {}).get(name, "")
+        if url.endswith(goal):
+            return url
+        # not a whole table name (eg. a name with a dot in it, or the tail of a name)
+        return next((link for link in self.get(file_type, []) if link.endswith(goal)), "")
+
+
 # --- private
 def _make_absolute_url(link_url: str, prefix: str = DEFAULT_ABS_PREFIX) -> str:
     """Convert a relative URL to an absolute URL.
@@ -52,7 +94,7 @@ def _make_absolute_url(link_url: str, prefix: str = DEFAULT_ABS_PREFIX) -> str:
 
 
 # --- private
-def historicise_links(link_dict: dict[str, list[str]], history: str) -> dict[str, list[str]]:
+def historicise_links(link_dict: dict[str, list[str]], history: str) -> LinkIndex:
     """Convert ABS links to point to historical versions of the data.
 
     Modifies URLs by inserting the history string in the expected location.
@@ -64,7 +106,7 @@ def historicise_links(link_dict: dict[str, list[str]], history: str) -> dict[str
         history: History string to insert into URLs (e.g., "dec-2022")
 
     Returns:
-        dict[str, list[str]]: New dictionary with historicized URLs
+        LinkIndex: New dictionary with historicized URLs
 
     Note:
         This function makes assumptions about ABS URL structure that may not
@@ -80,7 +122,7 @@ def historicise_links(link_dict: dict[str, list[str]], history: str) -> dict[str
             new_list.append(replacement)
         new_dict[link_type] = new_list
 
-    return new_dict
+    return LinkIndex(new_dict)
 
 
 # --- public (also used by grab_abs_url.py)
@@ -112,25 +154,12 @@ def _download_page(url: str, **kwargs: Unpack[LinksKwargs]) -> bytes | None:
         return None
 
 
-def _parse_html(page: bytes, *, verbose: bool = False) -> BeautifulSoup | None:
-    """Parse HTML content and return BeautifulSoup object."""
-    try:
-        return BeautifulSoup(page, features="lxml")
-    except Exception as e:  # noqa: BLE001
-        if verbose:
-            print(f"Error parsing HTML: {e}")
-        return None
-
-
-def _extract_file_links(soup: BeautifulSoup) -> dict[str, list[str]]:
-    """Extract download links from parsed HTML."""
+def _extract_file_links(links: Iterable[tuple[str, str]]) -> dict[str, list[str]]:
+    """Extract download links from the (href, text) pairs of a page."""
     link_dict: dict[str, list[str]] = {}
 
-    for element in soup.find_all("a"):
-        if not isinstance(element, Tag):
-            continue
-        link_href = element.get("href")
-        if not link_href or not isinstance(link_href, str) or "Mock-up" in link_href:
+    for link_href, _text in links:
+        if not link_href or "Mock-up" in link_href:
             continue
 
         for file_type in SUPPORTED_FILE_TYPES:
@@ -143,6 +172,11 @@ def _extract_file_links(soup: BeautifulSoup) -> dict[str, list[str]]:
     return link_dict
 
 
+def _parse_links(page: bytes) -> LinkIndex:
+    """Return the index of the download links on a page."""
+    return LinkIndex(_extract_file_links(iter_links(page)))
+
+
 def _print_summary(link_dict: dict[str, list[str]]) -> None:
     """Print summary of found links."""
     print("Found links to the following ABS data tables:")
@@ -157,16 +191,19 @@ def get_abs_links(
     url: str = "",
     inspect_file_name: str = "",
     **kwargs: Unpack[LinksKwargs],
-) -> dict[str, list[str]]:
+) -> LinkIndex:
     """Scan an ABS webpage for downloadable file links.
 
+    The links parsed from a page are kept on disk, keyed by a hash of the
+    page, so an unchanged page is not parsed again in a later session.
+
     Args:
         url: The ABS webpage URL to scan
         inspect_file_name: Optional filename to save webpage for debugging
         **kwargs: Additional options (verbose, history, cache_only, ignore_errors)
 
     Returns:
-        dict[str, list[str]]: Dictionary mapping file extensions to lists of URLs
+        LinkIndex: Dictionary mapping file extensions to lists of URLs
 
     """
     verbose = kwargs.get("verbose", False)
@@ -174,23 +211,19 @@ def get_abs_links(
     if not url:
         if verbose:
             print("No URL provided to get_abs_links()")
-        return {}
+        return LinkIndex()
 
     # Download webpage
     page = _download_page(url, **kwargs)
     if not page:
-        return {}
+        return LinkIndex()
 
     # Save for debugging if requested
     _debug_later(inspect_file_name, page=page)
 
-    # Parse HTML
-    soup = _parse_html(page, verbose=verbose)
-    if not soup:
-        return {}
-
-    # Extract links
-    link_dict = _extract_file_links(soup)
+    # Extract links (or load them, if this page has been parsed before)
+    name = f"abs-links-{sha256(url.encode(DEFAULT_ENCODING)).hexdigest()[:16]}"
+    link_dict = parsed(name, page, _parse_links, version=PARSE_VERSION, verbose=verbose)
 
     # Apply historical versioning if requested
     history = kwargs.get("history", "")
@@ -2,11 +2,12 @@
 
 # --- imports ---
 # standard library imports
+import re
 import zipfile
-from functools import cache
+from collections.abc import Iterator
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Unpack
+from typing import Any, Unpack, overload
 
 # analytic imports
 import pandas as pd
@@ -16,8 +17,10 @@ from readabs.abs_catalogue import abs_catalogue
 from readabs.download_cache import get_file
 
 # local imports
-from readabs.get_abs_links import get_abs_links, get_table_name
-from readabs.read_support import HYPHEN, ReadArgs, check_kwargs, get_args
+from readabs.get_abs_links import LinkIndex, get_abs_links, get_table_name
+from readabs.memo import memoised
+from readabs.read_support import HYPHEN, ReadArgs, check_kwargs, get_args, result_key
+from readabs.spill import SpilledFrames
 
 # --- constants ---
 # File extensions for ABS data files
@@ -31,14 +34,41 @@ FILE_EXTENSIONS_PROCESSING_ORDER = (ZIP_EXTENSION, EXCEL_EXTENSION)
 # Default values and limits
 EMPTY_BYTES_LENGTH = 0
 
+# The sheet in each ABS workbook that holds the metadata
+INDEX_SHEET = "Index"
+
 
 # --- public - primary entry point for this module
-@cache  # minimise slowness with repeat business
+@overload
 def grab_abs_url(
     cat: str = "",
     url: str = "",
+    *,
+    index_only: bool = False,
+    memory_limit: None = None,
     **kwargs: Unpack[ReadArgs],
-) -> dict[str, DataFrame]:
+) -> dict[str, DataFrame]: ...
+
+
+@overload
+def grab_abs_url(
+    cat: str = "",
+    url: str = "",
+    *,
+    index_only: bool = False,
+    memory_limit: int | str,
+    **kwargs: Unpack[ReadArgs],
+) -> SpilledFrames: ...
+
+
+def grab_abs_url(
+    cat: str = "",
+    url: str = "",
+    *,
+    index_only: bool = False,
+    memory_limit: int | str | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> dict[str, DataFrame] | SpilledFrames:
     """For a given URL, extract the data from the Excel and ZIP file links found on that page.
 
     The data is returned as a dictionary of DataFrames. The Excel files are converted
@@ -52,6 +82,9 @@ def grab_abs_url(
     data is not a timeseries, or where the user wants to extract data from
     a specific ABS landingpage.
 
+    Results are held in memory for repeat business (see `clear_caches()`),
+    except those read with memory_limit.
+
 
     Parameters
     ----------
@@ -64,43 +97,91 @@ def grab_abs_url(
         An ABS Catalogue number. If provided, and the URL is not
         provided, then the Catalogue number will be used to get the URL.
 
+    index_only : bool = False
+        If True, only the "Index" sheet of each Excel file is read. The
+        other sheets are never parsed (nor decompressed from the xlsx).
+
+    memory_limit : int | str | None = None
+        If set (to a number of bytes, or a string such as "2GB"), a
+        read-only mapping of the sheets is returned in place of the
+        dictionary. Each workbook is read on its own, and the sheets that
+        do not fit within the limit (less parsing headroom) are pickled to a scratch
+        directory and loaded lazily. See `read_abs_cat()`.
+
     **kwargs : Unpack[ReadArgs]
         Accepts the same keyword arguments as `read_abs_cat()`.
 
     Returns
     -------
-    dict[str, DataFrame]
-        A dictionary of DataFrames.
+    dict[str, DataFrame] | SpilledFrames
+        A dictionary of DataFrames (or a mapping, with memory_limit).
 
     """
-    # check/get the keyword arguments
-    url = _get_url(url, cat)
-    check_kwargs(kwargs, "grab_abs_url")  # warn if invalid kwargs
-    args = get_args(kwargs, "grab_abs_url")  # get the valid kwargs
-    if verbose := args["verbose"]:
-        print(f"grab_abs_url(): {url=}, {args=}")
+    if memory_limit is None:
+        return _grab_abs_url(cat, url, index_only=index_only, **kwargs)
 
-    # get the URL links to the relevant ABS data files on that webpage
-    links = get_abs_links(url, **args)
-    if not links:
-        print(f"No data files found at URL: {url}")
-        return {}  # return an empty Dictionary
+    # read the data files into a spilled mapping of DataFrames, one workbook at a time
+    spilled = SpilledFrames(memory_limit)
+    for workbook in iter_abs_url(cat, url, index_only=index_only, **kwargs):
+        spilled.reserve(workbook)
+        for name, sheet in workbook.items():
+            if name not in spilled:  # the first copy of a sheet is kept
+                spilled.add(name, sheet)
+        workbook.clear()
+    return spilled
 
-    # read the data files into a dictionary of DataFrames
-    abs_dict: dict[str, DataFrame] = {}
 
-    # Process single file requests first
-    abs_dict = _process_single_files(abs_dict, links, args, verbose=verbose)
-    if abs_dict:  # If single file was found and processed, return it
-        return abs_dict
+def iter_abs_url(
+    cat: str = "",
+    url: str = "",
+    *,
+    index_only: bool = False,
+    sources: dict[str, str] | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> Iterator[dict[str, DataFrame]]:
+    """Yield the Excel workbooks found on an ABS webpage, one at a time.
+
+    This is the streaming form of `grab_abs_url()`: the same files are read,
+    but each workbook is yielded as a dictionary of DataFrames (one per
+    sheet, keyed 'table---sheet') as soon as it has been parsed, and nothing
+    is kept or cached once it has been yielded.
+
+    Parameters
+    ----------
+    cat : str = ""
+        An ABS Catalogue number. See `grab_abs_url()`.
+
+    url : str = ""
+        A URL for an ABS Catalogue landing page. See `grab_abs_url()`.
 
-    # Process all files based on configuration
-    return _process_all_files(abs_dict, links, args)
+    index_only : bool = False
+        If True, only the "Index" sheet of each Excel file is read.
+
+    sources : dict[str, str] | None = None
+        If given, this dictionary is filled in with the URL of the Excel
+        or ZIP file that each table was read from, keyed by table name.
+
+    **kwargs : Unpack[ReadArgs]
+        Accepts the same keyword arguments as `read_abs_cat()`.
+
+    Yields
+    ------
+    dict[str, DataFrame]
+        The sheets of one Excel workbook.
+
+    """
+    url = _get_url(url, cat)
+    check_kwargs(kwargs, "iter_abs_url")  # warn if invalid kwargs
+    args = get_args(kwargs, "iter_abs_url")  # get the valid kwargs
+    args["index_only"] = index_only
+    args["sources"] = sources
+    if args["verbose"]:
+        print(f"iter_abs_url(): {url=}, {args=}")
+    yield from _iter_url(url, args)
 
 
 def grab_abs_zip(
-    zip_path: Path | str,
-    **kwargs: Unpack[ReadArgs]
+    zip_path: Path | str, *, index_only: bool = False, **kwargs: Unpack[ReadArgs]
 ) -> dict[str, DataFrame]:
     """Grab and process a single ABS ZIP file from a file system location.
 
@@ -112,6 +193,9 @@ def grab_abs_zip(
     zip_path : Path | str
         The local filesystem path of the ABS ZIP file to open and process.
 
+    index_only : bool = False
+        If True, only the "Index" sheet of each Excel file is read.
+
     **kwargs : Unpack[ReadArgs]
         Additional keyword arguments for file retrieval and processing.
 
@@ -123,6 +207,7 @@ def grab_abs_zip(
     """
     check_kwargs(kwargs, "grab_abs_zip")  # warn if invalid kwargs
     args = get_args(kwargs, "grab_abs_zip")  # get the valid kwargs
+    args["index_only"] = index_only
 
     zp: Path = zip_path if isinstance(zip_path, Path) else Path(zip_path)
     zip_bytes = zp.read_bytes()
@@ -130,49 +215,137 @@ def grab_abs_zip(
     return _process_zip(abs_dict, zip_bytes, **args)
 
 
+def iter_abs_zip(
+    zip_path: Path | str,
+    *,
+    index_only: bool = False,
+    **kwargs: Unpack[ReadArgs],
+) -> Iterator[dict[str, DataFrame]]:
+    """Yield the Excel workbooks in a local ABS ZIP file, one at a time.
+
+    This is the streaming form of `grab_abs_zip()`. Each workbook is
+    yielded as a dictionary of DataFrames, one per sheet.
+    """
+    check_kwargs(kwargs, "iter_abs_zip")  # warn if invalid kwargs
+    args = get_args(kwargs, "iter_abs_zip")  # get the valid kwargs
+    args["index_only"] = index_only
+
+    zp: Path = zip_path if isinstance(zip_path, Path) else Path(zip_path)
+    yield from _iter_zip(zp.read_bytes(), args)
+
+
 # --- private
-def _process_single_files(
-    abs_dict: dict[str, DataFrame],
-    links: dict[str, list[str]],
-    args: dict[str, Any],  # ReadArgs after processing
+@memoised("grab_abs_url", tag_arg="cat", key=result_key)  # minimise slowness with repeat business
+def _grab_abs_url(
+    cat: str,
+    url: str,
     *,
-    verbose: bool,
+    index_only: bool,
+    **kwargs: Unpack[ReadArgs],
 ) -> dict[str, DataFrame]:
-    """Process single file requests (single_excel_only, selected_excel, or single_zip_only)."""
+    """Read the data files linked on an ABS webpage into a dictionary of DataFrames."""
+    # check/get the keyword arguments
+    url = _get_url(url, cat)
+    check_kwargs(kwargs, "grab_abs_url")  # warn if invalid kwargs
+    args = get_args(kwargs, "grab_abs_url")  # get the valid kwargs
+    args["index_only"] = index_only
+    if args["verbose"]:
+        print(f"grab_abs_url(): {url=}, {args=}")
+
+    abs_dict: dict[str, DataFrame] = {}
+    for workbook in _iter_url(url, args):
+        abs_dict.update(workbook)
+    return abs_dict
+
+
+def _iter_url(url: str, args: dict[str, Any]) -> Iterator[dict[str, DataFrame]]:
+    """Yield each workbook from the data files linked on an ABS webpage.
+
+    Single file requests (single_excel_only, selected_excel or
+    single_zip_only) are tried first. If they yield nothing, all files
+    are processed, based on the configuration (get_zip, get_excel, etc.).
+    """
+    # get the URL links to the relevant ABS data files on that webpage
+    links = get_abs_links(url, **args)
+    if not links:
+        print(f"No data files found at URL: {url}")
+        return
+
+    found = False
+    for workbook in _iter_links(_single_file_links(links, args), links, args):
+        found = True
+        yield workbook
+    if not found:
+        yield from _iter_links(_all_file_links(links, args), links, args)
+
+
+def _single_file_links(links: dict[str, list[str]], args: dict[str, Any]) -> list[str]:
+    """Return the links for a single file request (single_excel_only, selected_excel, or single_zip_only)."""
+    verbose = args["verbose"]
+    links = links if isinstance(links, LinkIndex) else LinkIndex(links)
     if args["single_excel_only"]:
         link = _find_url(links, EXCEL_EXTENSION, args["single_excel_only"], verbose=verbose)
         if link:
-            return _add_excel(abs_dict, link, **args)
+            return [link]
 
     if args["selected_excel"]:
-        for target in args["selected_excel"]:
-            link = _find_url(links, EXCEL_EXTENSION, target, verbose=verbose)
-            if link:
-                abs_dict = _add_excel(abs_dict, link, **args)
-        if abs_dict:
-            return abs_dict
+        found = [_find_url(links, EXCEL_EXTENSION, target, verbose=verbose) for target in args["selected_excel"]]
+        if any(found):
+            return [link for link in found if link]
 
     if args["single_zip_only"]:
         link = _find_url(links, ZIP_EXTENSION, args["single_zip_only"], verbose=verbose)
         if link:
-            return _add_zip(abs_dict, link, **args)
+            return [link]
 
-    return abs_dict
+    return []
 
 
-def _process_all_files(
-    abs_dict: dict[str, DataFrame],
+def _all_file_links(links: dict[str, list[str]], args: dict[str, Any]) -> list[str]:
+    """Return the links for all files, based on configuration (get_zip, get_excel, etc.).
+
+    ZIP files come before Excel files, and Excel files for unselected tables are dropped.
+    """
+    process_excel = _should_process_excel_file(args, links)
+    wanted = {
+        ZIP_EXTENSION: lambda _link: args["get_zip"],
+        EXCEL_EXTENSION: lambda link: process_excel and _table_selected(get_table_name(link), args["tables"]),
+    }
+    return [
+        link
+        for link_type in FILE_EXTENSIONS_PROCESSING_ORDER
+        for link in links.get(link_type, [])
+        if wanted[link_type](link)
+    ]
+
+
+def _iter_links(
+    selected: list[str],
     links: dict[str, list[str]],
     args: dict[str, Any],  # ReadArgs after processing
-) -> dict[str, DataFrame]:
-    """Process all files based on configuration (get_zip, get_excel, etc.)."""
-    for link_type in FILE_EXTENSIONS_PROCESSING_ORDER:
-        for link in links.get(link_type, []):
-            if link_type == ZIP_EXTENSION and args["get_zip"]:
-                abs_dict = _add_zip(abs_dict, link, **args)
-            elif link_type == EXCEL_EXTENSION and _should_process_excel_file(args, links):
-                abs_dict = _add_excel(abs_dict, link, **args)
-    return abs_dict
+) -> Iterator[dict[str, DataFrame]]:
+    """Download the selected ZIP and Excel files, and yield their workbooks one at a time.
+
+    An Excel file for a table that has already come from a ZIP file is skipped.
+    If args["sources"] is a dictionary, the link for each table is recorded in it.
+    """
+    sources = args.get("sources")
+    zip_links = set(links.get(ZIP_EXTENSION, []))
+    seen: set[str] = set()
+    for link in selected:
+        name = get_table_name(link)
+        if link in zip_links:
+            workbooks = _iter_zip(get_file(link, **args), args)
+        elif name in seen:
+            continue  # table already read
+        else:
+            workbooks = _iter_excel_bytes(get_file(link, **args), name, args)
+        for workbook in workbooks:
+            tables = {key.split(HYPHEN, 1)[0] for key in workbook}
+            seen.update(tables)
+            if sources is not None:
+                sources.update(dict.fromkeys(tables, link))
+            yield workbook
 
 
 def _should_process_excel_file(args: dict[str, Any], links: dict[str, list[str]]) -> bool:
@@ -205,11 +378,26 @@ def _should_process_excel_file(args: dict[str, Any], links: dict[str, list[str]]
     return False
 
 
-def _find_url(links: dict[str, list[str]], targ_type: str, target: str, *, verbose: bool = False) -> str:
+def _table_selected(name: str, tables: tuple[str, ...]) -> bool:
+    """Check whether a table name matches any of the table names or patterns.
+
+    Args:
+        name: Table name (the file name without its extension)
+        tables: Table names or regular expressions; each must match the
+            whole name. An empty tuple selects every table.
+
+    Returns:
+        bool: True if the table is wanted
+
+    """
+    return not tables or any(re.fullmatch(pattern, name) for pattern in tables)
+
+
+def _find_url(links: LinkIndex, targ_type: str, target: str, *, verbose: bool = False) -> str:
     """Find the URL for a target file type.
 
     Args:
-        links: Dictionary mapping file types to lists of URLs
+        links: The links on the page, indexed by file type and table name
         targ_type: Target file extension (e.g., '.xlsx', '.zip')
         target: Target filename without extension
         verbose: Whether to print debug information
@@ -221,13 +409,9 @@ def _find_url(links: dict[str, list[str]], targ_type: str, target: str, *, verbo
     targ_list = links.get(targ_type, [])
     if not targ_list:
         return ""
-    goal = f"{target}{targ_type}"
     if verbose:
-        print(f"_find_url(): looking for {goal} in {targ_list}.")
-    for link in targ_list:
-        if link.endswith(goal):
-            return link
-    return ""
+        print(f"_find_url(): looking for {target}{targ_type} in {targ_list}.")
+    return links.url(targ_type, target)
 
 
 def _get_url(url: str, cat: str) -> str:
@@ -280,41 +464,34 @@ def _process_zip(
     **args: Any,  # ReadArgs compatible
 ) -> dict[str, DataFrame]:
     """Read and process a ZIP file's contents from bytes."""
+    for workbook in _iter_zip(zip_contents, args):
+        abs_dict.update(workbook)
+    return abs_dict
+
+
+def _iter_zip(zip_contents: bytes, args: dict[str, Any]) -> Iterator[dict[str, DataFrame]]:
+    """Yield the workbooks in a ZIP file's contents, one at a time."""
     if len(zip_contents) == EMPTY_BYTES_LENGTH:
-        return abs_dict
+        return
 
+    tables = args.get("tables", ())
     with zipfile.ZipFile(BytesIO(zip_contents)) as zipped:
         for element in zipped.infolist():
-            # get the zipfile into pandas
+            # filter on the member name from the central directory, before anything is inflated
             table_name = get_table_name(url=element.filename)
-            raw_bytes = zipped.read(element.filename)
-            abs_dict = _add_excel_bytes(abs_dict, raw_bytes, table_name, args)
+            if not _table_selected(table_name, tables):
+                continue
 
-    return abs_dict
-
-
-def _add_zip(
-    abs_dict: dict[str, DataFrame],
-    link: str,
-    **args: Any,  # ReadArgs compatible
-) -> dict[str, DataFrame]:
-    """Read and process a ZIP file from a URL.
-
-    Downloads the ZIP file and iterates over its contents, calling
-    _add_excel_bytes() to extract Excel files and add their contents
-    to the DataFrames dictionary.
-
-    Args:
-        abs_dict: Dictionary to store extracted DataFrames
-        link: URL to the ZIP file
-        **args: Additional arguments passed to file retrieval functions
+            # get the zipfile into pandas
+            raw_bytes = zipped.read(element.filename)
+            yield from _iter_excel_bytes(raw_bytes, table_name, args)
 
-    Returns:
-        dict[str, DataFrame]: Updated dictionary with new DataFrames from ZIP contents
 
-    """
-    zip_contents = get_file(link, **args)
-    return _process_zip(abs_dict, zip_contents, **args)
+def _iter_excel_bytes(raw_bytes: bytes, name: str, args: dict[str, Any]) -> Iterator[dict[str, DataFrame]]:
+    """Yield the sheets of an Excel file as one workbook, unless there are none."""
+    workbook = _add_excel_bytes({}, raw_bytes, name, args)
+    if workbook:
+        yield workbook
 
 
 def _add_excel_bytes(
@@ -327,6 +504,10 @@ def _add_excel_bytes(
 
     Processes the bytes as an Excel file, converting each sheet to a DataFrame
     and adding them to the dictionary using 'name---sheet_name' as keys.
+    With args["index_only"], only the Index sheet is converted. openpyxl opens
+    the workbook read-only: each other sheet's XML is inflated only as far as
+    its <dimension> element (the first block, when the workbook records its
+    dimensions, as Excel does), and its cells are never parsed.
 
     Args:
         abs_dict: Dictionary to store extracted DataFrames
@@ -354,7 +535,10 @@ def _add_excel_bytes(
         return abs_dict
 
     # iterate over the sheets in the Excel file
-    for sheet_name in excel.sheet_names:
+    sheet_names = excel.sheet_names
+    if args.get("index_only", False):
+        sheet_names = [x for x in sheet_names if x == INDEX_SHEET]
+    for sheet_name in sheet_names:
         # grab and go - no treatment of the data
         sheet_data = pd.read_excel(excel, sheet_name=sheet_name)
         if len(sheet_data) == EMPTY_BYTES_LENGTH:
@@ -367,28 +551,6 @@ def _add_excel_bytes(
     return abs_dict
 
 
-def _add_excel(
-    abs_dict: dict[str, DataFrame],
-    link: str,
-    **args: Any,  # ReadArgs compatible
-) -> dict[str, DataFrame]:
-    """Read in an Excel file at the URL in the 'link' argument.
-
-    Pass those bytes to _add_excel_bytes() to put the contents
-    into the dictionary of DataFrames given by 'abs_dict'. When done,
-    return the dictionary of DataFrames.
-    """
-    name = get_table_name(link)
-
-    if name in abs_dict:
-        # table already in the dictionary
-        return abs_dict
-
-    raw_bytes = get_file(link, **args)
-
-    return _add_excel_bytes(abs_dict, raw_bytes, name, args)
-
-
 # --- main ---
 if __name__ == "__main__":
 
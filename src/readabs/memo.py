@@ -0,0 +1,285 @@
+"""memo.py - an in-memory cache of results, bounded by a byte budget.
+
+The readers keep the results of expensive calls (downloaded and parsed
+catalogues and RBA tables, the ABS and RBA catalogue maps) so that repeat
+business in a session is fast. All of these share one least-recently-used
+store, which estimates the size of each entry and evicts the oldest entries
+once the total goes over the budget. The budget defaults to 1 GB, and can be
+set with the READABS_MEMO_LIMIT environment variable (eg. "512MB"), or with
+`set_cache_limit()`.
+
+Entries are tagged with their ABS catalogue number (where there is one),
+so that `clear_caches(cat)` can drop a single catalogue after a new release.
+
+Callers get copy-on-write views of the cached values, not the values
+themselves: fresh dicts, lists and tuples, holding shallow copies of the
+DataFrames and Series. With pandas copy-on-write (always on from pandas 3),
+a shallow copy shares the data until either side writes to it, so a caller
+that adds a column, drops rows or sets values changes its own view only.
+Older pandas without copy-on-write (including the "warn" mode of pandas
+2.2) get deep copies instead; the option is checked on every call.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import wraps
+from inspect import Parameter, signature
+from typing import Any, ParamSpec, TypeVar, cast
+
+import pandas as pd
+from pandas import DataFrame, Index, Series
+
+from readabs.read_support import NON_RESULT_ARGS
+from readabs.spill import frame_bytes, parse_bytes
+
+# --- constants
+LIMIT_ENV = "READABS_MEMO_LIMIT"
+DEFAULT_LIMIT = "1GB"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+PANDAS_3 = int(pd.__version__.split(".", maxsplit=1)[0]) >= 3  # noqa: PLR2004
+KeyFunction = Callable[[dict[str, Any], dict[str, Any]], Hashable]  # (named, **kwargs) -> key
+
+
+# --- private
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    """A cached value, with its estimated size and its catalogue tag."""
+
+    value: Any
+    size: int
+    tag: str
+
+
+class _MemoStore:
+    """A thread-safe LRU mapping of keys to values, bounded by their estimated bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        """Create an empty store."""
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:  # noqa: ANN401
+        """Return the value for a key (marking it as recently used), or None if it is not held."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def put(self, key: Hashable, value: Any, tag: str = "") -> None:  # noqa: ANN401
+        """Hold a value, evicting the least recently used entries to stay within budget.
+
+        A value bigger than the whole budget is not held.
+        """
+        size = estimate_bytes(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = _Entry(value, size, tag)
+            self.nbytes += size
+            self._evict()
+
+    def invalidate(self, tag: str) -> None:
+        """Drop every entry with this catalogue tag."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.tag == tag]:
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the budget, evicting entries if the store is now over it."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def __len__(self) -> int:
+        """Return the number of entries held."""
+        return len(self._entries)
+
+    def _discard(self, key: Hashable) -> None:
+        """Drop an entry, if it is held (the lock must be held)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.size
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until within budget (the lock must be held)."""
+        while self.nbytes > self.max_bytes and self._entries:
+            _key, entry = self._entries.popitem(last=False)
+            self.nbytes -= entry.size
+
+
+_store = _MemoStore(parse_bytes(os.environ.get(LIMIT_ENV, DEFAULT_LIMIT)))
+
+
+def _copy_on_write() -> bool:
+    """Check whether pandas copy-on-write is in force for this call.
+
+    It is always on from pandas 3. Before that, the option can be changed
+    at any time, so it is read when needed; its "warn" mode only warns, and
+    does not copy on write.
+    """
+    return PANDAS_3 or getattr(pd.options.mode, "copy_on_write", False) is True
+
+
+def _plain_key(named: dict[str, Any], kwargs: dict[str, Any]) -> Hashable:
+    """Return a key of all the arguments, bar those that do not affect the result."""
+    merged = {**named, **kwargs}
+    return tuple(sorted((name, value) for name, value in merged.items() if name not in NON_RESULT_ARGS))
+
+
+# --- public
+def isolated(value: R) -> R:
+    """Return a copy-on-write view of a cached value, so that changes to it do not reach the cache.
+
+    DataFrames and Series are copied shallowly (deeply, without pandas
+    copy-on-write); dicts, lists and tuples are rebuilt around views of
+    their items. Anything else is returned as is.
+    """
+    if isinstance(value, DataFrame | Series):
+        return cast("R", value.copy(deep=not _copy_on_write()))
+    if isinstance(value, dict):
+        return cast("R", {name: isolated(item) for name, item in value.items()})
+    if isinstance(value, list | tuple):
+        return cast("R", type(value)(isolated(item) for item in value))
+    return value
+
+
+def estimate_bytes(value: Any) -> int:  # noqa: ANN401
+    """Return an estimate of the memory held by a cached value.
+
+    DataFrames and Series are measured with their Python objects; dicts,
+    lists and tuples are measured through their items. Memory shared between
+    items (eg. a date-window slice of a cached table) is counted twice.
+    """
+    if isinstance(value, DataFrame):
+        return frame_bytes(value)
+    if isinstance(value, Series | Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def memoised(
+    namespace: str,
+    tag_arg: str = "",
+    key: KeyFunction = _plain_key,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Return a decorator that memoises a function in the shared, byte-bounded store.
+
+    The arguments are bound to the function's signature (with defaults
+    applied), so a positional and a keyword call share a key. The key is
+    built by the key function, from the named arguments and the **kwargs;
+    by default, all but the NON_RESULT_ARGS are used. If the key cannot be
+    built (invalid or unhashable arguments), the function is called without
+    memoisation. Each caller gets its own copy-on-write view of the cached
+    value (see isolated).
+
+    Args:
+        namespace: A name that keeps this function's keys apart from the others
+        tag_arg: The name of the argument that holds the ABS catalogue number, if any
+        key: Builds a hashable key from the named arguments and the **kwargs
+
+    Returns:
+        Callable: The decorator
+
+    """
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        function_signature = signature(function)
+        var_keyword = next(
+            (name for name, p in function_signature.parameters.items() if p.kind is Parameter.VAR_KEYWORD), ""
+        )
+
+        @wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                bound = function_signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                named = dict(bound.arguments)
+                extra = named.pop(var_keyword, {}) if var_keyword else {}
+                full_key = (namespace, key(named, extra))
+                hash(full_key)
+            except (TypeError, ValueError):
+                return function(*args, **kwargs)  # let the function report the problem
+
+            cached = _store.get(full_key)
+            if cached is not None:
+                return isolated(cached)
+            result = function(*args, **kwargs)
+            _store.put(full_key, result, tag=str(named.get(tag_arg, "")).strip())
+            return isolated(result)
+
+        return wrapper
+
+    return decorate
+
+
+def memo_get(key: Hashable) -> Any:  # noqa: ANN401
+    """Return a copy-on-write view of a value in the shared store, or None if it is not held."""
+    cached = _store.get(key)
+    return None if cached is None else isolated(cached)
+
+
+def memo_put(key: Hashable, value: Any, tag: str = "") -> None:  # noqa: ANN401
+    """Hold a value in the shared store, tagged with an ABS catalogue number (if any)."""
+    _store.put(key, value, tag=tag.strip())
+
+
+def clear_caches(cat: str | None = None) -> None:
+    """Drop the results that readabs holds in memory.
+
+    Downloaded files in the file-system cache are not affected.
+
+    Parameters
+    ----------
+    cat : str | None = None
+        If given, only the results for this ABS catalogue number are
+        dropped (for example, after the ABS publishes a new release).
+        Otherwise everything is dropped, including the ABS and RBA
+        catalogue maps.
+
+    Example
+    -------
+    ```python
+    import readabs as ra
+    ra.clear_caches("6202.0")  # re-read the Labour Force data on the next call
+    ```
+
+    """
+    if cat is None:
+        _store.clear()
+    else:
+        _store.invalidate(cat.strip())
+
+
+def set_cache_limit(size: int | str) -> None:
+    """Set the memory budget for the results that readabs holds in memory.
+
+    Parameters
+    ----------
+    size : int | str
+        A number of bytes, or a string such as "512MB" or "2GB". If the
+        results already held exceed the new budget, the least recently
+        used are dropped.
+
+    """
+    _store.resize(parse_bytes(size))
@@ -0,0 +1,294 @@
+"""meta_index.py - an index over ABS metadata, for fast repeated searches.
+
+search_abs_meta() and find_abs_id() filter the metadata one search term at
+a time. Done directly on the DataFrame, each term is a scan of every row of
+its column. A MetaIndex is built once for a metadata DataFrame, and answers
+the same searches from per-column structures that are built on first use:
+
+- the distinct values of the column, with a code for each row, so that a
+  term is tested against each distinct value once (ABS metadata repeats
+  the same units, series types, tables and descriptions many times);
+- a dictionary from each distinct value to its code, for exact matches;
+- an inverted index from each (lower-cased) word to the distinct values
+  that contain it, which narrows a plain substring search to the values
+  that hold the whole words inside the search phrase (built when a column
+  is searched a second time, so a one-off search is not slowed by it);
+- a cache of the compiled regular expressions, and of the row masks for
+  the terms already searched, so a repeated term costs a dictionary lookup;
+- for fuzzy searches, a trigram index over the distinct values: each word
+  is lower-cased and padded (as PostgreSQL's pg_trgm does), and each
+  trigram maps to the values that hold it, so a phrase is scored against
+  every value from the postings of its own trigrams, without a scan.
+
+The matching rules are those of search_abs_meta(): case-sensitive, with an
+exact match (==) for exact_match or the Table column, and a substring (or
+regular expression) search otherwise. Missing values never match. Fuzzy
+scores are case-insensitive, ignore punctuation, and are 0 for a missing value.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from readabs.abs_meta_data import metacol as mc
+
+# --- constants
+MASK_CACHE_SIZE = 4096  # row masks kept per index (10k rows -> 10 KB each)
+WORD = re.compile(r"\w+")
+FUZZY_WORD = re.compile(r"[^\W_]+")  # the words that fuzzy scores compare (no punctuation)
+FUZZY_COLUMNS = (mc.did, mc.tdesc)  # the columns that fuzzy searches score
+
+
+# --- private
+@lru_cache(maxsize=1024)
+def _compiled(pattern: str) -> re.Pattern[str]:
+    """Return a compiled regular expression, compiling each pattern once."""
+    return re.compile(pattern)
+
+
+def _word_trigrams(word: str) -> list[str]:
+    """Return the trigrams of a lower-case word, padded with two spaces before and one after."""
+    padded = f"  {word} "
+    return [padded[i : i + 3] for i in range(len(word) + 1)]
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return the trigrams of the lower-cased words in the text."""
+    return {gram for word in FUZZY_WORD.findall(text.lower()) for gram in _word_trigrams(word)}
+
+
+@dataclass(slots=True, frozen=True)
+class _TrigramIndex:
+    """The trigrams of the distinct values of a column, as postings lists in one array."""
+
+    ids: dict[str, int]  # trigram -> its postings list
+    offsets: np.ndarray  # the postings for trigram i are postings[offsets[i] : offsets[i + 1]]
+    postings: np.ndarray  # the codes of the values that hold each trigram
+    sizes: np.ndarray  # the number of distinct trigrams in each value (with a slot for missing values)
+
+    @classmethod
+    def build(cls, text: list[str | None]) -> "_TrigramIndex":
+        """Index the trigrams of the distinct values.
+
+        Descriptions share most of their words, so the trigrams are found
+        once for each distinct word, and the (trigram, value) pairs are then
+        expanded, de-duplicated and sorted by trigram with numpy.
+        """
+        n_values = len(text)
+        words = [FUZZY_WORD.findall(value.lower()) if value is not None else [] for value in text]
+        n_words = np.fromiter(map(len, words), dtype=np.intp, count=n_values)
+        word_codes, vocabulary = pd.factorize(
+            np.fromiter(chain.from_iterable(words), dtype=object, count=n_words.sum())
+        )
+        word_grams = [_word_trigrams(word) for word in vocabulary]
+        n_grams = np.fromiter(map(len, word_grams), dtype=np.intp, count=len(word_grams))
+        gram_codes, grams = pd.factorize(
+            np.fromiter(chain.from_iterable(word_grams), dtype=object, count=n_grams.sum())
+        )
+        word_starts = np.cumsum(n_grams) - n_grams
+
+        # expand each word in each value to its trigrams, as (trigram, value) pairs
+        lengths = n_grams[word_codes]
+        within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        pair_grams = gram_codes[np.repeat(word_starts[word_codes], lengths) + within].astype(np.int64)
+        pair_values = np.repeat(np.repeat(np.arange(n_values), n_words), lengths)
+        pairs = np.sort(pair_grams * (n_values + 1) + pair_values)  # by trigram, then value
+        pairs = pairs[np.diff(pairs, prepend=-1) != 0]  # a trigram held more than once by a value counts once
+        pair_grams, pair_values = np.divmod(pairs, n_values + 1)
+
+        offsets = np.zeros(len(grams) + 1, dtype=np.intp)
+        offsets[1:] = np.cumsum(np.bincount(pair_grams, minlength=len(grams)))
+        return cls(
+            ids=dict(zip(grams.tolist(), range(len(grams)), strict=True)),
+            offsets=offsets,
+            postings=pair_values.astype(np.int32),
+            sizes=np.bincount(pair_values, minlength=n_values + 1),
+        )
+
+    def scores(self, phrase: str) -> np.ndarray:
+        """Return the similarity of the phrase to each distinct value (and 0 for missing values).
+
+        The score is the mean of two shares of the trigrams in common: of
+        the phrase's trigrams (how much of the phrase the value covers), and
+        of the two sets together (the Dice coefficient, which favours values
+        of about the phrase's length). It is 1 for the same words.
+        """
+        query = _trigrams(phrase)
+        hits = [
+            self.postings[self.offsets[gram_id] : self.offsets[gram_id + 1]]
+            for gram in query
+            if (gram_id := self.ids.get(gram)) is not None
+        ]
+        if not hits:
+            return np.zeros(len(self.sizes), dtype=np.float32)
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.sizes))
+        return ((shared / len(query) + 2 * shared / (len(query) + self.sizes)) / 2).astype(np.float32)
+
+
+class _ColumnIndex:
+    """The distinct values of one metadata column, and the word index over them."""
+
+    def __init__(self, values: pd.Series) -> None:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        self.codes = np.where(codes < 0, len(uniques), codes)  # missing values point past the end
+        self.uniques: list[object] = np.asarray(uniques, dtype=object).tolist()
+        self._words: dict[str, np.ndarray] | None = None
+        self._scans = 0  # substring searches made without the word index
+
+    @cached_property
+    def text(self) -> list[str | None]:
+        """Return the distinct values, with None for any that are not strings."""
+        return [value if isinstance(value, str) else None for value in self.uniques]
+
+    @cached_property
+    def code_of(self) -> dict[object, int]:
+        """Return the code of each distinct value, for exact matches."""
+        return dict(zip(self.uniques, range(len(self.uniques)), strict=True))
+
+    @cached_property
+    def trigrams(self) -> _TrigramIndex:
+        """Return the trigram index over the distinct values, for fuzzy scores."""
+        return _TrigramIndex.build(self.text)
+
+    def words(self) -> dict[str, np.ndarray]:
+        """Return the inverted index, from each lower-cased word to the codes of the values that hold it."""
+        if self._words is None:
+            postings: dict[str, list[int]] = {}
+            for code, text in enumerate(self.text):
+                if text is None:
+                    continue
+                for word in {match.lower() for match in WORD.findall(text)}:
+                    postings.setdefault(word, []).append(code)
+            self._words = {word: np.asarray(codes, dtype=np.intp) for word, codes in postings.items()}
+        return self._words
+
+    def rows(self, matched: Iterable[int]) -> np.ndarray:
+        """Return the row mask for the distinct values with these codes."""
+        hit = np.zeros(len(self.uniques) + 1, dtype=bool)  # the extra slot is for missing values
+        hit[np.fromiter(matched, dtype=np.intp)] = True
+        return hit[self.codes]
+
+    def candidates(self, phrase: str) -> Iterable[int]:
+        """Return the codes of the values that could contain the phrase, using the words wholly inside it.
+
+        A word is wholly inside the phrase if there is a non-word character
+        (within the phrase) on both sides of it. Without such a word, every
+        value is a candidate. The word index is only built for a column
+        that is searched more than once, so a one-off search is a plain scan.
+        """
+        inner = {
+            match.group().lower()
+            for match in WORD.finditer(phrase)
+            if match.start() > 0 and match.end() < len(phrase)
+        }
+        if not inner or (self._words is None and self._scans < 1):
+            self._scans += 1
+            return range(len(self.uniques))
+        words = self.words()
+        found: np.ndarray | None = None
+        for word in inner:
+            codes = words.get(word)
+            if codes is None:
+                return ()
+            found = codes if found is None else np.intersect1d(found, codes, assume_unique=True)
+        return found.tolist() if found is not None else ()
+
+
+# --- public
+class MetaIndex:
+    """A reusable search index over a DataFrame of ABS metadata.
+
+    Build one for the metadata from read_abs_cat() or read_abs_meta(), and
+    pass it to search_abs_meta() or find_abs_id() in place of the DataFrame.
+    The per-column structures are built when a column is first searched.
+    The index assumes the DataFrame is not changed after it is built.
+
+    Example:
+        >>> meta_index = MetaIndex(meta)
+        >>> table, series_id, units = find_abs_id(meta_index, {"Unemployment rate ;  Persons ;": mc.did})
+
+    """
+
+    def __init__(self, meta: DataFrame) -> None:
+        """Index a metadata DataFrame (its columns are indexed lazily)."""
+        self.meta = meta
+        self._columns: dict[str, _ColumnIndex] = {}
+        self._masks: OrderedDict[tuple[str, str, str], np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of rows in the metadata."""
+        return len(self.meta)
+
+    def __repr__(self) -> str:
+        """Summarise the index."""
+        return f"MetaIndex({len(self)} rows, {len(self._columns)} columns indexed)"
+
+    def column(self, name: str) -> _ColumnIndex:
+        """Return the index for a column, building it on first use.
+
+        Raises:
+            KeyError: If the metadata has no such column
+
+        """
+        if name not in self._columns:
+            self._columns[name] = _ColumnIndex(self.meta[name])
+        return self._columns[name]
+
+    def mask(self, phrase: str, column: str, *, exact_match: bool = False, regex: bool = False) -> np.ndarray:
+        """Return the (read-only) boolean mask of the rows where the column matches the phrase.
+
+        The match is exact (==) with exact_match, or for the Table column;
+        otherwise it is a case-sensitive substring search, or a regular
+        expression search with regex.
+        """
+        mode = "exact" if (exact_match or column == mc.table) else "regex" if regex else "contains"
+        key = (column, phrase, mode)
+        cached = self._masks.get(key)
+        if cached is not None:
+            self._masks.move_to_end(key)
+            return cached
+
+        index = self.column(column)
+        if mode == "exact":
+            code = index.code_of.get(phrase)
+            matched: Iterable[int] = () if code is None else (code,)
+        elif mode == "regex":
+            search = _compiled(phrase).search
+            matched = [code for code, text in enumerate(index.text) if text is not None and search(text)]
+        else:
+            text_of = index.text
+            matched = [
+                code for code in index.candidates(phrase) if (text := text_of[code]) is not None and phrase in text
+            ]
+
+        rows = index.rows(matched)
+        rows.flags.writeable = False
+        self._masks[key] = rows
+        if len(self._masks) > MASK_CACHE_SIZE:
+            self._masks.popitem(last=False)
+        return rows
+
+    def scores(self, phrase: str, column: str) -> np.ndarray:
+        """Return the fuzzy similarity (0 to 1) of the phrase to the column in each row.
+
+        The first fuzzy search of a column builds its trigram index; later
+        searches are answered from it.
+        """
+        index = self.column(column)
+        return index.trigrams.scores(phrase)[index.codes]
+
+    def search(
+        self, search_terms: dict[str, str], *, exact_match: bool = False, regex: bool = False
+    ) -> np.ndarray:
+        """Return the positions of the rows that match all of the {phrase: column} search terms."""
+        selected = np.ones(len(self.meta), dtype=bool)
+        for phrase, column in search_terms.items():
+            selected &= self.mask(phrase, column, exact_match=exact_match, regex=regex)
+        return np.flatnonzero(selected)
@@ -0,0 +1,141 @@
+"""Convert readabs results into Arrow-backed pandas or Polars objects.
+
+The readers return pandas objects with NumPy-backed columns by default. With
+output="arrow" they return pandas objects with ArrowDtype columns, and with
+output="polars" they return Polars DataFrames. Both are built from Arrow
+arrays that wrap the parsed NumPy buffers, so conversion adds little more
+than a validity bitmap for the missing values.
+
+pyarrow (and polars, for output="polars") are optional dependencies.
+"""
+
+from collections import Counter
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+import pandas as pd
+from pandas import DataFrame, PeriodIndex, Series
+from pandas.api.types import is_float_dtype
+
+# --- constants
+OUTPUTS = ("pandas", "arrow", "polars")
+PERIOD_COLUMN = "period"  # the column that holds a PeriodIndex, as dates
+
+
+# --- private
+def _optional(module: str, output: str) -> ModuleType:
+    """Import an optional dependency, with a helpful message if it is missing."""
+    try:
+        return import_module(module)
+    except ImportError as e:
+        raise ImportError(f"output='{output}' needs the optional '{module}' package: pip install {module}") from e
+
+
+def _column_array(values: Series) -> Any:  # a pyarrow Array
+    """Return an Arrow array for a pandas column; NaN becomes null.
+
+    Columns of mixed Python objects (sometimes found in the metadata and in
+    non-time-series sheets) are stored as strings.
+    """
+    pa = _optional("pyarrow", "arrow")
+    try:
+        return pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(values.astype(str).where(values.notna()), from_pandas=True)
+
+
+def _to_table(frame: DataFrame) -> Any:  # a pyarrow Table
+    """Return an Arrow table for a DataFrame.
+
+    A PeriodIndex becomes a leading date32 column (the start of each period);
+    any other index is left behind. Column labels must be unique once they are
+    made strings, since Arrow (and Polars) columns are looked up by name.
+    """
+    pa = _optional("pyarrow", "arrow")
+    labels = [str(label) for label in frame.columns]
+    if isinstance(frame.index, PeriodIndex):
+        labels.append(PERIOD_COLUMN)
+    duplicated = sorted(label for label, count in Counter(labels).items() if count > 1)
+    if duplicated:
+        raise ValueError(f"Cannot convert to Arrow: duplicate column labels {duplicated}")
+
+    columns: dict[str, Any] = {}
+    if isinstance(frame.index, PeriodIndex):
+        columns[PERIOD_COLUMN] = pa.array(frame.index.start_time.to_numpy().astype("datetime64[D]"))
+
+    dtypes = frame.dtypes
+    if len(dtypes) and is_float_dtype(dtypes.iloc[0]) and (dtypes == dtypes.iloc[0]).all():
+        # fast path for the time series data: one float block, column-major, so each
+        # column is a contiguous slice that Arrow can wrap with a validity bitmap
+        matrix = frame.to_numpy()
+        for position, label in enumerate(frame.columns):
+            columns[str(label)] = pa.array(matrix[:, position], from_pandas=True)
+    else:
+        for position, label in enumerate(frame.columns):
+            columns[str(label)] = _column_array(frame.iloc[:, position])
+    return pa.table(columns)
+
+
+# --- public
+def check_output(output: str) -> None:
+    """Raise a ValueError if output is not a recognised output format."""
+    if output not in OUTPUTS:
+        raise ValueError(f"Unexpected output '{output}'. Valid options are: {list(OUTPUTS)}")
+
+
+def frame_to_output(frame: DataFrame, output: str) -> Any:  # DataFrame | polars.DataFrame
+    """Convert a DataFrame to the requested output format.
+
+    Args:
+        frame: A DataFrame of data (with a PeriodIndex), of long data, or of metadata
+        output: One of "pandas", "arrow" or "polars"
+
+    Returns:
+        DataFrame | polars.DataFrame: The DataFrame unchanged for "pandas"; a
+            pandas DataFrame with ArrowDtype columns (and a date32 index in
+            place of a PeriodIndex) for "arrow"; or a Polars DataFrame (with
+            a leading "period" date column in place of a PeriodIndex) for "polars".
+
+    """
+    check_output(output)
+    if output == "pandas":
+        return frame
+
+    table = _to_table(frame)
+    if output == "polars":
+        pl = _optional("polars", output)
+        return pl.from_arrow(table)
+
+    converted = table.to_pandas(types_mapper=pd.ArrowDtype)
+    if isinstance(frame.index, PeriodIndex):
+        converted = converted.set_index(PERIOD_COLUMN)
+    else:
+        converted.index = frame.index
+    converted.columns = pd.Index(frame.columns, name=frame.columns.name)
+    return converted
+
+
+def frames_to_output(frames: dict[str, DataFrame], output: str) -> dict[str, Any]:
+    """Convert each DataFrame in a dictionary to the requested output format."""
+    check_output(output)
+    if output == "pandas":
+        return frames
+    return {name: frame_to_output(frame, output) for name, frame in frames.items()}
+
+
+def series_to_output(series: Series, output: str) -> Any:  # Series | polars.DataFrame
+    """Convert a Series to the requested output format.
+
+    For "polars", the result is a two-column DataFrame of the period and the
+    series values, since Polars has no index.
+    """
+    check_output(output)
+    if output == "pandas":
+        return series
+    converted = frame_to_output(series.to_frame(), output)
+    if output == "polars":
+        return converted
+    result = converted.iloc[:, 0]
+    result.name = series.name
+    return result
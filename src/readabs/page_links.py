@@ -0,0 +1,51 @@
+"""page_links.py - extract the links from a web page, without building a document tree.
+
+The ABS landing pages and the RBA statistical tables pages are large, and
+readabs only wants their <a href> links (and, for the RBA, the link text).
+Building a full BeautifulSoup tree for that is slow. Here, lxml's HTML
+pull parser is fed the page in chunks and reports each <a> element as it
+closes; the element is then cleared, so the page is never held as a tree
+of Python objects.
+"""
+
+from collections.abc import Iterator
+from typing import cast
+
+from lxml import etree
+
+# --- constants
+CHUNK_SIZE = 1 << 16  # bytes fed to the parser at a time
+PAGE_ENCODING = "utf-8"  # the ABS and RBA pages are UTF-8
+
+
+# --- private
+def _drained(parser: etree.HTMLPullParser, *, with_text: bool) -> Iterator[tuple[str, str]]:
+    """Yield the (href, text) of the <a> elements the parser has closed so far, clearing each one."""
+    for _event, element in parser.read_events():
+        anchor = cast("etree._Element", element)  # noqa: SLF001 - lxml names its element type privately
+        href = anchor.get("href")
+        if href is not None:
+            yield str(href), "".join(map(str, anchor.itertext())) if with_text else ""
+        anchor.clear()
+
+
+# --- public
+def iter_links(page: bytes, *, with_text: bool = False) -> Iterator[tuple[str, str]]:
+    """Yield the (href, text) of each <a> element with an href, in page order.
+
+    Args:
+        page: The bytes of the HTML page
+        with_text: Also collect the text of each link (otherwise the text is "")
+
+    Yields:
+        The href attribute (as written on the page), and the link's text.
+
+    """
+    if not page:
+        return  # lxml reports an empty document as an error; it simply has no links
+    parser = etree.HTMLPullParser(events=("end",), tag="a", encoding=PAGE_ENCODING)
+    for start in range(0, len(page), CHUNK_SIZE):
+        parser.feed(page[start : start + CHUNK_SIZE])
+        yield from _drained(parser, with_text=with_text)
+    parser.close()
+    yield from _drained(parser, with_text=with_text)
@@ -0,0 +1,95 @@
+"""parsed_cache.py - keep the results of parsing downloaded pages, keyed by the page's content.
+
+Some downloads are web pages (the ABS time-series directory, the RBA
+statistical tables page) that are parsed into a small DataFrame or
+dictionary. The download cache keeps the page, but parsing it again in
+every new session costs far more than reading a pickle of the result. So
+the parsed result is saved next to the cached page, in a file named for a
+hash of the page's bytes. While the page is unchanged, a new session loads
+the result in milliseconds; when the page changes, its hash changes, so it
+is parsed afresh, and the file for the old page is removed.
+"""
+
+import pickle
+from collections.abc import Callable
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TypeVar, cast
+
+from readabs.download_cache import READABS_CACHE_PATH
+
+# --- constants
+PARSED_CACHE_PATH = READABS_CACHE_PATH
+PARSED_PREFIX = "parsed"
+T = TypeVar("T")
+
+
+# --- private
+def _parsed_path(name: str, content: bytes, version: int) -> Path:
+    """Return the file for the parsed result of this content (the version changes when the parser does)."""
+    digest = sha256(content).hexdigest()[:32]
+    return PARSED_CACHE_PATH / f"{PARSED_PREFIX}--{name}--v{version}--{digest}.pkl"
+
+
+def _load(path: Path) -> object | None:
+    """Return the pickled result in the file, or None if there is none (or it cannot be read)."""
+    try:
+        with path.open("rb") as file:
+            return pickle.load(file)  # noqa: S301 - our own cache file
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+        return None
+
+
+def _save(path: Path, name: str, result: object) -> None:
+    """Write the result to a temporary file, move it into place, and remove the files for older pages."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(dir=path.parent, prefix=f".{PARSED_PREFIX}-", delete=False) as file:
+        pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+    Path(file.name).replace(path)
+    for old in path.parent.glob(f"{PARSED_PREFIX}--{name}--*.pkl"):
+        if old != path:
+            with suppress(OSError):
+                old.unlink()
+
+
+# --- public
+def parsed(
+    name: str,
+    content: bytes,
+    parse: Callable[[bytes], T],
+    *,
+    version: int = 1,
+    verbose: bool = False,
+) -> T:
+    """Return parse(content), from the cache if the same content has been parsed before.
+
+    Args:
+        name: A name for what is parsed (eg. "abs-catalogue"), used in the file name
+        content: The bytes of the downloaded page
+        parse: The parser, called only when the content has not been parsed before
+        version: Bump this when the parser's output changes, so old results are not used
+        verbose: Report whether the parsed result was loaded or saved
+
+    Returns:
+        The parsed result.
+
+    """
+    path = _parsed_path(name, content, version)
+    result = _load(path)
+    if result is not None:
+        if verbose:
+            print(f"Loaded the parsed {name} from {path}")
+        return cast("T", result)
+
+    result = parse(content)
+    try:
+        _save(path, name, result)
+    except (OSError, pickle.PicklingError) as error:
+        if verbose:
+            print(f"parsed(): could not save the parsed {name}: {error}")
+    else:
+        if verbose:
+            print(f"Saved the parsed {name} to {path}")
+    return result
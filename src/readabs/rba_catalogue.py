@@ -1,19 +1,27 @@
 """Extract links to RBA data files from the RBA website."""
 
 import re
-from functools import cache
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from bs4 import BeautifulSoup, Tag
 from pandas import DataFrame
 
 from readabs.download_cache import CacheError, HttpError, get_file
+from readabs.memo import memoised
+from readabs.page_links import iter_links
+from readabs.parsed_cache import parsed
 
 # Constants
 EXPECTED_PAIR_LENGTH = 2
+RBA_PAGES = (  # (url, moniker prefix)
+    ("https://www.rba.gov.au/statistics/tables/", ""),  # current
+    ("https://www.rba.gov.au/statistics/historical-data.html", "Z:"),  # history
+)
+PARSE_VERSION = 1  # bump when the parsed catalogue changes shape, to retire the saved copies
 
 
-@cache
+@memoised("rba_catalogue")
 def rba_catalogue(*, cache_only: bool = False, verbose: bool = False) -> DataFrame:
     """Return a DataFrame of RBA Catalogue numbers.
 
@@ -74,8 +82,8 @@ def print_rba_catalogue(*, cache_only: bool = False, verbose: bool = False) -> N
     print(rba_catalog.loc[:, rba_catalog.columns != "URL"].to_markdown())
 
 
-def _get_soup(url: str, **kwargs: Any) -> BeautifulSoup | None:  # cache args
-    """Return a BeautifulSoup object from a URL.
+def _get_page(url: str, **kwargs: Any) -> bytes | None:  # cache args
+    """Return the page at a URL, tidied for link extraction.
 
     Returns None on error.
     """
@@ -88,9 +96,7 @@ def _get_soup(url: str, **kwargs: Any) -> BeautifulSoup | None:  # cache args
     # remove those pesky span tags - possibly not necessary
     page = re.sub(b"<span[^>]*>", b" ", page)
     page = re.sub(b"</span>", b" ", page)
-    page = re.sub(b"\\s+", b" ", page)  # tidy up white space
-
-    return BeautifulSoup(page, "html.parser")
+    return re.sub(b"\\s+", b" ", page)  # tidy up white space
 
 
 def _historical_name_fix(
@@ -118,10 +124,10 @@ def _historical_name_fix(
 
 
 def _excel_link_capture(
-    soup: BeautifulSoup,
+    links: Iterable[tuple[str, str]],
     prefix: str,
 ) -> dict[str, dict[str, str]]:
-    """Capture all links (of Microsoft Excel types) from the BeautifulSoup object.
+    """Capture all links (of Microsoft Excel types) from the (href, text) pairs of a page.
 
     Returns a dictionary with the following structure:
     {moniker: {"Description": text, "URL": url}}.
@@ -131,13 +137,7 @@ def _excel_link_capture(
     historic_exclusions = ("E4", "E5", "E6", "E7", "J1", "J2")
 
     link_dict = {}
-    for link in soup.find_all("a"):
-        # Ensure we have a Tag object with href attribute
-        if not isinstance(link, Tag):
-            continue
-        href = link.get("href")
-        if not href or not isinstance(href, str):
-            continue
+    for href, link_text in links:
         url = href.strip()
         if not url:
             continue
@@ -147,7 +147,7 @@ def _excel_link_capture(
             continue
         if not tail.endswith(".xls") and not tail.endswith(".xlsx"):
             continue
-        text, url = link.text, _make_absolute_url(url.strip())
+        text, url = link_text, _make_absolute_url(url.strip())
         text = text.replace("\u2013", "-").strip()  # Replace EN DASH with HYPHEN
 
         pair = text.rsplit(" - ", 1)
@@ -176,30 +176,47 @@ def _excel_link_capture(
     return link_dict
 
 
-@cache
+@memoised("_get_rba_links")
 def _get_rba_links(**kwargs: Any) -> DataFrame:  # cache args
     """Extract links to RBA data files in Excel format from the RBA website.
 
+    The current tables page and the historical data page are fetched
+    concurrently. The catalogue parsed from them is kept on disk, keyed by
+    the pages' contents, so it is only parsed again when a page changes.
+    Both pages are still fetched (through get_file(), and so subject to its
+    own caching) before that key can be computed: only the parse is skipped.
+
     Returns a DataFrame with the following columns: 'Description' and 'URL'.
     The index is the 'Table' number. Returns an empty DataFrame on error.
     """
-    urls = [
-        ("https://www.rba.gov.au/statistics/tables/", ""),  # current
-        ("https://www.rba.gov.au/statistics/historical-data.html", "Z:"),  # history
-    ]
+    with ThreadPoolExecutor(max_workers=len(RBA_PAGES), thread_name_prefix="rba_catalogue") as pool:
+        pages = list(pool.map(lambda url: _get_page(url, **kwargs), [url for url, _prefix in RBA_PAGES]))
+
+    if any(page is None for page in pages):
+        return _parse_pages(pages)  # a partial catalogue is not kept
+    content = b"\0".join(page for page in pages if page is not None)  # both pages, as one key
+    return parsed(
+        "rba-catalogue", content, _parse_joined, version=PARSE_VERSION, verbose=kwargs.get("verbose", False)
+    )
 
-    link_dict = {}
-    for url, prefix in urls:
-        soup = _get_soup(url, **kwargs)
-        if soup is not None:
-            link_dict.update(_excel_link_capture(soup, prefix))
 
+# private
+def _parse_pages(pages: list[bytes | None]) -> DataFrame:
+    """Parse the RBA catalogue from the pages in RBA_PAGES (None for a page that could not be fetched)."""
+    link_dict = {}
+    for page, (_url, prefix) in zip(pages, RBA_PAGES, strict=True):
+        if page is not None:
+            link_dict.update(_excel_link_capture(iter_links(page, with_text=True), prefix))
     rba_catalog = DataFrame(link_dict).T.sort_index()
     rba_catalog.index.name = "Table"
     return rba_catalog
 
 
-# private
+def _parse_joined(content: bytes) -> DataFrame:
+    """Parse the RBA catalogue from the pages in RBA_PAGES, joined by NUL bytes (which HTML does not hold)."""
+    return _parse_pages(list(content.split(b"\0")))
+
+
 def _make_absolute_url(url: str, prefix: str = "https://www.rba.gov.au") -> str:
     """Convert a relative URL address found on the RBA site to an absolute URL.
 
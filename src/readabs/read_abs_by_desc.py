@@ -5,15 +5,22 @@ by their descriptions rather than series IDs.
 """
 
 import inspect
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 # Analytic imports
 import pandas as pd
 
 # local imports
 from readabs.abs_meta_data import metacol as mc
+from readabs.meta_index import MetaIndex
+from readabs.output_format import check_output, frame_to_output, series_to_output
 from readabs.read_abs_cat import read_abs_cat
-from readabs.search_abs_meta import find_abs_id
+from readabs.read_abs_cats import read_abs_cats
+from readabs.search_abs_meta import find_abs_id, find_abs_ids
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 # --- private functions
@@ -69,81 +76,151 @@ def _get_retrieval_args(input_dict: dict[str, Any], output_dict: dict[str, Any])
         "cache_only",
         "single_excel_only",
         "selected_excel",
+        "tables",
         "single_zip_only",
         "verbose",
     ]
     return _get_args(keys, input_dict, output_dict)
 
 
-def _get_item_from_str(
-    item: str,
-    data_dict: dict[str, pd.DataFrame],
-    data_meta: pd.DataFrame,
-    item_selector: dict[str, str],
+@dataclass(slots=True)
+class _Item:
+    """One wanted series: its search terms, and where to search for it."""
+
+    key: str
+    selector: dict[str, str]  # {search_phrase: meta_column_name, ...}
+    search_args: dict[str, Any]  # for find_abs_id()
+    cat: str = ""  # the catalogue to read, or "" to search the abs_dict/abs_meta given
+    group: int = -1  # which set of retrieval arguments to read the catalogue with
+    found: tuple[str, str, str] | None = None  # (table, series_id, units), once resolved
+
+
+def _plan_item(
+    key: str,
+    value: str | dict[str, Any],
+    selector: dict[str, str],
     search_args: dict[str, Any],
-) -> tuple[pd.Series, pd.DataFrame]:
-    """Get a data series from the data dictionary and metadata.
+    *,
+    have_data: bool,
+) -> tuple[_Item, dict[str, Any] | None]:
+    """Build the search for one wanted item; also return its retrieval arguments, if it needs a read.
 
-    Give the series its series-id as a name.
+    The wanted dictionaries are not changed.
     """
-    if not data_dict or data_meta.empty:
+    if isinstance(value, str):
+        if not have_data:
+            raise ValueError(
+                "If the wanted data is a string, a populated abs_dict " + "and abs_meta must be provided."
+            )
+        selector[value] = mc.did  # back_to_front
+        return _Item(key, selector, search_args), None
+
+    if not isinstance(value, dict):
+        raise TypeError("Each value in the wanted list/dictionary must be either a string " + "or a dictionary.")
+    if "did" not in value:
+        raise ValueError("Each inner dictionary must contain a 'did' key.")
+    item_dict = {name: term for name, term in value.items() if name != "did"}
+    selector = _get_search_terms(item_dict, selector)
+    search_args = _get_search_args(item_dict, search_args)
+    selector[value["did"]] = mc.did  # back_to_front
+    if have_data:
+        return _Item(key, selector, search_args), None
+    if "cat" not in item_dict:
         raise ValueError(
-            "If the wanted data is a string, a populated abs_dict " + "and abs_meta must be provided."
+            "Each inner dictionary must contain a 'cat' key, "
+            "if an abs_dict is not provided/empty or the "
+            "abs_meta is not provided/empty."
         )
-    item_selector[item] = mc.did  # back_to_front
-    table, series_id, units = find_abs_id(data_meta, item_selector, **search_args)
+    return _Item(key, selector, search_args, cat=str(item_dict["cat"]).strip()), item_dict
 
-    series = data_dict[table][series_id]
-    series.name = series_id
-    series_meta = data_meta.loc[
-        (data_meta[mc.table] == table) & (data_meta[mc.id] == series_id) & (data_meta[mc.unit] == units)
-    ]
-    return series, series_meta
 
+def _read_catalogues(
+    items: list[_Item], retrievals: list[dict[str, Any]]
+) -> dict[tuple[str, int], tuple[dict[str, pd.DataFrame], pd.DataFrame]]:
+    """Read each catalogue once for each distinct set of retrieval arguments, the catalogues concurrently.
 
-def _get_item_from_dict(
-    item_dict: dict[str, Any],
-    data_dict: dict[str, pd.DataFrame],
-    data_meta: pd.DataFrame,
-    item_selector: dict[str, str],
-    search_args: dict[str, Any],
-    **kwargs: Any,
-) -> tuple[pd.Series, pd.DataFrame]:
-    # preparation
-    if "did" not in item_dict:
-        raise ValueError("Each inner dictionary must contain a 'did' key.")
-    item = item_dict.pop("did")
-    item_selector = _get_search_terms(item_dict, item_selector)
-    item_search_args = _get_search_args(item_dict, search_args)
+    Args:
+        items: The wanted items that need a catalogue read; their group is set here
+        retrievals: The retrieval arguments for each of those items, in the same order
 
-    if not data_dict or data_meta.empty:
-        # data retrieval reqquired
-        if "cat" not in item_dict:
-            raise ValueError(
-                "Each inner dictionary must contain a 'cat' key, "
-                "if an abs_dict is not provided/empty or the "
-                "abs_meta is not provided/empty."
-            )
-        ret_args = _get_retrieval_args(kwargs, {})
-        ret_args = _get_retrieval_args(item_dict, ret_args)
-        data_dict, data_meta = read_abs_cat(cat=item_dict["cat"], **ret_args)
-
-    # series extraction based on search terms
-    series, series_meta = _get_item_from_str(
-        item=item,
-        data_dict=data_dict,
-        data_meta=data_meta,
-        item_selector=item_selector,
-        search_args=item_search_args,
-    )
-    return series, series_meta
+    Returns:
+        The (data, meta) for each (catalogue, group) read.
+
+    """
+    groups: list[tuple[dict[str, Any], list[str]]] = []  # (retrieval arguments, catalogues)
+    for item, args in zip(items, retrievals, strict=True):
+        item.group = next((number for number, (known, _) in enumerate(groups) if known == args), len(groups))
+        if item.group == len(groups):
+            groups.append((args, []))
+        groups[item.group][1].append(item.cat)
+
+    sources = {}
+    for number, (args, cats) in enumerate(groups):
+        try:
+            found = read_abs_cats(cats, **args)
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from None  # the first catalogue, in wanted order, that could not be read
+        for cat in dict.fromkeys(cats):
+            # a catalogue dropped with ignore_errors is read again, to raise its error as read_abs_cat() does
+            sources[cat, number] = found[cat] if cat in found else read_abs_cat(cat, **args)
+    return sources
+
+
+def _resolve(items: list[_Item], meta: pd.DataFrame) -> None:
+    """Find the series for each of the items searched in the same metadata, with batched searches.
+
+    The metadata is indexed once, and the items that share the same search
+    arguments are resolved together with find_abs_ids(). Items that are
+    verbose, or cannot be resolved, are left for find_abs_id(), to print or
+    raise as it does.
+    """
+    index = MetaIndex(meta)
+    batches: dict[tuple[bool, bool, bool], list[_Item]] = {}
+    for item in items:
+        if not item.search_args.get("verbose", False):
+            flags = tuple(item.search_args.get(flag, False) for flag in ("exact_match", "regex"))
+            unique = item.search_args.get("validate_unique", True)
+            batches.setdefault((*flags, unique), []).append(item)
+    for (exact_match, regex, validate_unique), batch in batches.items():
+        found, _errors = find_abs_ids(
+            index,
+            [item.selector for item in batch],
+            exact_match=exact_match,
+            regex=regex,
+            validate_unique=validate_unique,
+        )
+        for item, resolved in zip(batch, found, strict=True):
+            item.found = resolved
+    for item in items:
+        if item.found is None:
+            item.found = find_abs_id(index, item.selector, **item.search_args)
 
 
 # --- public functions
+@overload
 def read_abs_by_desc(
     wanted: list[str] | dict[str, str] | dict[str, dict[str, Any]],
+    *,
+    output: Literal["pandas", "arrow"] = "pandas",
     **kwargs: Any,
-) -> tuple[dict[str, pd.Series], pd.DataFrame]:
+) -> tuple[dict[str, pd.Series], pd.DataFrame]: ...
+
+
+@overload
+def read_abs_by_desc(
+    wanted: list[str] | dict[str, str] | dict[str, dict[str, Any]],
+    *,
+    output: Literal["polars"],
+    **kwargs: Any,
+) -> tuple[dict[str, "pl.DataFrame"], "pl.DataFrame"]: ...
+
+
+def read_abs_by_desc(
+    wanted: list[str] | dict[str, str] | dict[str, dict[str, Any]],
+    *,
+    output: str = "pandas",
+    **kwargs: Any,
+) -> tuple[dict[str, Any], Any]:
     """Get specific ABS data series by searching the ABS meta data.
 
     Parameters
@@ -155,6 +232,11 @@ def read_abs_by_desc(
         The dictionary values can be either a string (the data item
         description to search for) or a dictionary of keyword arguments, one of
         which would be the data item description to search for.
+    output : str = "pandas"
+        One of "pandas", "arrow" or "polars". See read_abs_cat(). With
+        "arrow", each Series has pyarrow-backed values and a date32 index.
+        With "polars", each series is returned as a two-column Polars
+        DataFrame of the period and its values.
     **kwargs : Any
         Keyword arguments to control the data retrieval.
         The keyword arguments can include the following:
@@ -167,7 +249,8 @@ def read_abs_by_desc(
             passed to read_abs_cat()): ["ignore_errors", "get_zip",
             "get_excel_if_no_zip", "get_excel", "cache_only",
             "single_excel_only", "selected_excel", "single_zip_only",
-            "verbose"].
+            "verbose"]. The "dtype" argument of read_abs_cat() is not
+            taken: here "dtype" selects on the data type column.
         - for the selection of data, the following metacol names, if present,
             will be used to construct the selector: "cat", "did"
             "stype", "id", "start", "end", "num", "unit", "dtype", "freq",
@@ -197,6 +280,11 @@ def read_abs_by_desc(
         namely ["ignore_errors", "get_zip", "get_excel_if_no_zip",
         "get_excel", "single_excel_only", "selected_excel",
         "single_zip_only", "cache_only"].
+    - each catalogue is read once for each distinct set of retrieval
+        arguments, with the catalogues read concurrently (see
+        read_abs_cats()), and all of the items searched in the same
+        metadata are resolved together (see find_abs_ids()). The wanted
+        dictionaries are not changed.
 
 
     Returns
@@ -222,47 +310,58 @@ def read_abs_by_desc(
 
     """
     # - preparation
+    check_output(output)
     if not _work_to_do(wanted):
-        return {}, pd.DataFrame()
+        return {}, frame_to_output(pd.DataFrame(), output)
     if isinstance(wanted, list):
         wanted = _wlist_to_wdict(wanted)
     abs_dict = kwargs.get("abs_dict", {})
     abs_meta = kwargs.get("abs_meta", pd.DataFrame())
+    have_data = bool(abs_dict) and not abs_meta.empty
     kwarg_selector = _get_search_terms(kwargs, {})
     search_args = _get_search_args(kwargs, {})
+    kwarg_retrieval = _get_retrieval_args(kwargs, {})
 
-    return_dict = {}
-    return_meta = pd.DataFrame()
+    # - plan: the search terms for each item, and the catalogues to read
+    items: list[_Item] = []
+    to_read: list[_Item] = []
+    retrievals: list[dict[str, Any]] = []
     for key, value in wanted.items():
-        item_selector = kwarg_selector.copy()
-        item_search_args = search_args.copy()
-        if isinstance(value, str):
-            series, meta = _get_item_from_str(
-                item=value,
-                data_dict=abs_dict,
-                data_meta=abs_meta,
-                item_selector=item_selector,
-                search_args=item_search_args,
-            )
-
-        elif isinstance(value, dict):
-            series, meta = _get_item_from_dict(
-                item_dict=value,
-                data_dict=abs_dict,
-                data_meta=abs_meta,
-                item_selector=item_selector,
-                search_args=item_search_args,
-                **kwargs,
-            )
-        else:
-            raise TypeError(
-                "Each value in the wanted list/dictionary must be either a string " + "or a dictionary."
-            )
-
-        # save search results
-        return_dict[key] = series
-        return_meta = pd.concat([return_meta, meta])
-
+        item, item_dict = _plan_item(key, value, kwarg_selector.copy(), search_args.copy(), have_data=have_data)
+        items.append(item)
+        if item_dict is not None:
+            to_read.append(item)
+            retrievals.append(_get_retrieval_args(item_dict, kwarg_retrieval.copy()))
+
+    # - read each catalogue once, then search each source's metadata once for all of its items
+    sources = _read_catalogues(to_read, retrievals)
+    sources[("", -1)] = (abs_dict, abs_meta)
+    by_source: dict[tuple[str, int], list[_Item]] = {}
+    for item in items:
+        by_source.setdefault((item.cat, item.group), []).append(item)
+    for source, source_items in by_source.items():
+        _resolve(source_items, sources[source][1])
+
+    # - assemble the series, and the metadata with a single concat
+    rows_of: dict[tuple[str, int], dict[Any, Any]] = {}  # source -> {(table, id, unit): row positions}
+    return_dict = {}
+    meta_parts = []
+    for item in items:
+        source = (item.cat, item.group)
+        data_dict, data_meta = sources[source]
+        table, series_id, units = cast("tuple[str, str, str]", item.found)
+        series = data_dict[table][series_id]
+        series.name = series_id
+        return_dict[item.key] = series
+        if source not in rows_of:
+            keys = data_meta[[mc.table, mc.id, mc.unit]].reset_index(drop=True)
+            rows_of[source] = keys.groupby(list(keys.columns), sort=False, dropna=False).indices
+        meta_parts.append(data_meta.iloc[rows_of[source].get((table, series_id, units), [])])
+    return_meta = pd.concat(meta_parts) if meta_parts else pd.DataFrame()
+
+    if output != "pandas":
+        converted = {key: series_to_output(series, output) for key, series in return_dict.items()}
+        return converted, frame_to_output(return_meta, output)
     return return_dict, return_meta
 
 
@@ -5,31 +5,134 @@ for a specified ABS catalogue identifier.
 """
 
 import calendar
-from functools import cache
+from collections.abc import Iterator, Mapping
 from pathlib import Path
-from typing import Any, Unpack
+from typing import TYPE_CHECKING, Any, Literal, Unpack, cast, overload
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import Categorical, DataFrame
+from pandas.api.types import union_categoricals
 
 from readabs.abs_meta_data import metacol
-from readabs.grab_abs_url import grab_abs_url, grab_abs_zip
-from readabs.read_support import HYPHEN, ReadArgs
+from readabs.grab_abs_url import INDEX_SHEET, iter_abs_url, iter_abs_zip
+from readabs.memo import isolated, memo_get, memo_put, memoised
+from readabs.output_format import check_output, frame_to_output, frames_to_output
+from readabs.read_support import (
+    HYPHEN,
+    NO_WINDOW,
+    DateLike,
+    ReadArgs,
+    Window,
+    date_window,
+    period_mask,
+    result_key,
+    to_float_dtype,
+    window_ordinals,
+)
+from readabs.series_directory import update_directory
+from readabs.spill import SpilledFrames
+
+if TYPE_CHECKING:
+    import polars as pl
 
 # Constants
 MAX_DATETIME_CHARS = 20
 TABLE_DESC_ROW = 4
 TABLE_DESC_COL = 1
+LAYOUTS = ("wide", "long")
+PARTIAL_READ_ARGS = ("single_excel_only", "selected_excel", "tables", "single_zip_only")  # read some tables only
+
+# column names for the long layout
+LONG_ID = "series_id"
+LONG_PERIOD = "period"
+LONG_VALUE = "value"
+LONG_FREQ = "freq"
 
 
 # --- functions ---
 # - public -
-@cache  # minimise slowness for any repeat business
+@overload
 def read_abs_cat(
     cat: str,
     url: str = "",
+    *,
+    layout: Literal["wide"] = "wide",
+    output: Literal["pandas", "arrow"] = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    memory_limit: None = None,
     **kwargs: Unpack[ReadArgs],
-) -> tuple[dict[str, DataFrame], DataFrame]:
+) -> tuple[dict[str, DataFrame], DataFrame]: ...
+
+
+@overload
+def read_abs_cat(
+    cat: str,
+    url: str = "",
+    *,
+    layout: Literal["long"],
+    output: Literal["pandas", "arrow"] = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    memory_limit: None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple[DataFrame, DataFrame]: ...
+
+
+@overload
+def read_abs_cat(
+    cat: str,
+    url: str = "",
+    *,
+    layout: Literal["wide"] = "wide",
+    output: Literal["polars"],
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    memory_limit: None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple[dict[str, "pl.DataFrame"], "pl.DataFrame"]: ...
+
+
+@overload
+def read_abs_cat(
+    cat: str,
+    url: str = "",
+    *,
+    layout: Literal["long"],
+    output: Literal["polars"],
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    memory_limit: None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple["pl.DataFrame", "pl.DataFrame"]: ...
+
+
+@overload
+def read_abs_cat(
+    cat: str,
+    url: str = "",
+    *,
+    layout: Literal["wide"] = "wide",
+    output: str = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    memory_limit: int | str,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple[Mapping[str, Any], Any]: ...
+
+
+def read_abs_cat(
+    cat: str,
+    url: str = "",
+    *,
+    layout: str = "wide",
+    output: str = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    memory_limit: int | str | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple[Any, Any]:
     """For a specific catalogue identifier, return the complete ABS Catalogue information as DataFrames.
 
     This function returns the complete ABS Catalogue information as a
@@ -119,6 +222,15 @@ def read_abs_cat(
         `get_zip`, `get_excel_if_no_zip`, `get_excel` and `single_zip_only`
         when at least one matching file is found.
 
+    tables : tuple[str, ...] = ()
+        If set to a tuple of table names or regular expressions (each of
+        which must match the whole table name, without the .xlsx
+        extension), only the matching tables are read. Inside a zip file,
+        the other members are skipped by name, before they are decompressed
+        or parsed; individual Excel files that do not match are not
+        downloaded. Example: `tables=("62020001", r"6202001[0-9]")`.
+        A single string is treated as a one-item tuple.
+
     single_zip_only : str = ""
         If this argument is set to a zip file name (without
         the .zip extension), only that zip file will be downloaded.
@@ -138,13 +250,73 @@ def read_abs_cat(
         extension), this function will only extract data from that zip file
         on the local file system. This may be useful for debugging purposes.
 
+    dtype : str = "float64"
+        The float type used for the time series data. One of "float64",
+        "float32" or "auto". With "auto", each series is stored as float32
+        where that preserves every value to its published precision, and as
+        float64 otherwise. Compact types roughly halve the memory held by
+        the returned DataFrames.
+
+    layout : str = "wide"
+        Either "wide" (one DataFrame per table, one column per series) or
+        "long". The long layout is a single DataFrame for the whole
+        catalogue with the columns "series_id" (categorical), "period"
+        (the int32 ordinal of the pandas Period), "value" and "freq"
+        (categorical, the frequency string needed to turn an ordinal back
+        into a Period). Missing observations are dropped as each sheet is
+        parsed, so the NaN padding of the wide tables is never built. A
+        series that appears in more than one table is included once. Join
+        to the metadata on "series_id". Non-time-series tables are never
+        included in the long layout.
+
+    output : str = "pandas"
+        One of "pandas", "arrow" or "polars". With "arrow", the DataFrames
+        have pyarrow-backed (ArrowDtype) columns, and a PeriodIndex is
+        replaced by a date32 index of period start dates. With "polars",
+        Polars DataFrames are returned, with the periods in a leading
+        "period" date column. The metadata is converted in the same way.
+        Both need the optional pyarrow package (and polars for "polars").
+        The long layout keeps its integer period ordinals.
+
+    start : str | Period | date | None = None
+        The first period wanted (see end).
+
+    end : str | Period | date | None = None
+        The last period wanted. Only the periods that fall (at least in
+        part) between start and end, inclusive, are kept. A string is read
+        as a pandas Period, so start="2010" and end="2015-06" keep January
+        2010 through June 2015 (and, for quarterly data, 2010Q1 through
+        2015Q2). The full history is parsed (once per session, see
+        Returns) and the window is sliced from it, so reading several
+        windows of the same catalogue costs one parse. With memory_limit
+        (and in iter_abs_cat()), nothing is memoised, and rows outside the
+        window are dropped from each raw sheet before they are converted to
+        floats and merged. The metadata is not affected.
+
+    memory_limit : int | str | None = None
+        If set (to a number of bytes, or a string such as "2GB"), the
+        catalogue is read one workbook at a time, and the tables are
+        returned in a read-only mapping rather than a dictionary. Tables
+        stay in memory while they fit within the limit, less headroom for
+        parsing the next workbook (at least half of the limit, more for
+        large workbooks); the rest are spilled to a scratch directory
+        (memory-mapped .npy files) and loaded lazily when they are looked
+        up. Memory stays within the limit unless a single workbook is too
+        big for it. Only for the wide layout. These
+        results are not memoised. The scratch files are removed when the
+        mapping is garbage collected.
+
     Returns
     -------
-    tuple[dict[str, DataFrame], DataFrame]
+    tuple[dict[str, DataFrame] | DataFrame, DataFrame]
         The function returns a tuple of two items. The first item is a
         python dictionary of pandas DataFrames (which is the primary data
-        associated with the ABS catalogue item). The second item is a
-        DataFrame of ABS metadata for the ABS collection.
+        associated with the ABS catalogue item), or a single DataFrame
+        for the long layout. The second item is a DataFrame of ABS
+        metadata for the ABS collection. With output="polars", these are
+        Polars DataFrames. Results are memoised for the session, but each
+        call gets its own dictionary and copy-on-write DataFrames, so
+        changing them does not affect later calls.
 
         Note:
         You can retrieve non-timeseries data using the grab_abs_url()
@@ -165,26 +337,320 @@ def read_abs_cat(
     ```
 
     """
-    # --- get the time series data ---
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unexpected layout '{layout}'. Valid options are: {list(LAYOUTS)}")
+    check_output(output)
+    window = date_window(start, end)
+    if memory_limit is not None:
+        if layout != "wide":
+            raise ValueError("memory_limit works with the wide layout only.")
+        spilled, meta = _read_abs_cat_spilled(cat, url, window, SpilledFrames(memory_limit), **kwargs)
+        if output != "pandas":
+            spilled = spilled.converted(lambda frame: frame_to_output(frame, output))
+        return spilled, frame_to_output(meta, output)
+
+    data, meta = _read_abs_cat(cat, url, layout, window, **kwargs)
+
+    if isinstance(data, dict):
+        return frames_to_output(data, output), frame_to_output(meta, output)
+    return frame_to_output(data, output), frame_to_output(meta, output)
+
+
+def iter_abs_cat(
+    cat: str,
+    url: str = "",
+    *,
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> Iterator[tuple[str, DataFrame, DataFrame]]:
+    """Yield the tables of an ABS catalogue one at a time, as each workbook is parsed.
+
+    This is the streaming form of read_abs_cat(). Each Excel workbook is
+    downloaded (or taken from the cache directory), parsed and yielded
+    before the next one is read, and its raw sheets are released as soon
+    as its tables have been extracted. So a pipeline that writes each table
+    to storage needs memory for about one workbook at a time, rather than
+    for the whole catalogue. Nothing is memoised.
+
+    Parameters
+    ----------
+    cat : str
+        The ABS Catalogue Number.
+
+    url : str = ""
+        The URL of an ABS landing page. See read_abs_cat().
+
+    start : str | Period | date | None = None
+        The first period wanted. See read_abs_cat().
+
+    end : str | Period | date | None = None
+        The last period wanted. See read_abs_cat().
+
+    **kwargs : Unpack[ReadArgs]
+        The same keyword arguments as read_abs_cat().
+
+    Yields
+    ------
+    tuple[str, DataFrame, DataFrame]
+        The table name, its data (as for one item of the dictionary from
+        read_abs_cat()) and the metadata for its workbook.
+
+    Example
+    -------
+
+    ```python
+    import readabs as ra
+    for table, data, meta in ra.iter_abs_cat("6291.0.55.001"):
+        data.to_parquet(f"{table}.parquet")
+    ```
+
+    """
+    for data, meta in _iter_workbook_tables(cat, url, date_window(start, end), **kwargs):
+        for table, frame in data.items():
+            yield table, frame, meta
+
+
+@memoised("read_abs_meta", tag_arg="cat", key=result_key)
+def read_abs_meta(
+    cat: str,
+    url: str = "",
+    **kwargs: Unpack[ReadArgs],
+) -> DataFrame:
+    """Return the metadata for an ABS catalogue identifier, without reading the data.
+
+    Only the "Index" sheet of each Excel file is parsed. Of each Data sheet,
+    only the first block is decompressed from the xlsx file (to find its
+    dimensions), so this is much faster than read_abs_cat() when all you
+    need is to decide which series or tables to fetch (for example, with
+    search_abs_meta() or find_abs_id()).
+
+    Parameters
+    ----------
+    cat : str
+        The ABS Catalogue Number.
+
+    url : str = ""
+        The URL of an ABS landing page. See read_abs_cat().
+
+    **kwargs : Unpack[ReadArgs]
+        The same keyword arguments as read_abs_cat(). The ones that select
+        which files are downloaded (get_zip, single_excel_only, zip_file,
+        etc.) work in the same way; those that shape the data (dtype,
+        keep_non_ts) have no effect.
+
+    Returns
+    -------
+    DataFrame
+        The same metadata DataFrame that read_abs_cat() returns.
+
+    Example
+    -------
+
+    ```python
+    import readabs as ra
+    from readabs import metacol as mc
+    meta = ra.read_abs_meta("6202.0")
+    search_terms = {"Unemployment rate ;  Persons ;": mc.did, "Seasonally Adjusted": mc.stype}
+    table, series_id, units = ra.find_abs_id(meta, search_terms)
+    data, _meta = ra.read_abs_series("6202.0", series_id, single_excel_only=table)
+    ```
+
+    """
+    sources: dict[str, str] = {}
+    raw_abs_dict = _raw_sheets(cat, url, index_only=True, sources=sources, **kwargs)
+
+    named_cat = "<catalogue number missing>" if not cat.strip() else cat.strip()
+    meta_data = DataFrame()
+    for table, sheets in _group_sheets(raw_abs_dict).items():
+        index_sheet = f"{table}{HYPHEN}{INDEX_SHEET}"
+        if index_sheet not in sheets:
+            print(f"Table {table} has no 'Index' sheet.")
+            continue
+        meta_data = pd.concat([meta_data, _capture_meta(named_cat, raw_abs_dict, index_sheet)], axis=0)
+    _update_directory(cat, url, meta_data, sources, kwargs)
+    return meta_data
+
+
+def memoised_abs_cat(
+    cat: str,
+    url: str,
+    window: Window,
+    **kwargs: Any,  # ReadArgs compatible
+) -> tuple[dict[str, DataFrame], DataFrame] | None:
+    """Return the result of an earlier read_abs_cat() call, in the wide layout, if it is still memoised.
+
+    Nothing is downloaded or parsed: None is returned if the read is not in
+    the store. This lets a reader that wants some tables only (such as
+    read_abs_series()) take them from an earlier full read of the catalogue.
+    """
+    cached = memo_get(_memo_key(cat, url, "wide", kwargs))
+    if cached is None or window == NO_WINDOW:
+        return cached
+    data, meta = cached
+    return cast("dict[str, DataFrame]", _slice_window(data, window)), meta
+
+
+# - private -
+def _memo_key(cat: str, url: str, layout: str, kwargs: dict[str, Any]) -> tuple[str, Any]:
+    """Return the memo key of a read_abs_cat() result (the full history, with no date window)."""
+    return ("read_abs_cat", result_key({"cat": cat, "url": url, "layout": layout}, kwargs, "read_abs_cat"))
+
+
+def _read_abs_cat(
+    cat: str,
+    url: str,
+    layout: str,
+    window: Window,
+    **kwargs: Any,  # ReadArgs compatible
+) -> tuple[dict[str, DataFrame] | DataFrame, DataFrame]:
+    """Retrieve and parse the ABS data for read_abs_cat().
+
+    Results are memoised, in the shared byte-bounded store (see memo.py),
+    to minimise slowness for any repeat business. They are keyed on the
+    arguments that affect the result only (see result_key), so a repeat call
+    that differs in verbose or cache_only is served from the store, but one
+    that differs in ignore_errors (which can leave tables out) is not. The
+    raw sheets are read without caching, and released once parsed. Only the
+    full history is memoised: a date window is sliced from it, so every
+    window over the same arguments shares the one parse and the one store
+    entry.
+    """
+    key = _memo_key(cat, url, layout, kwargs)
+    cached = memo_get(key)
+    if cached is None:
+        # --- get the time series data ---
+        sources: dict[str, str] = {}
+        raw_abs_dict = _raw_sheets(cat, url, sources=sources, **kwargs)
+        data, meta = _get_time_series_data(cat, raw_abs_dict, layout=layout, **kwargs)
+        raw_abs_dict.clear()
+        _update_directory(cat, url, meta, sources, kwargs)
+
+        # dictionary of DataFrames (or one long DataFrame), and a DataFrame of metadata
+        result = (_combine_long(data), meta) if layout == "long" else (data, meta)
+        memo_put(key, result, tag=cat)
+        cached = isolated(result)
+
+    if window == NO_WINDOW:
+        return cached
+    data, meta = cached
+    return _slice_window(data, window), meta
+
+
+def _raw_sheets(
+    cat: str,
+    url: str,
+    *,
+    index_only: bool = False,
+    sources: dict[str, str] | None = None,
+    **kwargs: Any,  # ReadArgs compatible
+) -> dict[str, DataFrame]:
+    """Read the raw sheets of every workbook, from a local zip file or an ABS webpage, without caching.
+
+    For an ABS webpage, the URL each table was read from is recorded in sources (if given).
+    """
     zip_file = kwargs.get("zip_file")
-    raw_abs_dict = (
-        grab_abs_zip(zip_file, **kwargs) if zip_file else grab_abs_url(cat=cat, url=url, **kwargs)
+    workbooks = (
+        iter_abs_zip(zip_file, index_only=index_only, **kwargs)
+        if zip_file
+        else iter_abs_url(cat=cat, url=url, index_only=index_only, sources=sources, **kwargs)
     )
-    response = _get_time_series_data(cat, raw_abs_dict, **kwargs)
+    raw_abs_dict: dict[str, DataFrame] = {}
+    for workbook in workbooks:
+        raw_abs_dict.update(workbook)
+    return raw_abs_dict
 
-    if not response:
-        response = {}, DataFrame()
 
-    return response  # dictionary of DataFrames, and a DataFrame of metadata
+def _update_directory(
+    cat: str,
+    url: str,
+    meta: DataFrame,
+    sources: dict[str, str],
+    kwargs: Mapping[str, Any],  # ReadArgs compatible
+) -> None:
+    """Add the series just read from an ABS webpage to the series directory.
+
+    Local zip files, historical releases and reads without a catalogue
+    number are not added.
+    """
+    if not cat.strip() or kwargs.get("zip_file") or kwargs.get("history"):
+        return
+    complete = not any(kwargs.get(name) for name in PARTIAL_READ_ARGS)
+    update_directory(meta, sources, url, complete=complete, verbose=kwargs.get("verbose", False))
+
+
+def _iter_workbook_tables(
+    cat: str,
+    url: str,
+    window: Window,
+    spilled: SpilledFrames | None = None,
+    **kwargs: Any,  # ReadArgs compatible
+) -> Iterator[tuple[dict[str, DataFrame], DataFrame]]:
+    """Yield the tables and the metadata of each workbook, one workbook at a time.
+
+    If a SpilledFrames mapping is given, it is told the size of each workbook,
+    so that it can keep enough headroom to parse the next one.
+    """
+    zip_file = kwargs.get("zip_file")
+    workbooks = iter_abs_zip(zip_file, **kwargs) if zip_file else iter_abs_url(cat=cat, url=url, **kwargs)
+    for workbook in workbooks:
+        if spilled is not None:
+            spilled.reserve(workbook)
+        data, meta = _get_time_series_data(cat, workbook, window=window, **kwargs)
+        workbook.clear()  # release the raw sheets, which the readers upstream still reference
+        yield data, meta
+
+
+def _read_abs_cat_spilled(
+    cat: str,
+    url: str,
+    window: Window,
+    spilled: SpilledFrames,
+    **kwargs: Any,  # ReadArgs compatible
+) -> tuple[SpilledFrames, DataFrame]:
+    """Read the ABS data one workbook at a time, adding the tables to a SpilledFrames mapping."""
+    meta_parts: list[DataFrame] = []
+    for data, meta in _iter_workbook_tables(cat, url, window, spilled, **kwargs):
+        for table, frame in data.items():
+            if table not in spilled:  # the first copy of a table is kept
+                spilled.add(table, frame)
+        meta_parts.append(meta)
+    return spilled, pd.concat(meta_parts, axis=0) if meta_parts else DataFrame()
+
+
+def _slice_window(data: dict[str, DataFrame] | DataFrame, window: Window) -> dict[str, DataFrame] | DataFrame:
+    """Return the rows of previously parsed data that fall inside the date window."""
+    if isinstance(data, DataFrame):  # the long layout
+        keep = np.zeros(len(data), dtype=bool)
+        for freq in data[LONG_FREQ].cat.categories:
+            first, last = window_ordinals(freq, window)
+            rows = (data[LONG_FREQ] == freq).to_numpy()
+            if first is not None:
+                rows = rows & (data[LONG_PERIOD].to_numpy() >= first)
+            if last is not None:
+                rows = rows & (data[LONG_PERIOD].to_numpy() <= last)
+            keep |= rows
+        sliced = data.loc[keep].reset_index(drop=True)
+        return sliced.assign(  # as if only the window had been read
+            **{column: sliced[column].cat.remove_unused_categories() for column in (LONG_ID, LONG_FREQ)}
+        )
+
+    return {
+        name: frame.loc[period_mask(frame.index, window)] if isinstance(frame.index, pd.PeriodIndex) else frame
+        for name, frame in data.items()
+    }
 
 
-# - private -
 def _get_time_series_data(
     cat: str,
     abs_dict: dict[str, DataFrame],
-    **kwargs: Any,  # keep_non_ts, verbose, ignore_errors
+    **kwargs: Any,  # keep_non_ts, verbose, ignore_errors, layout, window
 ) -> tuple[dict[str, DataFrame], DataFrame]:
-    """Extract the time series data for a specific ABS catalogue identifier."""
+    """Extract the time series data for a specific ABS catalogue identifier.
+
+    For the long layout, each table in the returned dictionary is already in
+    long form, ready to be combined by _combine_long().
+    """
     # --- set up ---
     cat = "<catalogue number missing>" if not cat.strip() else cat.strip()
     new_dict: dict[str, DataFrame] = {}
@@ -231,7 +697,7 @@ def _capture(
     to_dict: dict[str, DataFrame],
     meta_data: DataFrame,
     args: dict[str, Any],
-    **kwargs: Any,  # keep_non_ts, ignore_errors
+    **kwargs: Any,  # keep_non_ts, ignore_errors, layout, window
 ) -> tuple[dict[str, DataFrame], DataFrame]:
     """Capture the time series data and meta data from an Excel file.
 
@@ -241,8 +707,9 @@ def _capture(
     the combined results are returned as a tuple.
     """
     # --- step 0: set up ---
-    keep_non_ts: bool = kwargs.get("keep_non_ts", False)
+    keep_non_ts: bool = kwargs.get("keep_non_ts", False) and kwargs.get("layout") != "long"
     ignore_errors: bool = kwargs.get("ignore_errors", False)
+    capture = _capture_long if kwargs.get("layout") == "long" else _capture_data
 
     # --- step 1: capture the meta data ---
     short_names = [x.split(HYPHEN, 1)[1] for x in args["long_sheets"]]
@@ -261,8 +728,9 @@ def _capture(
     meta_data = pd.concat([meta_data, this_meta], axis=0)
 
     # --- step 2: capture the actual time series data ---
-    data = _capture_data(meta_data, args["from_dict"], args["long_sheets"], **kwargs)
-    if len(data):
+    data = capture(meta_data, args["from_dict"], args["long_sheets"], **kwargs)
+    windowed = kwargs.get("window", NO_WINDOW) != NO_WINDOW
+    if len(data) or (windowed and len(data.columns)):  # a date window may leave no rows
         to_dict[args["table"]] = data
     else:
         # a glitch: we have the metadata but not the actual data
@@ -279,7 +747,7 @@ def _capture_data(
     abs_meta: DataFrame,
     from_dict: dict[str, DataFrame],
     long_sheets: list[str],
-    **kwargs: Any,  # verbose
+    **kwargs: Any,  # verbose, dtype, window
 ) -> DataFrame:
     """Take a list of ABS data sheets and stitch them into a DataFrame.
 
@@ -288,27 +756,13 @@ def _capture_data(
     """
     # --- step 0: set up ---
     verbose: bool = kwargs.get("verbose", False)
+    dtype: str = kwargs.get("dtype", "float64")
+    window: Window = kwargs.get("window", NO_WINDOW)
     merged_data = DataFrame()
-    header_row: int = 8
 
     # --- step 1: capture the time series data ---
-    # identify the data sheets in the list of all sheets from Excel file
-    data_sheets = [x for x in long_sheets if x.split(HYPHEN, 1)[1].startswith("Data")]
-
-    for sheet_name in data_sheets:
-        if verbose:
-            print(f"About to cature data from {sheet_name=}")
-
-        # --- capture just the data, nothing else
-        sheet_data = from_dict[sheet_name].copy()
-
-        # get the columns
-        header = sheet_data.iloc[header_row]
-        sheet_data.columns = pd.Index(header)
-        sheet_data = sheet_data[(header_row + 1) :]
-
-        # get the row indexes
-        sheet_data = _index_to_period(sheet_data, sheet_name, abs_meta, verbose=verbose)
+    for sheet_name in _data_sheets(long_sheets):
+        sheet_data = _sheet_data(from_dict, sheet_name, abs_meta, window, verbose=verbose)
 
         # --- merge data into a single dataframe
         if len(merged_data) == 0:
@@ -342,24 +796,178 @@ def _capture_data(
         merged_data = merged_data.loc[:, ~duplicates].copy()
 
     # make the data all floats.
-    return merged_data.astype(float).sort_index()
+    return to_float_dtype(merged_data, dtype).sort_index()
 
 
-def _index_to_period(sheet_data: DataFrame, sheet_name: str, abs_meta: DataFrame, *, verbose: bool) -> DataFrame:
-    """Convert the index of a DataFrame to a PeriodIndex."""
-    index_column = sheet_data[sheet_data.columns[0]].astype(str)
-    sheet_data = sheet_data.drop(sheet_data.columns[0], axis=1)
+def _capture_long(
+    abs_meta: DataFrame,
+    from_dict: dict[str, DataFrame],
+    long_sheets: list[str],
+    **kwargs: Any,  # verbose, dtype, window
+) -> DataFrame:
+    """Take a list of ABS data sheets and convert them into one long DataFrame.
+
+    Each sheet is unpivoted on its own, keeping only the observed values, so
+    a wide table with its NaN padding is never assembled. Rows are ordered by
+    series, then period.
+    """
+    # --- step 0: set up ---
+    verbose: bool = kwargs.get("verbose", False)
+    dtype: str = kwargs.get("dtype", "float64")
+    window: Window = kwargs.get("window", NO_WINDOW)
+    ids: list[str] = []
+    codes, periods, values, freqs = [], [], [], []
+
+    # --- step 1: unpivot each sheet
+    for sheet_name in _data_sheets(long_sheets):
+        sheet_data = _sheet_data(from_dict, sheet_name, abs_meta, window, verbose=verbose)
+        index = sheet_data.index
+        if not isinstance(index, pd.PeriodIndex):
+            continue
+
+        # ignore series already captured (should not happen)
+        fresh = ~sheet_data.columns.isin(ids) & ~sheet_data.columns.duplicated()
+        if verbose and not fresh.all():
+            print(f"Note: duplicates removed from {sheet_name}: {sheet_data.columns[~fresh]}")
+        sheet_data = sheet_data.loc[:, fresh]
+
+        # series-major arrays of the observed values, in period order
+        ordinals = index.astype("int64").to_numpy().astype(np.int32)  # int32 spans any ABS date
+        order = np.argsort(ordinals, kind="stable")
+        matrix = sheet_data.to_numpy(dtype=float)[order].T
+        observed = ~np.isnan(matrix)
+        series, rows = np.nonzero(observed)
+        codes.append(series + len(ids))
+        periods.append(ordinals[order][rows])
+        values.append(matrix[observed])
+        freqs.append(np.full(len(rows), index.freqstr))
+        ids.extend(str(x) for x in sheet_data.columns)
+
+    # --- step 2: assemble the long DataFrame
+    if not codes:
+        return DataFrame()
+    long_data = DataFrame(
+        {
+            LONG_ID: Categorical.from_codes(np.concatenate(codes).astype(np.int64), categories=pd.Index(ids)),
+            LONG_PERIOD: np.concatenate(periods),
+            LONG_VALUE: np.concatenate(values),
+            LONG_FREQ: Categorical(np.concatenate(freqs)),
+        }
+    )
+    long_data[LONG_VALUE] = to_float_dtype(long_data[[LONG_VALUE]], dtype)[LONG_VALUE]
+    return long_data
+
+
+def _combine_long(tables: dict[str, DataFrame]) -> DataFrame:
+    """Combine the per-table long DataFrames into one DataFrame.
+
+    A series that appears in more than one table is kept from the first
+    table only.
+    """
+    parts: list[DataFrame] = []
+    seen: set[str] = set()
+    for frame in tables.values():
+        categories = frame[LONG_ID].cat.categories
+        repeats = categories[categories.isin(list(seen))]
+        seen.update(categories)
+        parts.append(frame.loc[~frame[LONG_ID].isin(repeats)] if len(repeats) else frame)
+
+    if not parts:
+        return DataFrame(
+            {
+                LONG_ID: Categorical([]),
+                LONG_PERIOD: np.array([], dtype=np.int32),
+                LONG_VALUE: np.array([], dtype=float),
+                LONG_FREQ: Categorical([]),
+            }
+        )
+    return DataFrame(
+        {
+            LONG_ID: union_categoricals([p[LONG_ID] for p in parts]).remove_unused_categories(),
+            LONG_PERIOD: np.concatenate([p[LONG_PERIOD].to_numpy() for p in parts]),
+            LONG_VALUE: pd.concat([p[LONG_VALUE] for p in parts], ignore_index=True),
+            LONG_FREQ: union_categoricals([p[LONG_FREQ] for p in parts]),
+        }
+    )
+
+
+def _data_sheets(long_sheets: list[str]) -> list[str]:
+    """Identify the data sheets in the list of all sheets from an Excel file."""
+    return [x for x in long_sheets if x.split(HYPHEN, 1)[1].startswith("Data")]
+
+
+def _sheet_data(
+    from_dict: dict[str, DataFrame],
+    sheet_name: str,
+    abs_meta: DataFrame,
+    window: Window,
+    *,
+    verbose: bool,
+) -> DataFrame:
+    """Capture just the data from an ABS data sheet, with a PeriodIndex.
+
+    The periods are found from the date column alone. Rows outside the date
+    window are then dropped while the data are still the raw cells from the
+    Excel sheet, so only the rows wanted are copied and, later, converted
+    to floats.
+    """
+    header_row: int = 8
+    if verbose:
+        print(f"About to cature data from {sheet_name=}")
+
+    # --- the column labels, and the cells below them
+    raw = from_dict[sheet_name]
+    header = pd.Index(raw.iloc[header_row])
+    cells = raw.iloc[(header_row + 1) :]
+
+    # get the row indexes, and keep only the rows wanted
+    rows, index = _index_to_period(
+        cells.iloc[:, 0].rename(header[0]), header[1], sheet_name, abs_meta, verbose=verbose
+    )
+    if window != NO_WINDOW:
+        inside = period_mask(index, window)
+        rows, index = rows[inside], index[inside]
+
+    # --- capture just the data, nothing else (copied into one block)
+    sheet_data = cells.iloc[rows, 1:].copy()
+    sheet_data.columns = header[1:]
+    sheet_data.index = index
+    return sheet_data
+
+
+def _index_to_period(
+    dates: pd.Series,
+    series_id: str,
+    sheet_name: str,
+    abs_meta: DataFrame,
+    *,
+    verbose: bool,
+) -> tuple[np.ndarray, pd.PeriodIndex]:
+    """Convert the date column of an ABS data sheet to a PeriodIndex.
+
+    Args:
+        dates: The date column, below the header row
+        series_id: The first series on the sheet, whose frequency is used
+        sheet_name: The name of the sheet (table and sheet), for messages
+        abs_meta: The metadata, which holds the frequency of each series
+        verbose: Print any rows that do not look like dates
+
+    Returns:
+        tuple[np.ndarray, pd.PeriodIndex]: The positions of the date rows (the
+            notes that can follow the data are left out), and their periods
+
+    """
+    index_column = dates.astype(str)
     long_row_names = index_column.str.len() > MAX_DATETIME_CHARS  # 19 chars in datetime str
     if verbose and long_row_names.any():
         print(f"You may need to check index column for {sheet_name}")
-    index_column = index_column.loc[~long_row_names]
-    sheet_data = sheet_data.loc[~long_row_names]
+    rows = np.flatnonzero(~long_row_names.to_numpy())
+    index_column = index_column.iloc[rows]
 
     proposed_index = pd.to_datetime(index_column)
 
     # get the correct period index
     short_name = sheet_name.split(HYPHEN, 1)[0]
-    series_id = sheet_data.columns[0]
     freq_value = abs_meta[abs_meta[metacol.table] == short_name].loc[series_id, metacol.freq]
     freq = str(freq_value).upper().strip()[0]
     freq = "Y" if freq == "A" else freq  # pandas prefers yearly
@@ -368,15 +976,12 @@ def _index_to_period(sheet_data: DataFrame, sheet_name: str, abs_meta: DataFrame
         print(f"Check the frequency of the data in sheet: {sheet_name}")
 
     # create an appropriate period index
-    if freq:
-        if freq in ("Q", "Y"):
-            month = str(calendar.month_abbr[proposed_index.dt.month.max()]).upper()
-            freq = f"{freq}-{month}"
-        sheet_data.index = pd.PeriodIndex(proposed_index, freq=freq)
-    else:
+    if not freq:
         raise ValueError(f"With sheet {sheet_name} could not determime PeriodIndex")
-
-    return sheet_data
+    if freq in ("Q", "Y"):
+        month = str(calendar.month_abbr[proposed_index.dt.month.max()]).upper()
+        freq = f"{freq}-{month}"
+    return rows, pd.PeriodIndex(proposed_index, freq=freq)
 
 
 def _capture_meta(
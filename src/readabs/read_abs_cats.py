@@ -0,0 +1,103 @@
+"""Read several ABS catalogues concurrently."""
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any
+
+from readabs.abs_catalogue import abs_catalogue
+from readabs.read_abs_cat import read_abs_cat
+
+# --- constants
+DEFAULT_WORKERS = 8  # enough to overlap the downloads, without hammering the ABS website
+
+
+# --- public
+def read_abs_cats(
+    cats: Iterable[str],
+    workers: int | None = None,
+    **kwargs: Any,  # read_abs_cat() compatible
+) -> dict[str, tuple[Any, Any]]:
+    """Read several ABS catalogues at once, with one worker thread per catalogue.
+
+    Each catalogue is read with `read_abs_cat()` in a pool of threads, so the
+    landing pages and data files for all of the catalogues are downloaded
+    concurrently, and each catalogue is parsed as soon as its files arrive.
+    The ABS catalogue map is read once, before the workers start. The
+    results are memoised in the same way as for `read_abs_cat()`.
+
+    Parameters
+    ----------
+    cats : Iterable[str]
+        The ABS catalogue numbers to read (eg. ["5206.0", "6202.0"]).
+        Repeats are read once.
+
+    workers : int | None = None
+        The number of worker threads. The default is one per catalogue,
+        up to 8.
+
+    **kwargs : Any
+        Any keyword argument of `read_abs_cat()` (eg. `dtype`, `start`,
+        `single_excel_only`), applied to every catalogue. With
+        `ignore_errors=True`, a catalogue that cannot be read is reported
+        and left out of the result.
+
+    Returns
+    -------
+    dict[str, tuple[dict[str, DataFrame], DataFrame]]
+        For each catalogue read, the `(data, meta)` pair that
+        `read_abs_cat()` returns, in the order the catalogues were given.
+
+    Raises
+    ------
+    ExceptionGroup
+        If any catalogue cannot be read (and ignore_errors is not set). All
+        of the catalogues are tried first; the group holds one exception
+        per failed catalogue, each with a note naming the catalogue.
+
+    Example
+    -------
+    ```python
+    import readabs as ra
+    results = ra.read_abs_cats(["5206.0", "6202.0", "6401.0"])
+    data, meta = results["6202.0"]
+    ```
+
+    """
+    wanted = list(dict.fromkeys(cat.strip() for cat in cats))
+    if not wanted:
+        return {}
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}.")
+
+    if not kwargs.get("zip_file") and not kwargs.get("url"):
+        # look up the landing pages once, rather than in every worker;
+        # if that fails, each worker reports the problem for its catalogue
+        with suppress(Exception):
+            abs_catalogue(cache_only=kwargs.get("cache_only", False), verbose=kwargs.get("verbose", False))
+
+    def read_one(cat: str) -> tuple[Any, Any]:
+        return read_abs_cat(cat, **kwargs)
+
+    n_workers = workers if workers is not None else min(len(wanted), DEFAULT_WORKERS)
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="read_abs_cats") as pool:
+        futures = {cat: pool.submit(read_one, cat) for cat in wanted}
+
+    results: dict[str, tuple[Any, Any]] = {}
+    failures: list[Exception] = []
+    for cat, future in futures.items():
+        error = future.exception()
+        if error is None:
+            results[cat] = future.result()
+            continue
+        if not isinstance(error, Exception):
+            raise error  # eg. KeyboardInterrupt
+        error.add_note(f"read_abs_cats(): while reading catalogue {cat}")
+        failures.append(error)
+        if kwargs.get("ignore_errors", False):
+            print(f"read_abs_cats(): could not read catalogue {cat}: {error}")
+
+    if failures and not kwargs.get("ignore_errors", False):
+        failed = ", ".join(cat for cat in futures if cat not in results)
+        raise ExceptionGroup(f"read_abs_cats(): could not read catalogue(s) {failed}", failures)
+    return results
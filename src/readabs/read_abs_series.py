@@ -1,30 +1,78 @@
 """Get specific ABS data series by their ABS series identifiers."""
 
-from collections.abc import Sequence
-from typing import Unpack, cast
+import re
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Literal, Unpack, cast, overload
 
 from pandas import DataFrame, Index, PeriodIndex, concat
 
 from readabs.abs_meta_data import metacol
-from readabs.read_abs_cat import read_abs_cat
-from readabs.read_support import ReadArgs, check_kwargs, get_args
+from readabs.output_format import check_output, frame_to_output, frames_to_output
+from readabs.read_abs_cat import PARTIAL_READ_ARGS, memoised_abs_cat, read_abs_cat
+from readabs.read_abs_cats import read_abs_cats
+from readabs.read_support import DateLike, ReadArgs, check_kwargs, date_window, get_args
+from readabs.series_directory import LANDING_PAGE, directory
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 # --- functions
+@overload
 def read_abs_series(
-    cat: str,
-    series_id: str | Sequence[str],
+    cat: str = "",
+    series_id: str | Sequence[str] = (),
+    url: str = "",
+    *,
+    output: Literal["pandas", "arrow"] = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple[DataFrame, DataFrame]: ...
+
+
+@overload
+def read_abs_series(
+    cat: str = "",
+    series_id: str | Sequence[str] = (),
+    url: str = "",
+    *,
+    output: Literal["polars"],
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple["pl.DataFrame", "pl.DataFrame"]: ...
+
+
+def read_abs_series(
+    cat: str = "",
+    series_id: str | Sequence[str] = (),
     url: str = "",
+    *,
+    output: str = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
     **kwargs: Unpack[ReadArgs],
-) -> tuple[DataFrame, DataFrame]:
-    """Get specific ABS data series by their ABS catalogue and series identifiers.
+) -> tuple[Any, Any]:
+    """Get specific ABS data series by their ABS series identifiers.
+
+    Each series is looked up in the series directory (see lookup_series()),
+    which records the catalogue and table of every series that has been
+    read before. Only the workbooks for the tables that hold the wanted
+    series are then downloaded and parsed, rather than the whole catalogue.
+    A series that is not in the directory (or is no longer in the table it
+    was in) is found by reading its whole catalogue, which also adds that
+    catalogue to the directory.
 
     Parameters
     ----------
-    cat : str
-        The ABS catalogue ID.
+    cat : str = ""
+        The ABS catalogue ID. This may be left out for series that are in
+        the series directory; it is needed for series that are not, and for
+        reads of a zip_file or a history release (which do not use the
+        directory, and read the whole catalogue).
 
-    series_id : str | Sequence[str]
+    series_id : str | Sequence[str] = ()
         An ABS series ID or a sequence of ABS series IDs.
 
     url : str = ""
@@ -33,6 +81,15 @@ def read_abs_series(
         data is retrieved from this URL instead of looking up the catalogue
         number. Passed through to read_abs_cat().
 
+    output : str = "pandas"
+        One of "pandas", "arrow" or "polars". See read_abs_cat().
+
+    start : str | Period | date | None = None
+        The first period wanted. See read_abs_cat().
+
+    end : str | Period | date | None = None
+        The last period wanted. See read_abs_cat().
+
     **kwargs : Any
         Keyword arguments for the read_abs_series function,
         which are the same as the keyword arguments for the
@@ -42,6 +99,13 @@ def read_abs_series(
     -------
     tuple[DataFrame, DataFrame]
         A tuple of two DataFrames, one for the primary data and one for the metadata.
+        With output="polars", these are Polars DataFrames.
+
+    Raises
+    ------
+    ValueError
+        If a series cannot be found (and ignore_errors is not set), or if
+        no catalogue is given for a zip_file or history read.
 
     Example
     -------
@@ -55,54 +119,325 @@ def read_abs_series(
     data, meta = ra.read_abs_series(
         cat=cat_num, series_id=unemployment_rate, single_excel_only=seo
     )
+    # once the catalogue has been read, the catalogue and table can be left out
+    data, meta = ra.read_abs_series(series_id=[unemployment_rate, "A84423043C"])
     ```
 
     """
     # check for unexpected keyword arguments/get defaults
+    check_output(output)
     check_kwargs(kwargs, "read_abs_series")
     args = get_args(kwargs, "read_abs_series")
+    if isinstance(series_id, str):
+        series_id = [series_id]
 
-    # read the ABS category data
-    cat_data, cat_meta = read_abs_cat(cat, url=url, **args)
+    # read the ABS data: just the tables that hold the series, where they are known
+    cat_data, cat_meta = _read_series_data(cat, list(series_id), url, args, start=start, end=end)
 
-    # drop repeated series_ids in the meta data,
-    # make unique series_ids the index
-    cat_meta.index = Index(cat_meta[metacol.id])
-    cat_meta = cat_meta.groupby(cat_meta.index).first()
+    # one metadata row per series ID (the first non-null value of each column)
+    meta = _unique_meta(cat_meta)
+    table_of = meta[metacol.table].astype(str).to_dict()
 
-    # get the ABS series data
-    if isinstance(series_id, str):
-        series_id = [series_id]
-    return_data, return_meta = DataFrame(), DataFrame()
+    # check the requested series IDs, in order, before touching any data
+    source = f"catalogue {cat}" if cat.strip() else "the series directory"
+    accepted: list[str] = []
+    freq = None
     for identifier in series_id:
         # confirm that the series ID is in the catalogue
-        if identifier not in cat_meta.index:
+        if identifier not in table_of:
             if args["verbose"]:
-                print(f"Series ID {identifier} not found in ABS catalogue ID {cat}")
+                print(f"Series ID {identifier} not found in {source}")
             if args["ignore_errors"]:
                 continue
-            raise ValueError(f"Series ID {identifier} not found in catalogue {cat}")
+            raise ValueError(f"Series ID {identifier} not found in {source}")
 
-        # confirm thay the index of the series is compatible
-        table = str(cat_meta.loc[identifier, metacol.table])  # str for mypy
-        data_series = cat_data[table][identifier]
-        if (
-            len(return_data) > 0
-            and cast("PeriodIndex", return_data.index).freq != cast("PeriodIndex", data_series.index).freq
-        ):
+        # confirm that the index of the series is compatible
+        series_freq = cast("PeriodIndex", cat_data[table_of[identifier]].index).freq
+        if freq is not None and series_freq != freq:
             if args["verbose"]:
                 print(f"Frequency mismatch for series ID {identifier}")
             if args["ignore_errors"]:
                 continue
             raise ValueError(f"Frequency mismatch for series ID {identifier}")
+        freq = series_freq
+        accepted.append(identifier)
+
+    if not accepted:
+        return frame_to_output(DataFrame(), output), frame_to_output(DataFrame(), output)
+
+    # one .loc per table, one outer alignment, and one indexed .loc for the metadata
+    unique = list(dict.fromkeys(accepted))
+    frames = _table_frames(unique, meta, cat_data)
+    return_data = frames[0] if len(frames) == 1 else concat(frames, axis=1).sort_index()
+    return_data = return_data[unique]
+    return_meta = meta.loc[accepted].astype(object)  # object columns, as for rows stacked from a mixed frame
+    return frame_to_output(return_data, output), frame_to_output(return_meta, output)
+
+
+def read_abs_panel(
+    wanted: Iterable[tuple[str, str]],
+    workers: int | None = None,
+    *,
+    output: str = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Unpack[ReadArgs],
+) -> tuple[dict[str, Any], Any]:
+    """Get a panel of ABS series, drawn from any number of catalogues.
+
+    The requests are grouped by catalogue, and the catalogues are read
+    concurrently with read_abs_cats(). The series are then pulled from
+    each table in one step, and aligned into one DataFrame per frequency.
+
+    Parameters
+    ----------
+    wanted : Iterable[tuple[str, str]]
+        (catalogue ID, series ID) pairs, eg.
+        [("6202.0", "A84423050A"), ("5206.0", "A2304402X")]. A series
+        requested more than once is included once.
+
+    workers : int | None = None
+        The number of catalogues read at once. See read_abs_cats().
+
+    output : str = "pandas"
+        One of "pandas", "arrow" or "polars". See read_abs_cat().
+
+    start : str | Period | date | None = None
+        The first period wanted. See read_abs_cat().
+
+    end : str | Period | date | None = None
+        The last period wanted. See read_abs_cat().
+
+    **kwargs : Unpack[ReadArgs]
+        The same keyword arguments as read_abs_cat(), applied to every
+        catalogue. With ignore_errors=True, series that cannot be found
+        (and catalogues that cannot be read) are left out.
+
+    Returns
+    -------
+    tuple[dict[str, DataFrame], DataFrame]
+        A dictionary of DataFrames keyed by frequency (the PeriodIndex
+        frequency string, eg. "M" or "Q-DEC"), each with the series of that
+        frequency as columns in the order requested, over the union of
+        their periods; and a DataFrame of the metadata for every series,
+        indexed by series ID.
+
+    Raises
+    ------
+    ValueError
+        If a series is not in its catalogue (and ignore_errors is not set).
+    ExceptionGroup
+        If any catalogue cannot be read. See read_abs_cats().
+
+    Example
+    -------
+
+    ```python
+    import readabs as ra
+    panel, meta = ra.read_abs_panel([("6202.0", "A84423050A"), ("5206.0", "A2304402X")])
+    monthly, quarterly = panel["M"], panel["Q-DEC"]
+    ```
+
+    """
+    check_output(output)
+    check_kwargs(kwargs, "read_abs_panel")
+    args = get_args(kwargs, "read_abs_panel")
+
+    # group the requests by catalogue, keeping the order requested
+    by_cat: dict[str, list[str]] = {}
+    order: dict[str, int] = {}
+    for cat, identifier in wanted:
+        if identifier not in order:
+            order[identifier] = len(order)
+            by_cat.setdefault(cat.strip(), []).append(identifier)
+
+    catalogues = read_abs_cats(by_cat, workers=workers, start=start, end=end, **args)
+
+    frames: list[DataFrame] = []
+    metas: list[DataFrame] = []
+    for cat, (cat_data, cat_meta) in catalogues.items():
+        data, meta = _select_series(cat, by_cat[cat], cat_data, cat_meta, args)
+        frames.extend(data)
+        metas.append(meta)
+
+    # one outer alignment per frequency
+    by_freq: dict[str, list[DataFrame]] = {}
+    for frame in frames:
+        by_freq.setdefault(cast("PeriodIndex", frame.index).freqstr, []).append(frame)
+    panel: dict[str, DataFrame] = {}
+    for freq, parts in by_freq.items():
+        combined = concat(parts, axis=1).sort_index()
+        panel[freq] = combined[[identifier for identifier in order if identifier in combined.columns]]
+
+    meta = concat(metas, axis=0) if metas else DataFrame()
+    if len(meta):
+        meta = meta.iloc[meta.index.map(order).argsort()]
+    return frames_to_output(panel, output), frame_to_output(meta, output)
+
+
+def _read_series_data(
+    cat: str,
+    identifiers: list[str],
+    url: str,
+    args: dict[str, Any],
+    **window: DateLike | None,
+) -> tuple[dict[str, DataFrame], DataFrame]:
+    """Read the ABS data for read_abs_series(), through the series directory where it applies.
+
+    Reads of a zip_file or history release, and reads that already select
+    their tables, use the catalogue as given.
+
+    Raises:
+        ValueError: If there is no catalogue for a history release or a selection of tables
+
+    """
+    if not (args["zip_file"] or args["history"] or any(args[name] for name in PARTIAL_READ_ARGS)):
+        return _read_owning_tables(cat.strip(), identifiers, url, args, **window)
+    if not cat.strip() and not args["zip_file"]:
+        raise ValueError("read_abs_series(): a catalogue number is needed to read a history release or tables.")
+    return read_abs_cat(cat, url=url, start=window.get("start"), end=window.get("end"), **args)
+
+
+def _read_owning_tables(
+    cat: str,
+    identifiers: list[str],
+    url: str,
+    args: dict[str, Any],
+    **window: DateLike | None,
+) -> tuple[dict[str, DataFrame], DataFrame]:
+    """Read the tables that hold the wanted series, as recorded in the series directory.
+
+    The known series are grouped by catalogue (and landing page), and each
+    catalogue is read for just their tables. If an earlier full read of the
+    catalogue is still memoised, the tables are taken from it instead, so
+    read_abs_cat() followed by read_abs_series() downloads and parses the
+    catalogue once. A catalogue is read in full (which updates the
+    directory) if any wanted series is not where the directory says, or if
+    cat is given and some series are not in the directory at all. Series
+    with no catalogue are left for the caller to report.
+
+    Args:
+        cat: The ABS catalogue ID, or "" to look up each series' catalogue
+        identifiers: The series IDs wanted
+        url: The ABS landing page, if given (used for every catalogue read)
+        args: The validated ReadArgs
+        **window: The start and end of the periods wanted
 
-        # add the series data and meta data to the return values
-        if len(return_data) > 0:
-            return_data = return_data.reindex(return_data.index.union(data_series.index))
-        return_data[identifier] = data_series
-        return_meta = concat([return_meta, cat_meta.loc[identifier]], axis=1)
+    Returns:
+        tuple[dict[str, DataFrame], DataFrame]: The tables read (from every
+            catalogue) and their combined metadata
 
-    return return_data, return_meta.T
+    """
+    wanted = list(dict.fromkeys(identifiers))
+    known = directory(cat or None)
+    known = known.loc[known.index.intersection(wanted, sort=False)]
+    owners: dict[tuple[str, str], list[str]] = {}  # (catalogue, page) -> tables
+    for found_cat, page, table in zip(
+        known[metacol.cat].astype(str),
+        known[LANDING_PAGE].astype(str),
+        known[metacol.table].astype(str),
+        strict=True,
+    ):
+        tables = owners.setdefault((found_cat, url or page), [])
+        if table not in tables:
+            tables.append(table)
+
+    def read(read_cat: str, page: str, **selection: Any) -> tuple[dict[str, DataFrame], DataFrame]:
+        return read_abs_cat(
+            read_cat, url=page, start=window.get("start"), end=window.get("end"), **(args | selection)
+        )
+
+    data: dict[str, DataFrame] = {}
+    metas: list[DataFrame] = []
+    full_reads: dict[str, str] = {cat: url} if cat and len(known) < len(wanted) else {}
+    dates = date_window(window.get("start"), window.get("end"))
+    for (read_cat, page), tables in owners.items():
+        memoised = memoised_abs_cat(read_cat, page, dates, **args)
+        if memoised is not None:  # the catalogue was read in full earlier
+            full_data, full_meta = memoised
+            cat_data = {table: full_data[table] for table in tables if table in full_data}
+            cat_meta = full_meta.loc[full_meta[metacol.table].astype(str).isin(tables)]
+        else:
+            selection = {"single_excel_only": "", "single_zip_only": "", "selected_excel": tuple(tables)}
+            cat_data, cat_meta = read(read_cat, page, **selection, tables=tuple(re.escape(t) for t in tables))
+        expected = known.index[known[metacol.cat].astype(str) == read_cat]
+        if not expected.isin(cat_meta[metacol.id]).all():
+            full_reads.setdefault(read_cat, page)  # the directory is out of date for this catalogue
+            continue
+        data.update(cat_data)
+        metas.append(cat_meta)
+
+    for read_cat, page in full_reads.items():
+        cat_data, cat_meta = read(read_cat, page)
+        data.update(cat_data)
+        metas.append(cat_meta)
+    return data, concat(metas, axis=0) if metas else DataFrame(columns=[metacol.id, metacol.table])
+
+
+def _select_series(
+    cat: str,
+    identifiers: list[str],
+    cat_data: dict[str, DataFrame],
+    cat_meta: DataFrame,
+    args: dict[str, Any],
+) -> tuple[list[DataFrame], DataFrame]:
+    """Pull the wanted series from a catalogue, with one .loc per table.
+
+    Args:
+        cat: The ABS catalogue ID (for messages)
+        identifiers: The series IDs wanted from this catalogue
+        cat_data: The catalogue's tables, as returned by read_abs_cat()
+        cat_meta: The catalogue's metadata, as returned by read_abs_cat()
+        args: The validated ReadArgs (for verbose and ignore_errors)
+
+    Returns:
+        tuple[list[DataFrame], DataFrame]: A DataFrame of the wanted series
+            from each table, and their metadata indexed by series ID
+
+    Raises:
+        ValueError: If a series is not in the catalogue, and ignore_errors is not set
+
+    """
+    meta = _unique_meta(cat_meta)
+    found = [identifier for identifier in identifiers if identifier in meta.index]
+    for identifier in identifiers:
+        if identifier in meta.index:
+            continue
+        if args["verbose"]:
+            print(f"Series ID {identifier} not found in ABS catalogue ID {cat}")
+        if not args["ignore_errors"]:
+            raise ValueError(f"Series ID {identifier} not found in catalogue {cat}")
+
+    meta = meta.loc[found]
+    return _table_frames(found, meta, cat_data), meta
+
+
+def _unique_meta(cat_meta: DataFrame) -> DataFrame:
+    """Return the metadata with one row per series ID (the first non-null value of each column)."""
+    ids = Index(cat_meta[metacol.id], name=None)
+    if ids.is_unique:
+        return cat_meta.set_axis(ids, axis=0)  # nothing to combine
+    meta = cat_meta.groupby(ids).first()
+    meta.index.name = None
+    return meta
+
+
+def _table_frames(identifiers: list[str], meta: DataFrame, cat_data: dict[str, DataFrame]) -> list[DataFrame]:
+    """Return the wanted series, grouped by table, with one .loc per table.
+
+    Args:
+        identifiers: The series IDs wanted (unique, and all in meta)
+        meta: The metadata, indexed by series ID
+        cat_data: The catalogue's tables, as returned by read_abs_cat()
+
+    Returns:
+        list[DataFrame]: One DataFrame per table, in the order the tables are first needed
+
+    """
+    tables = meta.loc[identifiers, metacol.table].astype(str)
+    return [
+        cat_data[str(table)].loc[:, list(ids)] for table, ids in tables.groupby(tables, sort=False).groups.items()
+    ]
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 
 import re
 from io import BytesIO
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 from pandas import (
     DataFrame,
@@ -17,10 +17,16 @@ from pandas import (
 )
 
 from readabs.download_cache import CacheError, HttpError, get_file
+from readabs.memo import isolated, memo_get, memo_put
+from readabs.output_format import check_output, frame_to_output
 
 # local imports
 from readabs.rba_catalogue import rba_catalogue
 from readabs.rba_meta_data import rba_metacol as rm
+from readabs.read_support import FLOAT_DTYPES, NO_WINDOW, DateLike, date_window, period_mask, to_float_dtype
+
+if TYPE_CHECKING:
+    import polars as pl
 
 # Constants for frequency detection
 MONTHLY_MIN_DAYS = 28
@@ -84,54 +90,17 @@ def _get_excel_file(
     return excel
 
 
-# --- PUBLIC ---
-def read_rba_table(table: str, **kwargs: Any) -> tuple[DataFrame, DataFrame]:  # ignore_errors
-    """Read a table from the RBA website and return the actual data and meta data.
+def _parse_rba_excel(raw: DataFrame, table: str) -> tuple[DataFrame, DataFrame]:
+    """Extract the data (the full history, as read) and the metadata from the sheet of an RBA table.
 
-    Returns the actual data and the meta data in a tuple of two DataFrames.
+    Args:
+        raw: The first sheet of the RBA Excel file, read without a header
+        table: The RBA table moniker, added to the metadata
 
-    Parameters
-    ----------
-    table : str
-        The table to read from the RBA website.
-    **kwargs : Any
-        Additional keyword arguments.
-        The only keyword argument that is used is ignore_errors.
-    ignore_errors : bool = False
-        If True, then any major errors encountered will be printed and the function
-        will return empty DataFrames. If False, then any major errors encountered
-        will raise an exception.
-
-    Returns
-    -------
-    tuple[DataFrame, DataFrame]
-        The primary data and the meta data in a tuple of two DataFrames.
-
-    Examples
-    --------
-    ```python
-    data, meta = read_rba_table("C1")
-    ```
+    Returns:
+        tuple[DataFrame, DataFrame]: The data, with a PeriodIndex, and the metadata
 
     """
-    # set-up
-    ignore_errors = kwargs.get("ignore_errors", False)
-    data, meta = DataFrame(), DataFrame()
-
-    # get the Excel file
-    excel = _get_excel_file(table, ignore_errors=ignore_errors, **kwargs)
-    if excel is None:
-        return data, meta
-
-    # read Excel file into DataFrame
-    try:
-        raw = read_excel(BytesIO(excel), header=None, index_col=None)
-    except Exception as e:
-        if ignore_errors:
-            print(f"Ignoring error: {e}")
-            return data, meta
-        raise
-
     # extract the meta data
     meta = raw.iloc[1:11, :].T.copy()
     meta.columns = Index(meta.iloc[0])
@@ -167,6 +136,122 @@ def read_rba_table(table: str, **kwargs: Any) -> tuple[DataFrame, DataFrame]:  #
     return data, meta
 
 
+# --- PUBLIC ---
+@overload
+def read_rba_table(
+    table: str,
+    *,
+    output: Literal["pandas", "arrow"] = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Any,
+) -> tuple[DataFrame, DataFrame]: ...
+
+
+@overload
+def read_rba_table(
+    table: str,
+    *,
+    output: Literal["polars"],
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Any,
+) -> tuple["pl.DataFrame", "pl.DataFrame"]: ...
+
+
+def read_rba_table(
+    table: str,
+    *,
+    output: str = "pandas",
+    start: DateLike | None = None,
+    end: DateLike | None = None,
+    **kwargs: Any,  # ignore_errors, dtype
+) -> tuple[Any, Any]:
+    """Read a table from the RBA website and return the actual data and meta data.
+
+    Returns the actual data and the meta data in a tuple of two DataFrames.
+
+    Parameters
+    ----------
+    table : str
+        The table to read from the RBA website.
+    **kwargs : Any
+        Additional keyword arguments.
+        The keyword arguments that are used are ignore_errors and dtype.
+    ignore_errors : bool = False
+        If True, then any major errors encountered will be printed and the function
+        will return empty DataFrames. If False, then any major errors encountered
+        will raise an exception.
+    dtype : str = ""
+        If set to one of "float64", "float32" or "auto", the data is converted
+        to floats of that type (see read_abs_cat() for the meaning of "auto").
+        By default, the data is returned as read from the Excel file.
+    output : str = "pandas"
+        One of "pandas", "arrow" or "polars". See read_abs_cat().
+    start : str | Period | date | None = None
+        The first period wanted. See read_abs_cat().
+    end : str | Period | date | None = None
+        The last period wanted. See read_abs_cat(). The table's full
+        history is parsed once per session and held in memory (see
+        clear_caches()); each window is sliced from it before any
+        conversion to floats, which saves the most for the long daily
+        tables (such as A2, F1 and F2).
+
+    Returns
+    -------
+    tuple[DataFrame, DataFrame]
+        The primary data and the meta data in a tuple of two DataFrames.
+        With output="polars", these are Polars DataFrames.
+
+    Examples
+    --------
+    ```python
+    data, meta = read_rba_table("C1")
+    ```
+
+    """
+    # set-up
+    ignore_errors = kwargs.get("ignore_errors", False)
+    dtype = kwargs.pop("dtype", "")
+    if dtype and dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Unexpected dtype '{dtype}'. Valid options are: {list(FLOAT_DTYPES)}")
+    check_output(output)
+    window = date_window(start, end)
+    data, meta = DataFrame(), DataFrame()
+
+    # the full history is parsed once per session, and any date window is sliced from it
+    key = ("read_rba_table", table)
+    cached = memo_get(key)
+    if cached is None:
+        # get the Excel file
+        excel = _get_excel_file(table, ignore_errors=ignore_errors, **kwargs)
+        if excel is None:
+            return frame_to_output(data, output), frame_to_output(meta, output)
+
+        # read Excel file into DataFrame
+        try:
+            raw = read_excel(BytesIO(excel), header=None, index_col=None)
+        except Exception as e:
+            if ignore_errors:
+                print(f"Ignoring error: {e}")
+                return frame_to_output(data, output), frame_to_output(meta, output)
+            raise
+
+        parsed = _parse_rba_excel(raw, table)
+        memo_put(key, parsed)
+        cached = isolated(parsed)
+    data, meta = cached
+
+    # keep only the periods in the date window, before any conversion to floats
+    if window != NO_WINDOW:
+        data = data.loc[period_mask(cast("PeriodIndex", data.index), window)]
+
+    if dtype:
+        data = to_float_dtype(data, dtype)
+
+    return frame_to_output(data, output), frame_to_output(meta, output)
+
+
 def read_rba_ocr(*, monthly: bool = True, **kwargs: Any) -> Series:  # ignore_errors
     """Read the Official Cash Rate (OCR) from the RBA website.
 
@@ -198,8 +283,8 @@ def read_rba_ocr(*, monthly: bool = True, **kwargs: Any) -> Series:  # ignore_er
 
     """
     # read the OCR table from the RBA website, make float and sort, name the series
-    rba, _rba_meta = read_rba_table("A2", **kwargs)  # should have a daily PeriodIndex
-    ocr_series = rba.loc[lambda x: x.index >= "1990-08-02", "ARBAMPCNCRT"]
+    rba, _rba_meta = read_rba_table("A2", start="1990-08-02", **kwargs)  # should have a daily PeriodIndex
+    ocr_series = rba["ARBAMPCNCRT"]
     ocr = ocr_series.astype(float).sort_index()  # pyright: ignore[reportAttributeAccessIssue]
     ocr.name = "RBA Official Cash Rate"
 
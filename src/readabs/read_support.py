@@ -5,10 +5,22 @@ used across ABS data reading functions. It ensures consistent parameter handling
 and validates that at least one data source option is enabled.
 """
 
-from typing import Any, NotRequired, TypedDict
+import re
+from datetime import date
+from typing import Any, NotRequired, TypedDict, cast
+
+import numpy as np
+from pandas import DataFrame, Period, PeriodIndex, Timestamp
 
 # Constants
 HYPHEN = "---"
+FLOAT_DTYPES = ("float64", "float32", "auto")  # valid values for the dtype argument
+MAX_PUBLISHED_DECIMALS = 6  # beyond this, a column is assumed to need float64
+
+# Types for the start and end arguments
+DateLike = str | Period | date  # eg. "2010", "2010-03", "2010Q1", a Period or a Timestamp
+Window = tuple[Timestamp | None, Timestamp | None]  # first and last moments wanted
+NO_WINDOW: Window = (None, None)
 
 
 class ReadArgs(TypedDict):
@@ -22,10 +34,12 @@ class ReadArgs(TypedDict):
     single_zip_only: NotRequired[str]
     single_excel_only: NotRequired[str]
     selected_excel: NotRequired[tuple[str, ...]]
+    tables: NotRequired[tuple[str, ...]]
     history: NotRequired[str]
     cache_only: NotRequired[bool]
     keep_non_ts: NotRequired[bool]
     zip_file: NotRequired[str]
+    dtype: NotRequired[str]
 
 
 # Default values for all supported arguments
@@ -40,10 +54,12 @@ DEFAULTS: ReadArgs = {
     "single_zip_only": "",
     "single_excel_only": "",
     "selected_excel": (),
+    "tables": (),
     "history": "",
     "cache_only": False,
     "keep_non_ts": False,
     "zip_file": "",
+    "dtype": "float64",
 }
 
 # Arguments that enable data retrieval (at least one must be True/non-empty)
@@ -59,6 +75,11 @@ _DATA_SOURCE_ARGS = [
 # Valid kwargs are exactly the ReadArgs keys; 'url' is an explicit parameter, not a kwarg
 _VALID_KWARGS = set(DEFAULTS.keys())
 
+# Arguments that change how a reader reports progress, or where it looks first,
+# but not the data it returns - these are left out of memo keys. ignore_errors
+# is kept in: a read that swallows its errors may return only part of the data.
+NON_RESULT_ARGS = ("verbose", "cache_only")
+
 
 def check_kwargs(kwargs: ReadArgs, name: str) -> None:
     """Warn if there are any invalid keyword arguments.
@@ -94,7 +115,7 @@ def get_args(kwargs: ReadArgs, name: str) -> dict[str, Any]:
         dict[str, Any]: Dictionary containing validated arguments with defaults
 
     Raises:
-        ValueError: If no data source options are enabled
+        ValueError: If no data source options are enabled, or the dtype or a table pattern is invalid
         TypeError: If inputs are not the correct type
 
     """
@@ -103,7 +124,7 @@ def get_args(kwargs: ReadArgs, name: str) -> dict[str, Any]:
         raise TypeError("Function name must be a string")
 
     # Apply defaults for all known arguments
-    args = {key: kwargs.get(key, default_value) for key, default_value in DEFAULTS.items()}
+    args: dict[str, Any] = {key: kwargs.get(key, default_value) for key, default_value in DEFAULTS.items()}
 
     # Check that at least one data source option is enabled
     has_zip = args["get_zip"]
@@ -118,4 +139,145 @@ def get_args(kwargs: ReadArgs, name: str) -> dict[str, Any]:
             f"{name}(): At least one data source option must be enabled. Options are: {_DATA_SOURCE_ARGS}"
         )
 
+    if isinstance(args["tables"], str):
+        args["tables"] = (args["tables"],)
+    for pattern in args["tables"]:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"{name}(): Invalid table pattern '{pattern}': {e}") from e
+
+    if args["dtype"] not in FLOAT_DTYPES:
+        raise ValueError(f"{name}(): Unexpected dtype '{args['dtype']}'. Valid options are: {list(FLOAT_DTYPES)}")
+
     return args
+
+
+def result_key(
+    named: dict[str, Any],
+    kwargs: dict[str, Any],
+    name: str = "result_key",
+) -> tuple[tuple[str, Any], ...]:
+    """Return a hashable key of the arguments that affect the result of a reader.
+
+    The ReadArgs keyword arguments are normalised (defaults applied, a single
+    table pattern made a tuple, a zip file path made a string), so that
+    equivalent calls share a key. Unknown keyword arguments, which the
+    readers ignore, and the NON_RESULT_ARGS are left out.
+
+    Args:
+        named: The reader's named arguments (eg. cat, url, layout)
+        kwargs: The ReadArgs keyword arguments
+        name: Name of the calling function for error messages
+
+    Returns:
+        tuple[tuple[str, Any], ...]: The sorted (name, value) pairs
+
+    Raises:
+        ValueError: If the keyword arguments are invalid (see get_args)
+
+    """
+    args = get_args(cast("ReadArgs", kwargs), name)
+    args["zip_file"] = str(args["zip_file"])
+    merged = {**named, **args}
+    if isinstance(merged.get("cat"), str):
+        merged["cat"] = merged["cat"].strip()
+    return tuple(sorted((name, value) for name, value in merged.items() if name not in NON_RESULT_ARGS))
+
+
+def _float32_is_lossless(values: np.ndarray) -> bool:
+    """Check whether float32 round-trips the published precision of the values.
+
+    The published precision is taken to be the fewest decimal places (up to
+    MAX_PUBLISHED_DECIMALS) that reproduce every finite value exactly. The
+    values are lossless in float32 if, once narrowed and rounded back to that
+    many decimal places, they are unchanged.
+    """
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return True
+    if np.abs(values).max() > np.finfo(np.float32).max:
+        return False
+    narrowed = values.astype(np.float32).astype(np.float64)
+    for decimals in range(MAX_PUBLISHED_DECIMALS + 1):
+        if np.array_equal(np.round(values, decimals), values):
+            return np.array_equal(np.round(narrowed, decimals), values)
+    return False
+
+
+def to_float_dtype(data: DataFrame, dtype: str) -> DataFrame:
+    """Return the data with every column converted to the requested float dtype.
+
+    Args:
+        data: DataFrame of numeric (or numeric-like) values
+        dtype: One of "float64", "float32" or "auto". With "auto", each column
+            is stored as float32 where that loses none of its published
+            precision, and as float64 otherwise.
+
+    Returns:
+        DataFrame: The converted data
+
+    Raises:
+        ValueError: If the dtype is not recognised
+
+    """
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Unexpected dtype '{dtype}'. Valid options are: {list(FLOAT_DTYPES)}")
+
+    data = data.astype(np.float32 if dtype == "float32" else np.float64)
+    if dtype == "auto":
+        narrow = [label for label, column in data.items() if _float32_is_lossless(column.to_numpy())]
+        data = data.astype(dict.fromkeys(narrow, np.float32))
+    return data
+
+
+def date_window(start: DateLike | None, end: DateLike | None) -> Window:
+    """Return the first and last moments covered by the start and end arguments.
+
+    A string is read as a Period, so start="2010" begins on 1 January 2010
+    and end="2015" finishes at the end of 31 December 2015. Likewise for a
+    Period. A date or a Timestamp is used as is. None leaves that end of
+    the window open.
+
+    Raises:
+        ValueError: If a bound cannot be parsed, or start is after end
+
+    """
+
+    def bound(value: DateLike | None, *, first: bool) -> Timestamp | None:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = Period(value)
+        if isinstance(value, Period):
+            return value.start_time if first else value.end_time
+        return Timestamp(value)
+
+    window = bound(start, first=True), bound(end, first=False)
+    if window[0] is not None and window[1] is not None and window[0] > window[1]:
+        raise ValueError(f"The start ({start}) is after the end ({end}).")
+    return window
+
+
+def window_ordinals(freq: str, window: Window) -> tuple[int | None, int | None]:
+    """Return the first and last period ordinals of a frequency inside the window.
+
+    A period is inside the window if any part of it falls inside the window.
+    """
+    first, last = window
+    return (
+        None if first is None else Period(first, freq=freq).ordinal,
+        None if last is None else Period(last, freq=freq).ordinal,
+    )
+
+
+def period_mask(index: PeriodIndex, window: Window) -> np.ndarray:
+    """Return a boolean mask of the periods in the index that fall inside the window."""
+    ordinals = index.astype("int64").to_numpy()
+    first, last = window_ordinals(index.freqstr, window)
+    mask = np.ones(len(ordinals), dtype=bool)
+    if first is not None:
+        mask &= ordinals >= first
+    if last is not None:
+        mask &= ordinals <= last
+    return mask
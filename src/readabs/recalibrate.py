@@ -6,7 +6,6 @@ from operator import mul, truediv
 from typing import Any
 
 import numpy as np
-from pandas import DataFrame, Series
 
 from readabs.datatype import Datatype as DataT
 
@@ -58,19 +57,11 @@ def recalibrate(
     ```
 
     """
+    from pandas import DataFrame, Series  # noqa: PLC0415 - recalibrate_value() does without pandas
+
     if not isinstance(data, (Series, DataFrame)):
         raise TypeError("data must be a Series or DataFrame")
-    units, restore_name = _prepare_units(units)
-    flat_data = data.to_numpy().flatten()
-    flat_data, units = _recalibrate(flat_data, units)
-
-    if restore_name:
-        units = f"{restore_name} {units}"
-        for n in "numbers", "number":
-            if n in units:
-                units = units.replace(n, "").strip()
-                break
-    units = units.title()
+    flat_data, units = _recalibrate_flat(data.to_numpy().flatten(), units)
 
     result = data.__class__(flat_data.reshape(data.shape))
     result.index = data.index
@@ -112,9 +103,8 @@ def recalibrate_value(value: float, units: str) -> tuple[float, str]:
     ```
 
     """
-    series = Series([value])
-    output, units = recalibrate(series, units)
-    return output.to_numpy()[0], units
+    output, units = _recalibrate_flat(np.asarray([value]), units)
+    return output[0], units
 
 
 # --- private
@@ -137,6 +127,20 @@ _keywords = {
 _r_keywords = {v: k for k, v in _keywords.items()}
 
 
+def _recalibrate_flat(flat_data: np.ndarray, units: str) -> tuple[np.ndarray, str]:
+    """Recalibrate a flat array of data, and return it with the (title case) units."""
+    units, restore_name = _prepare_units(units)
+    flat_data, units = _recalibrate(flat_data, units)
+
+    if restore_name:
+        units = f"{restore_name} {units}"
+        for n in "numbers", "number":
+            if n in units:
+                units = units.replace(n, "").strip()
+                break
+    return flat_data, units.title()
+
+
 def _prepare_units(units: str) -> tuple[str, str]:
     """Prepare the units for recalibration."""
     substitutions = [
@@ -250,6 +254,7 @@ def _do_recal(
 
 # --- test
 if __name__ == "__main__":
+    from pandas import Series
 
     def test_example() -> None:
         """Test the example in the docstring."""
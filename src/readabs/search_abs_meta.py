@@ -4,22 +4,115 @@ Using a dictionary of search terms, identify the row or rows that match
 all of the search terms.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
+import numpy as np
 from pandas import DataFrame, Index
 
 # local imports
 from readabs.abs_meta_data import metacol as mc
+from readabs.meta_index import FUZZY_COLUMNS, MetaIndex
 from readabs.read_abs_cat import read_abs_cat
 
+# --- constants
+SCORE = "Score"  # the column of similarity scores added by a fuzzy search
 
+
+# --- private
+def _scan(
+    meta: DataFrame, search_terms: dict[str, str], *, exact_match: bool, regex: bool, verbose: bool
+) -> np.ndarray:
+    """Return the positions of the rows that match all of the search terms, by scanning the metadata.
+
+    Each term only scans the rows that matched the terms before it. This is
+    the quicker path for a one-off search (a MetaIndex pays off when the
+    same metadata is searched again).
+    """
+    positions = np.arange(len(meta))
+    for phrase, column in search_terms.items():
+        if verbose:
+            print(f"Searching {len(positions)}: term: {phrase} in-column: {column}")
+        values = meta[column].iloc[positions]
+        pick_me = (
+            (values == phrase) if (exact_match or column == mc.table) else values.str.contains(phrase, regex=regex)
+        )
+        positions = positions[pick_me.fillna(value=False).to_numpy(dtype=bool)]
+        if verbose:
+            print(f"In find_rows() have found {len(positions)}")
+    return positions
+
+
+def _index_search(
+    index: MetaIndex, search_terms: dict[str, str], *, exact_match: bool, regex: bool, verbose: bool
+) -> np.ndarray:
+    """Return the positions of the rows that match all of the search terms, from a MetaIndex."""
+    if not verbose:
+        return index.search(search_terms, exact_match=exact_match, regex=regex)
+    selected = np.ones(len(index), dtype=bool)
+    for phrase, column in search_terms.items():
+        print(f"Searching {selected.sum()}: term: {phrase} in-column: {column}")
+        selected &= index.mask(phrase, column, exact_match=exact_match, regex=regex)
+        print(f"In find_rows() have found {selected.sum()}")
+    return np.flatnonzero(selected)
+
+
+def _fuzzy_search(
+    index: MetaIndex,
+    search_terms: dict[str, str],
+    *,
+    top_k: int,
+    exact_match: bool,
+    regex: bool,
+    verbose: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the positions of the best-scoring rows (one per series ID, best first), and their scores.
+
+    The terms on the fuzzy columns are scored; the other terms filter the rows as usual.
+
+    Raises:
+        ValueError: If there is no search term on a fuzzy column, or top_k is less than 1
+
+    """
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, not {top_k}.")
+    scored = {phrase: column for phrase, column in search_terms.items() if column in FUZZY_COLUMNS}
+    if not scored:
+        raise ValueError(f"A fuzzy search needs a search term on one of the columns {FUZZY_COLUMNS}.")
+    filters = {phrase: column for phrase, column in search_terms.items() if column not in FUZZY_COLUMNS}
+    positions = _index_search(index, filters, exact_match=exact_match, regex=regex, verbose=verbose)
+    scores = np.mean([index.scores(phrase, column)[positions] for phrase, column in scored.items()], axis=0)
+    id_codes = index.column(mc.id).codes[positions]
+
+    # rank only the best-scoring rows (all of those tied at the cut), widening until top_k series are found
+    positive = np.flatnonzero(scores > 0)
+    wanted = 2 * top_k
+    while True:
+        top = positive
+        if wanted < len(positive):
+            cut = np.partition(scores[positive], len(positive) - wanted)[len(positive) - wanted]
+            top = positive[scores[positive] >= cut]
+        ranked = top[np.lexsort((top, -scores[top]))]  # best first; ties stay in metadata order
+        _codes, first = np.unique(id_codes[ranked], return_index=True)
+        if len(first) >= top_k or len(top) == len(positive):
+            break
+        wanted *= 4
+    best = ranked[np.sort(first)[:top_k]]
+    if verbose:
+        print(f"Scored {len(positions)} rows on {list(scored)}; kept the best {len(best)}.")
+    return positions[best], scores[best]
+
+
+# --- public
 def search_abs_meta(
-    meta: DataFrame,  # sourced from read_abs_series() or read_abs_cat()
+    meta: DataFrame | MetaIndex,  # sourced from read_abs_series() or read_abs_cat()
     search_terms: dict[str, str],  # {search_term: meta_data_column_name, ...}
     *,
     exact_match: bool = False,
     regex: bool = False,
     validate_unique: bool = False,  # useful safety-net if you expect only one match
+    fuzzy: bool = False,
+    top_k: int = 10,
     **kwargs: Any,  # verbose flag
 ) -> DataFrame:
     """Extract from the ABS meta data those rows that match the search_terms.
@@ -28,9 +121,12 @@ def search_abs_meta(
 
     Parameters
     ----------
-    meta : DataFrame
+    meta : DataFrame | MetaIndex
         A pandas DataFrame of metadata from the ABS
-        (via read_abs_cat() or read_abs_series()).
+        (via read_abs_cat() or read_abs_series()), or a MetaIndex built
+        over it. Build a MetaIndex once when searching the same metadata
+        many times: each distinct search term is then answered from the
+        index, rather than by scanning the metadata again.
     search_terms : dict[str, str]
         A dictionary {search_phrase: meta_column_name, ...} of search terms.
         Note: the search terms must be unique, as a dictionary cannot hold the
@@ -41,6 +137,17 @@ def search_abs_meta(
         Whether to use regular expressions in the search.
     validate_unique : bool = False
         Raise a ValueError if the search result is not unique.
+    fuzzy : bool = False
+        Rank the rows by their similarity to the search terms on the
+        Data Item Description and Table Description columns, rather than
+        requiring a match. The similarity is measured on word trigrams, so
+        it ignores case, punctuation, and the order of words, and tolerates
+        misspellings. Search terms on other columns still filter the rows,
+        as for an ordinary search (using exact_match and regex). There
+        must be at least one search term on a fuzzy column. The trigram
+        index is kept in a MetaIndex, so pass one for repeated searches.
+    top_k : int = 10
+        With fuzzy, the greatest number of rows (series) to return.
     **kwargs : Any
         Additional keyword arguments. The only keyword argument
         that is used is verbose.
@@ -55,7 +162,10 @@ def search_abs_meta(
         Note, The index for the returned meta data will always comprise ABS
         series_ids. Duplicate indexes will be removed from the meta data
         (ie. where the same ABS series appears in more than one table, this
-        function will only report the first match).
+        function will only report the first match). With fuzzy, the rows are
+        ordered best first, and have an added "Score" column (from 0 to 1,
+        the mean similarity to the fuzzy search terms); rows with no
+        trigram in common are dropped.
 
     Metacol
     -------
@@ -68,7 +178,7 @@ def search_abs_meta(
     -------
     ```python
     from readabs import metacol as mc  # alias for the ABS meta data column names
-    from readabs import read_abs_cat, search_abs_meta
+    from readabs import MetaIndex, read_abs_cat, search_abs_meta
     cat_num = "6202.0"  # The ABS labour force survey
     data, meta = read_abs_cat(cat_num)
     search_terms = {
@@ -80,6 +190,11 @@ def search_abs_meta(
     }
     rows = search_abs_meta(meta, search_terms, verbose=True)
     print(rows)  # should have three rows : FT/PT/All Unemployment rates
+
+    # trial searches: rank the candidates, tolerating misspellings
+    meta_index = MetaIndex(meta)
+    candidates = search_abs_meta(meta_index, {"unemploymnet rate persons": mc.did}, fuzzy=True, top_k=5)
+    print(candidates[[mc.did, mc.stype, "Score"]])
     ```
 
     """
@@ -87,28 +202,29 @@ def search_abs_meta(
     verbose = kwargs.get("verbose", False)
 
     # establish the starting point
-    meta_select = meta.copy()  # preserve the original meta data
     if verbose:
         print(f"In search_abs_meta() {exact_match=} {regex=} {verbose=}")
-        print(f"In search_abs_meta() starting with {len(meta_select)} rows in the meta_data.")
-
-    # iteratively search
-    for phrase, column in search_terms.items():
-        if verbose:
-            print(f"Searching {len(meta_select)}: term: {phrase} in-column: {column}")
-
-        pick_me = (
-            (meta_select[column] == phrase)
-            if (exact_match or column == mc.table)
-            else meta_select[column].str.contains(phrase, regex=regex)
+        print(f"In search_abs_meta() starting with {len(meta)} rows in the meta_data.")
+    scores = None
+    if fuzzy:
+        index = meta if isinstance(meta, MetaIndex) else MetaIndex(meta)
+        frame = index.meta
+        positions, scores = _fuzzy_search(
+            index, search_terms, top_k=top_k, exact_match=exact_match, regex=regex, verbose=verbose
         )
-        meta_select = meta_select[pick_me]
-        if verbose:
-            print(f"In find_rows() have found {len(meta_select)}")
-
-    # search complete - check results - and return
-    meta_select.index = Index(meta_select[mc.id])
+    elif isinstance(meta, MetaIndex):
+        frame = meta.meta
+        positions = _index_search(meta, search_terms, exact_match=exact_match, regex=regex, verbose=verbose)
+    else:
+        frame = meta
+        positions = _scan(meta, search_terms, exact_match=exact_match, regex=regex, verbose=verbose)
+
+    # search complete - keep the first row for each series ID - check results - and return
+    meta_select = frame.iloc[positions]
+    meta_select = meta_select.set_axis(Index(meta_select[mc.id]), axis=0)
     meta_select = meta_select[~meta_select.index.duplicated(keep="first")]
+    if scores is not None:
+        meta_select = meta_select.assign(**{SCORE: scores})
 
     if verbose:
         print(f"Final selection is {len(meta_select)} rows.")
@@ -123,7 +239,7 @@ def search_abs_meta(
 
 
 def find_abs_id(
-    meta: DataFrame,
+    meta: DataFrame | MetaIndex,
     search_terms: dict[str, str],
     **kwargs: Any,
 ) -> tuple[str, str, str]:  # table, series_id, units
@@ -131,9 +247,10 @@ def find_abs_id(
 
     Parameters
     ----------
-    meta : DataFrame
+    meta : DataFrame | MetaIndex
         A pandas DataFrame of metadata from the ABS
-        (via read_abs_cat() or read_abs_series()).
+        (via read_abs_cat() or read_abs_series()), or a MetaIndex built
+        over it (see search_abs_meta()).
     search_terms : dict[str, str]
         A dictionary {search_phrase: meta_column_name, ...} of search terms.
         Note: the search terms must be unique, as a dictionary cannot hold the
@@ -187,6 +304,86 @@ def find_abs_id(
     return table, series_id, units
 
 
+def find_abs_ids(
+    meta: DataFrame | MetaIndex,
+    selectors: Iterable[dict[str, str]],
+    *,
+    exact_match: bool = False,
+    regex: bool = False,
+    validate_unique: bool = True,
+) -> tuple[list[tuple[str, str, str] | None], dict[int, ValueError]]:
+    """Find the ABS series identifiers for many selectors at once.
+
+    This is the batched form of find_abs_id(). The metadata is indexed
+    once (see MetaIndex), and each distinct {search_phrase: column} term is
+    evaluated once, as a boolean mask over the rows, however many selectors
+    share it. Each selector's masks are then combined. A selector that
+    cannot be resolved does not stop the others: its problem is reported
+    in the errors.
+
+    Parameters
+    ----------
+    meta : DataFrame | MetaIndex
+        A pandas DataFrame of metadata from the ABS
+        (via read_abs_cat() or read_abs_series()), or a MetaIndex built
+        over it.
+    selectors : Iterable[dict[str, str]]
+        The selectors, each a dictionary {search_phrase: meta_column_name, ...}
+        of search terms, as for find_abs_id().
+    exact_match : bool = False
+        Whether to match using == (exact) or a substring search, as for
+        search_abs_meta().
+    regex : bool = False
+        Whether to use regular expressions in the search.
+    validate_unique : bool = True
+        Report a selector that matches more than one series as an error.
+        Otherwise, the first series found is used.
+
+    Returns
+    -------
+    tuple[list[tuple[str, str, str] | None], dict[int, ValueError]]
+        For each selector, in order, the (table, series_id, units) of its
+        series, or None if it could not be resolved; and a dictionary of the
+        ValueError for each selector that could not be resolved (no match,
+        or more than one series), keyed by its position.
+
+    Example
+    -------
+    ```python
+    from readabs import metacol as mc
+    from readabs import read_abs_meta, find_abs_ids
+    meta = read_abs_meta("6202.0")
+    selectors = [
+        {"Unemployment rate ;  Persons ;": mc.did, "Seasonally Adjusted": mc.stype},
+        {"Employed total ;  Persons ;": mc.did, "Seasonally Adjusted": mc.stype},
+    ]
+    found, errors = find_abs_ids(meta, selectors)
+    for position, error in errors.items():
+        print(f"Selector {position}: {error}")
+    ```
+
+    """
+    index = meta if isinstance(meta, MetaIndex) else MetaIndex(meta)
+    id_codes = index.column(mc.id).codes
+    tables = index.meta[mc.table].to_numpy()
+    ids = index.meta[mc.id].to_numpy()
+    units = index.meta[mc.unit].to_numpy()
+
+    found: list[tuple[str, str, str] | None] = []
+    errors: dict[int, ValueError] = {}
+    for position, search_terms in enumerate(selectors):
+        rows = index.search(search_terms, exact_match=exact_match, regex=regex)
+        n_series = len(np.unique(id_codes[rows]))
+        if n_series == 0 or (validate_unique and n_series > 1):
+            problem = "no series matches" if n_series == 0 else f"{n_series} series match"
+            errors[position] = ValueError(f"Selector {position} ({search_terms}): {problem}; expected one.")
+            found.append(None)
+            continue
+        first = rows[0]
+        found.append((tables[first], ids[first], units[first]))
+    return found, errors
+
+
 if __name__ == "__main__":
 
     def test_search_abs_meta() -> None:
@@ -0,0 +1,267 @@
+"""series_directory.py - a persistent directory of the ABS series that have been read.
+
+Each time an ABS catalogue is read (with read_abs_cat(), read_abs_meta(),
+or the readers built on them), the Index-sheet metadata is added to a
+directory of series, kept in the readabs cache directory. The directory
+maps each Series ID to the catalogue, table and workbook URL it came from,
+and to its description, unit, frequency and series type. So, once a
+catalogue has been read, its series can be found again by ID without
+knowing (or downloading) the catalogue.
+
+The directory is updated incrementally: the rows for the tables that were
+read replace any earlier rows for those tables (and, when a whole
+catalogue is read, all of its earlier rows). If those rows are unchanged,
+as when a catalogue is read again between releases, nothing is written.
+Reads of a local zip file, or of a historical release, are not added. The
+file is a pickled DataFrame, indexed by Series ID, and is replaced
+atomically when it is written. It is held in memory once loaded, and
+reloaded if another process changes it.
+"""
+
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import cast
+
+import pandas as pd
+from pandas import DataFrame, Series
+from pandas.api.types import union_categoricals
+
+from readabs.abs_meta_data import metacol
+from readabs.download_cache import READABS_CACHE_PATH
+from readabs.memo import isolated
+
+# --- constants
+DIRECTORY_PATH = READABS_CACHE_PATH / "series-directory.pkl"
+WORKBOOK_URL = "Workbook URL"  # the Excel or zip file the series was read from
+LANDING_PAGE = "Landing Page"  # the url= given for a discontinued catalogue, otherwise ""
+DIRECTORY_COLUMNS = (
+    metacol.cat,
+    metacol.table,
+    WORKBOOK_URL,
+    LANDING_PAGE,
+    metacol.did,
+    metacol.unit,
+    metacol.freq,
+    metacol.stype,
+    metacol.tdesc,
+)
+CATEGORICAL_COLUMNS = (
+    metacol.cat,
+    metacol.table,
+    WORKBOOK_URL,
+    LANDING_PAGE,
+    metacol.unit,
+    metacol.freq,
+    metacol.stype,
+)
+
+
+# --- private
+@dataclass(slots=True)
+class _Held:
+    """The directory as last loaded or written, with the file's (mtime, size) at that time."""
+
+    frame: DataFrame | None = None
+    stamp: tuple[int, int] | None = None
+
+
+_lock = threading.Lock()
+_held = _Held()
+
+
+def _empty() -> DataFrame:
+    """Return an empty directory."""
+    return _typed(DataFrame(columns=list(DIRECTORY_COLUMNS), index=pd.Index([], name=metacol.id)))
+
+
+def _typed(frame: DataFrame) -> DataFrame:
+    """Return the directory with its repetitive columns as categoricals, for compact storage and fast filtering."""
+    return frame.astype(dict.fromkeys(CATEGORICAL_COLUMNS, "category"))
+
+
+def _stacked(kept: DataFrame, rows: DataFrame) -> DataFrame:
+    """Stack new rows under the rows kept, uniting the categories rather than encoding every value again."""
+    if kept.empty:
+        return rows
+    columns = {
+        column: union_categoricals([kept[column].array, rows[column].array])
+        if column in CATEGORICAL_COLUMNS
+        else pd.concat([kept[column], rows[column]], ignore_index=True).array
+        for column in DIRECTORY_COLUMNS
+    }
+    return DataFrame(columns, index=kept.index.append(rows.index))
+
+
+def _unchanged(old: DataFrame, new: DataFrame) -> bool:
+    """Check whether the rows to be replaced hold the same series and values as the new rows, in any order."""
+    if len(old) != len(new) or not old.index.isin(new.index).all():
+        return False
+    columns = list(DIRECTORY_COLUMNS)
+    return old.loc[new.index, columns].astype(str).equals(new[columns].astype(str))
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """Return the modification time and size of the directory file, or None if there is none."""
+    try:
+        status = path.stat()
+    except OSError:
+        return None
+    return status.st_mtime_ns, status.st_size
+
+
+def _load() -> DataFrame:
+    """Return the directory, from memory if the file has not changed since it was loaded (the lock must be held).
+
+    A missing or unreadable file gives an empty directory.
+    """
+    stamp = _stamp(DIRECTORY_PATH)
+    if _held.frame is not None and stamp == _held.stamp:
+        return _held.frame
+    frame = _empty()
+    if stamp is not None:
+        try:
+            with DIRECTORY_PATH.open("rb") as file:
+                loaded = pickle.load(file)  # noqa: S301 - our own cache file
+            if isinstance(loaded, DataFrame) and set(DIRECTORY_COLUMNS).issubset(loaded.columns):
+                frame = loaded
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+            pass  # a damaged file is rebuilt as catalogues are read
+    _held.frame, _held.stamp = frame, stamp
+    return frame
+
+
+def _save(frame: DataFrame) -> None:
+    """Write the directory to a temporary file, then move it into place (the lock must be held)."""
+    DIRECTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(dir=DIRECTORY_PATH.parent, prefix=".series-directory-", delete=False) as file:
+        pickle.dump(frame, file, protocol=pickle.HIGHEST_PROTOCOL)
+    Path(file.name).replace(DIRECTORY_PATH)
+    _held.frame, _held.stamp = frame, _stamp(DIRECTORY_PATH)
+
+
+# --- public
+def update_directory(
+    meta: DataFrame,
+    sources: dict[str, str] | None = None,
+    page: str = "",
+    *,
+    complete: bool = False,
+    verbose: bool = False,
+) -> None:
+    """Add the series in the metadata for a catalogue to the directory, and save it if it has changed.
+
+    Args:
+        meta: The metadata from read_abs_cat() or read_abs_meta(), for one catalogue
+        sources: The workbook URL for each table name, if known
+        page: The landing page URL, if one was given for the catalogue
+        complete: True if the whole catalogue was read, so that rows for tables
+            that are no longer published are dropped as well
+        verbose: Report a directory that cannot be saved
+
+    """
+    if meta.empty or metacol.id not in meta.columns:
+        return
+    rows = meta.reindex(columns=list(DIRECTORY_COLUMNS)).drop(columns=[WORKBOOK_URL, LANDING_PAGE])
+    rows.index = pd.Index(meta[metacol.id].astype(str), name=metacol.id)
+    rows = rows[~rows.index.duplicated(keep="first")]
+    tables = rows[metacol.table].astype(str)
+    rows.insert(2, WORKBOOK_URL, tables.map(sources or {}).fillna("").to_numpy())
+    rows.insert(3, LANDING_PAGE, page)
+    cats = set(rows[metacol.cat].astype(str))
+
+    rows = _typed(rows.fillna("").astype(str))
+
+    with _lock:
+        held = _load()
+        replaced = held[metacol.cat].astype(str).isin(cats)
+        if not complete:
+            replaced &= held[metacol.table].astype(str).isin(tables)
+        stale = held.index.isin(rows.index) | replaced.to_numpy()
+        if _unchanged(held.loc[stale], rows):
+            return  # a repeat read of an unchanged catalogue: nothing to write
+        frame = _stacked(held.loc[~stale], rows)
+        try:
+            _save(frame)
+        except OSError as error:
+            _held.frame = frame  # keep it for this session, at least
+            if verbose:
+                print(f"update_directory(): could not save the series directory: {error}")
+
+
+def lookup_series(series_id: str) -> Series:
+    """Return the directory entry for an ABS Series ID.
+
+    The directory holds every series from the ABS catalogues that have
+    been read (with read_abs_cat(), read_abs_meta(), read_abs_series(),
+    etc.), and is kept in the readabs cache directory, so it persists
+    between sessions.
+
+    Parameters
+    ----------
+    series_id : str
+        The ABS Series ID (eg. "A84423050A").
+
+    Returns
+    -------
+    Series
+        The catalogue number, table, workbook URL, landing page (if one
+        was given for a discontinued catalogue), data item description,
+        unit, frequency, series type and table description for the series.
+
+    Raises
+    ------
+    KeyError
+        If the series is not in the directory (its catalogue has not been read).
+
+    Example
+    -------
+    ```python
+    import readabs as ra
+    entry = ra.lookup_series("A84423050A")
+    print(entry[ra.metacol.cat], entry[ra.metacol.table])
+    ```
+
+    """
+    with _lock:
+        frame = _load()
+    key = series_id.strip()
+    if key not in frame.index:
+        raise KeyError(f"Series ID {key} is not in the series directory; read its catalogue first.")
+    return cast("Series", frame.loc[key])
+
+
+def directory(cat: str | None = None) -> DataFrame:
+    """Return the directory of the ABS series that have been read, indexed by Series ID.
+
+    The catalogue, table, workbook URL, landing page, unit, frequency and
+    series type columns are categorical, so filtering on them is fast.
+
+    Parameters
+    ----------
+    cat : str | None = None
+        If given, only the series from this ABS catalogue number are returned.
+
+    Returns
+    -------
+    DataFrame
+        One row per series, with the columns described in lookup_series().
+        Each call gets its own copy-on-write view.
+
+    Example
+    -------
+    ```python
+    import readabs as ra
+    from readabs import metacol as mc
+    found = ra.directory()
+    monthly_rates = found[(found[mc.freq] == "Month") & (found[mc.unit] == "Percent")]
+    ```
+
+    """
+    with _lock:
+        frame = _load()
+    if cat is not None:
+        frame = frame.loc[frame[metacol.cat] == cat.strip()]
+    return isolated(frame)
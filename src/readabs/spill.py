@@ -0,0 +1,158 @@
+"""spill.py - hold DataFrames within a memory limit by spilling them to disk.
+
+The readers use this for their memory_limit= option. Each workbook is parsed
+on its own, and the finished tables go into a SpilledFrames mapping. Tables
+stay in memory while they fit within the limit, less some headroom for
+parsing the next workbook (at least half of the limit, or a few times the
+size of the largest workbook seen so far). After that, they are written to
+a scratch directory and loaded back lazily, when they are looked up.
+
+Tables of a single float dtype are written as NumPy .npy files in column
+order, and are memory-mapped when loaded, so a lookup reads only the pages
+that are used. Anything else (for example, raw Excel sheets of mixed
+Python objects) is pickled. The scratch directory is removed when the
+mapping is garbage collected.
+"""
+
+import pickle
+import re
+from collections.abc import Callable, Iterator, Mapping
+from copy import copy
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame
+
+# --- constants
+SCRATCH_PREFIX = "readabs-spill-"
+BYTE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+RESIDENT_SHARE = 0.5  # at most, the share of the memory limit for tables kept in memory
+WORKING_SET_FACTOR = 6  # parsing a workbook peaks at about 5 times the size of its raw sheets
+
+
+# --- public
+def parse_bytes(size: int | str) -> int:
+    """Return a number of bytes from an int, or a string like "512MB" or "2 GB".
+
+    Raises:
+        ValueError: If the size cannot be understood, or is not positive
+
+    """
+    if isinstance(size, str):
+        match = re.fullmatch(r"\s*([0-9]+(?:\.[0-9]*)?)\s*([KMG]?)B?\s*", size.upper())
+        if match is None:
+            raise ValueError(f"Cannot understand the size '{size}'; try eg. '512MB' or '2GB'.")
+        size = int(float(match.group(1)) * BYTE_UNITS[match.group(2)])
+    if size <= 0:
+        raise ValueError(f"The size must be positive, not {size}.")
+    return size
+
+
+def frame_bytes(frame: DataFrame) -> int:
+    """Return the memory held by a DataFrame, including any Python objects in it."""
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+class SpilledFrames(Mapping[str, Any]):
+    """A read-only mapping of names to DataFrames, held within a memory limit.
+
+    Tables are added with add(). Looking up a spilled table loads it from
+    the scratch directory each time; keep a reference to it if it is used
+    repeatedly.
+    """
+
+    def __init__(self, memory_limit: int | str) -> None:
+        """Create an empty mapping that keeps at most half of memory_limit in memory."""
+        self.memory_limit = parse_bytes(memory_limit)
+        self._headroom = int(self.memory_limit * (1 - RESIDENT_SHARE))
+        self._resident: dict[str, DataFrame] = {}
+        self._resident_bytes = 0
+        self._spilled: dict[str, Path] = {}
+        self._names: list[str] = []  # insertion order, across both stores
+        self._scratch: TemporaryDirectory[str] | None = None
+        self._convert: Callable[[DataFrame], Any] | None = None
+
+    # --- building
+    def add(self, name: str, frame: DataFrame) -> None:
+        """Add a table, keeping it in memory if it fits, and spilling it otherwise."""
+        if name in self._resident or name in self._spilled:
+            raise KeyError(f"{name} is already in the mapping.")
+        self._names.append(name)
+        size = frame_bytes(frame)
+        if self._resident_bytes + size <= self.memory_limit - self._headroom:
+            self._resident[name] = frame
+            self._resident_bytes += size
+        else:
+            self._spilled[name] = self._spill(frame, len(self._names))
+
+    def reserve(self, raw_sheets: dict[str, DataFrame]) -> None:
+        """Keep enough headroom to parse a workbook of the size of these raw sheets, and any smaller one.
+
+        Tables already held in memory are not spilled; the larger headroom
+        applies to the tables added from now on.
+        """
+        raw_bytes = sum(frame_bytes(sheet) for sheet in raw_sheets.values())
+        self._headroom = max(self._headroom, raw_bytes * WORKING_SET_FACTOR)
+
+    def converted(self, convert: Callable[[DataFrame], Any]) -> "SpilledFrames":
+        """Return a view of the same tables, with convert() applied to each table as it is looked up."""
+        view = copy(self)
+        view._convert = convert  # noqa: SLF001
+        return view
+
+    @property
+    def spilled(self) -> list[str]:
+        """The names of the tables that are held on disk."""
+        return list(self._spilled)
+
+    # --- the Mapping protocol
+    def __getitem__(self, name: str) -> Any:  # noqa: ANN401
+        """Return a table, from memory or from disk."""
+        frame = self._resident[name] if name in self._resident else self._load(self._spilled[name])
+        return frame if self._convert is None else self._convert(frame)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the table names, in the order they were added."""
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        """Return the number of tables."""
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        """Summarise the mapping, without loading anything."""
+        return (
+            f"SpilledFrames({len(self)} tables, {len(self._resident)} in memory, "
+            f"{len(self._spilled)} on disk, memory_limit={self.memory_limit})"
+        )
+
+    # --- private
+    def _spill(self, frame: DataFrame, number: int) -> Path:
+        """Write a table to the scratch directory, and return its path."""
+        if self._scratch is None:
+            self._scratch = TemporaryDirectory(prefix=SCRATCH_PREFIX, ignore_cleanup_errors=True)
+        path = Path(self._scratch.name) / f"table-{number:05d}"
+        dtypes = frame.dtypes
+        if len(dtypes) and dtypes.iloc[0].kind == "f" and (dtypes == dtypes.iloc[0]).all():
+            # column-major, so each column is contiguous in the file
+            np.save(path.with_suffix(".npy"), np.asfortranarray(frame.to_numpy()))
+            labels: DataFrame | tuple[Any, Any] = (frame.index, frame.columns)
+        else:
+            labels = frame
+        with path.with_suffix(".pkl").open("wb") as file:
+            pickle.dump(labels, file, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    @staticmethod
+    def _load(path: Path) -> DataFrame:
+        """Read a table back from the scratch directory."""
+        with path.with_suffix(".pkl").open("rb") as file:
+            labels = pickle.load(file)  # noqa: S301 - our own scratch file
+        if isinstance(labels, DataFrame):
+            return labels
+        index, columns = labels
+        return DataFrame(
+            np.load(path.with_suffix(".npy"), mmap_mode="r"), index=index, columns=columns, copy=False
+        )
@@ -71,6 +71,7 @@ import pandas as pd
 from pandas import DataFrame, PeriodIndex, Series
 
 from readabs.abs_meta_data import metacol as mc  # used by the select() layer
+from readabs.meta_index import MetaIndex  # used by the select() layer
 from readabs.search_abs_meta import find_abs_id  # used by the select() layer
 
 # Frequency rank — higher number = finer frequency.
@@ -301,15 +302,16 @@ def splice(
 Source = tuple[dict[str, DataFrame], DataFrame, dict[str, str] | str]
 
 
-def select_one(data: dict[str, DataFrame], meta: DataFrame, selector: dict[str, str] | str) -> Series:
+def select_one(data: dict[str, DataFrame], meta: DataFrame | MetaIndex, selector: dict[str, str] | str) -> Series:
     """Select the single Series for one ``(data, meta, selector)`` — the single-source wrapper.
 
     Convenience for the common one-selector case; equivalent to
     ``select([(data, meta, selector)])[0]``.  The *selector* is either a
     ``{search_value: meta_column}`` dict for ``find_abs_id``, or a bare ABS
     Series ID string, matched exactly against the metadata's Series ID column.
-    Returns the Series named by its Series ID, with its ABS unit on
-    ``.attrs["unit"]``.
+    The *meta* may be a :class:`MetaIndex` over the metadata, to share its
+    search structures between calls.  Returns the Series named by its Series
+    ID, with its ABS unit on ``.attrs["unit"]``.
     """
     if isinstance(selector, str):
         # A bare Series ID — same find_abs_id machinery, but exact-match on the
@@ -332,7 +334,8 @@ def select(sources: Iterable[Source], *, require_same_units: bool = True) -> lis
     The composable selection primitive: takes the iterable of ``(data, meta,
     selector)`` sources and returns the matching list of Series, ready to hand to
     :func:`splice` (directly, or after a per-series transform).  Each selection
-    goes through ``readabs.find_abs_id`` with ``validate_unique=True``, which
+    goes through ``readabs.find_abs_id`` with ``validate_unique=True`` (sources
+    that share a metadata frame share one :class:`MetaIndex`), which
     de-duplicates on Series ID first — so a selector matching the same series in
     several tables resolves cleanly, while one matching two genuinely different
     series raises rather than guessing.
@@ -369,7 +372,12 @@ def select(sources: Iterable[Source], *, require_same_units: bool = True) -> lis
         If ``require_same_units`` and the selected series carry mixed units.
 
     """
-    segments = [select_one(data, meta, selector) for data, meta, selector in sources]
+    # one search index per distinct metadata frame, so sources sharing a meta share its masks
+    indexes: dict[int, MetaIndex] = {}
+    segments = [
+        select_one(data, indexes.setdefault(id(meta), MetaIndex(meta)), selector)
+        for data, meta, selector in sources
+    ]
     if require_same_units:
         units = [str(s.attrs.get("unit", "")) for s in segments]
         if len(set(units)) > 1:
@@ -0,0 +1,308 @@
+"""Build synthetic ABS-format Excel workbooks and zip files for hermetic tests.
+
+The workbooks mimic the layout that readabs expects from the ABS: an "Index"
+sheet holding the series metadata, followed by one or more "Data" sheets with
+ten header rows and the observations below. There is also a single-sheet
+RBA-format workbook, pages like the ABS time-series directory and an ABS
+release's landing page, and pages like the RBA statistical tables pages. No
+network access is needed.
+"""
+
+import zipfile
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# --- constants
+DATA_HEADER_LABELS = (
+    "Unit",
+    "Series Type",
+    "Data Type",
+    "Frequency",
+    "Collection Month",
+    "Series Start",
+    "Series End",
+    "No. Obs.",
+    "Series ID",
+)
+INDEX_COLUMNS = (
+    "Data Item Description",
+    "Series Type",
+    "Series ID",
+    "Series Start",
+    "Series End",
+    "No. Obs.",
+    "Unit",
+    "Data Type",
+    "Freq.",
+    "Collection Month",
+)
+EN_DASH = "\u2013"  # the RBA pages separate a table's name and number with one
+MONTHS_PER_PERIOD = {"Month": 1, "Quarter": 3, "Annual": 12}
+RBA_META_LABELS = (  # rows 2 to 11 of an RBA workbook, with two blank rows
+    "Title",
+    "Description",
+    "Frequency",
+    "Type",
+    "Units",
+    None,
+    None,
+    "Source",
+    "Publication date",
+    "Series ID",
+)
+
+
+# --- helpers
+def series_ids(table: str, n_series: int) -> list[str]:
+    """Return the synthetic series IDs used for a table."""
+    return [f"A{table[-4:]}{j:04d}X" for j in range(n_series)]
+
+
+def _period_dates(n_periods: int, freq: str, start_year: int) -> list[datetime]:
+    """Return the first-of-month dates ABS uses to label each period."""
+    step = MONTHS_PER_PERIOD[freq]
+    first_month = step  # Mar for quarters, Dec for years, Jan for months
+    dates = []
+    for i in range(n_periods):
+        months = first_month - 1 + i * step
+        dates.append(datetime(start_year + months // 12, months % 12 + 1, 1))  # noqa: DTZ001
+    return dates
+
+
+def _values(n_periods: int, n_series: int, decimals: int, seed: int, *, ragged: bool) -> np.ndarray:
+    """Return a (periods x series) array of rounded values, NaN-padded when ragged."""
+    rng = np.random.default_rng(seed)
+    values = np.round(rng.uniform(10, 9_000, size=(n_periods, n_series)), decimals)
+    if ragged:
+        starts = rng.integers(0, max(1, n_periods * 3 // 4), size=n_series)
+        for col, start in enumerate(starts):
+            values[:start, col] = np.nan
+    return values
+
+
+# --- public
+def abs_workbook(  # noqa: PLR0913
+    table: str,
+    *,
+    n_series: int = 10,
+    n_data_sheets: int = 1,
+    n_periods: int = 120,
+    freq: str = "Month",
+    header_row: int = 10,
+    start_year: int = 1980,
+    decimals: int = 1,
+    seed: int = 0,
+    ragged: bool = True,
+) -> bytes:
+    """Return the bytes of an ABS-format time-series workbook.
+
+    The Index sheet header sits on Excel row `header_row` (ABS uses rows 10
+    to 12), and the series are split evenly across `n_data_sheets` Data sheets.
+    """
+    ids = series_ids(table, n_series)
+    dates = _period_dates(n_periods, freq, start_year)
+    values = _values(n_periods, n_series, decimals, seed, ragged=ragged)
+
+    # not write_only: a normal workbook records each sheet's <dimension>, as Excel does
+    book = Workbook()
+    book.remove(book.active)
+
+    # --- the Index sheet
+    index = book.create_sheet("Index")
+    index.append(["Time Series Workbook"])
+    for row in range(2, header_row):
+        if row == 6:
+            index.append([f"{table}", f"Table {table[-2:]}. Synthetic table {table}"])
+        else:
+            index.append([f"row {row}"])
+    index.append(list(INDEX_COLUMNS))
+    for col, series_id in enumerate(ids):
+        observed = ~np.isnan(values[:, col])
+        first = dates[int(np.argmax(observed))]
+        index.append(
+            [
+                f"Synthetic item {col} ;  Persons ;",
+                "Seasonally Adjusted" if col % 2 else "Original",
+                series_id,
+                first,
+                dates[-1],
+                int(observed.sum()),
+                "Number",
+                "STOCK",
+                freq,
+                1,
+            ]
+        )
+    index.append(["© Commonwealth of Australia"])
+
+    # --- the Data sheets
+    for sheet, cols in enumerate(np.array_split(np.arange(n_series), n_data_sheets), start=1):
+        data = book.create_sheet(f"Data{sheet}")
+        data.append([f"Table {table}"])
+        for label in DATA_HEADER_LABELS:
+            if label == "Series ID":
+                data.append([label, *[ids[c] for c in cols]])
+            elif label == "Frequency":
+                data.append([label, *([freq] * len(cols))])
+            else:
+                data.append([label, *(["x"] * len(cols))])
+        for row, date in enumerate(dates):
+            data.append([date, *[None if np.isnan(v) else float(v) for v in values[row, cols]]])
+
+    buffer = BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def abs_zip(path: Path, *, n_tables: int = 3, table_prefix: str = "9999", **kwargs: object) -> Path:
+    """Write a zip of `n_tables` synthetic ABS workbooks to `path` and return it.
+
+    The tables are named `table_prefix` plus a three digit number; use a
+    different prefix (ending in a different digit) for each synthetic
+    catalogue, so that their series IDs do not collide. Other keyword
+    arguments are passed through to `abs_workbook()`.
+    """
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zipped:
+        for t in range(n_tables):
+            table = f"{table_prefix}{t + 1:03d}"
+            zipped.writestr(f"{table}.xlsx", abs_workbook(table, seed=t, **kwargs))  # type: ignore[arg-type]
+    return path
+
+
+def rba_workbook(
+    *,
+    n_series: int = 5,
+    n_periods: int = 500,
+    freq: str = "Daily",
+    start_year: int = 1990,
+    seed: int = 0,
+) -> bytes:
+    """Return the bytes of an RBA-format statistical table workbook.
+
+    The table title is on row 1, the series metadata on rows 2 to 11 (with
+    the Series ID last) and the observations below. Daily tables use
+    business days; otherwise the frequency is as for `abs_workbook()`.
+    """
+    if freq == "Daily":
+        dates = [d.to_pydatetime() for d in pd.bdate_range(f"{start_year}-01-01", periods=n_periods)]
+    else:
+        dates = _period_dates(n_periods, freq, start_year)
+    values = _values(n_periods, n_series, 2, seed, ragged=True)
+    ids = [f"FSYN{j:04d}" for j in range(n_series)]
+
+    book = Workbook(write_only=True)
+    sheet = book.create_sheet("Data")
+    sheet.append(["F9 SYNTHETIC TABLE"])
+    sheet.append(["Title", *[f"Synthetic series {j}" for j in range(n_series)]])
+    for label in RBA_META_LABELS[1:]:
+        if label is None:
+            sheet.append([])
+        elif label == "Series ID":
+            sheet.append([label, *ids])
+        elif label == "Frequency":
+            sheet.append([label, *([freq] * n_series)])
+        else:
+            sheet.append([label, *(["x"] * n_series)])
+    for row, date in enumerate(dates):
+        sheet.append([date, *[None if np.isnan(v) else float(v) for v in values[row]]])
+
+    buffer = BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def abs_directory_page(n_cats: int = 20, *, ceased_every: int = 5) -> bytes:
+    """Return the bytes of a page like the ABS time-series directory.
+
+    The last table on the page lists a catalogue number and a linked topic
+    per row (every `ceased_every`-th catalogue is marked as ceased, and the
+    last row links off the ABS statistics site, as some real rows do).
+    """
+    themes = ("economy", "labour", "people", "industry")
+    rows = []
+    for n in range(n_cats):
+        cat = f"{1000 + n}.0" + (" Ceased" if n % ceased_every == ceased_every - 1 else "")
+        url = f"https://www.abs.gov.au/statistics/{themes[n % len(themes)]}/topic-{n % 7}/release-{n}"
+        rows.append(f'<tr><td>{cat}</td><td><a href="{url}">Release {n}</a></td></tr>')
+    rows.append('<tr><td>9999.0</td><td><a href="https://www.example.com/elsewhere">Elsewhere</a></td></tr>')
+    page = (
+        "<html><body><table><tr><th>Other</th></tr><tr><td>x</td></tr></table>"
+        "<table><tr><th>Catalogue number</th><th>Topic</th></tr>" + "".join(rows) + "</table></body></html>"
+    )
+    return page.encode("utf-8")
+
+
+def rba_links_page(*, history: bool = False, n_tables: int = 12) -> bytes:
+    """Return the bytes of a page like the RBA statistical tables (or historical data) page.
+
+    Each table is an Excel link whose text ends " - <table number>", with the
+    quirks of the real pages: <span> tags, en dashes, entities, an absolute
+    URL, and links to other kinds of file. The historical page uses the
+    names that the RBA catalogue rewrites (daily, monthly, years, exchange rates).
+    """
+    links = [
+        '<a href="/statistics/">Statistics</a>',
+        f'<a href="/statistics/tables/pdf/notes.pdf">Notes {EN_DASH} X1</a>',
+    ]
+    for n in range(n_tables):
+        if history:
+            kind = ("Daily", "Monthly", "Detailed")[n % 3]
+            text = f"Interest Rates &amp; Yields {EN_DASH} {kind} {EN_DASH} 19{60 + n}"
+            href = f"/statistics/historical-data/f{n:02d}hist-{kind.lower()}.xls"
+        else:
+            text = f"Synthetic Table &amp; Series <span class='x'>{n}</span> {EN_DASH} <span>F{n}</span>"
+            href = f"/statistics/tables/xls/f{n:02d}hist.xlsx"
+        if n == 1:
+            href = f"https://www.rba.gov.au{href}"
+        if history:
+            text = f"{text} {EN_DASH} F{n}"
+        links.append(f'<li><a href="{href}">{text}</a></li>')
+    if history:
+        fx_text = f"Exchange Rates {EN_DASH} 1983 {EN_DASH} F11"
+        links.append(f'<a href="/statistics/historical-data/f11hist-1969-2009.xls">{fx_text}</a>')
+        links.append(f'<a href="/statistics/historical-data/e04hist.xls">Household Finances {EN_DASH} E4</a>')
+    else:
+        links.append(f'<a href="/statistics/tables/xls/f00dup.xls">Duplicate &amp; Older {EN_DASH} F0</a>')
+    page = "<html><head><meta charset='utf-8'></head><body><ul>" + "\n  ".join(links) + "</ul></body></html>"
+    return page.encode("utf-8")
+
+
+def abs_landing_page(n_tables: int = 20, *, table_prefix: str = "6202", filler: int = 200) -> bytes:
+    """Return the bytes of a page like an ABS release's landing page, with its download links.
+
+    The page links a zip file of all the tables and an Excel file for each,
+    among the site's other links (with some filler markup, as the real pages
+    are large). There are links that get_abs_links() must skip: a "Mock-up"
+    workbook, a PDF, and an upper-case extension.
+    """
+    site = [
+        f'<li><a href="/statistics/topic-{n}">Topic {n}</a><p>{"Lorem ipsum " * 20}</p></li>'
+        for n in range(filler)
+    ]
+    files = [f'<a href="/statistics/synthetic/latest-release/{table_prefix}_all.zip">All time series</a>']
+    files += [
+        f'<div class="file"><a href="/statistics/synthetic/latest-release/{table_prefix}{n:03d}.xlsx">'
+        f"Table {n}</a></div>"
+        for n in range(1, n_tables + 1)
+    ]
+    files += [
+        '<a href="https://www.abs.gov.au/statistics/synthetic/latest-release/Mock-up.xlsx">Mock-up</a>',
+        '<a href="/statistics/synthetic/latest-release/notes.pdf">Notes</a>',
+        f'<a href="/statistics/synthetic/latest-release/{table_prefix}_old.XLSX">Old</a>',
+        '<a href="#top">Back to top</a><a>No link</a>',
+    ]
+    page = (
+        "<html><head><meta charset='utf-8'><title>Synthetic release</title></head><body><nav><ul>"
+        + "".join(site[: filler // 2])
+        + "</ul></nav><main>"
+        + "".join(files)
+        + "</main><footer><ul>"
+        + "".join(site[filler // 2 :])
+        + "</ul></footer></body></html>"
+    )
+    return page.encode("utf-8")
@@ -0,0 +1,86 @@
+"""Test abs_catalogue(), and the parsed copy of the directory page that it keeps between sessions.
+
+These tests are hermetic: the download of the ABS time-series directory is
+patched to serve a synthetic page, and the parsed copy is written to a
+temporary folder, so no network access is made.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from synthetic_abs import abs_directory_page
+
+import readabs as ra
+
+catalogue_module = import_module("readabs.abs_catalogue")  # the module, not the function of the same name
+parsed_module = import_module("readabs.parsed_cache")
+
+
+@contextmanager
+def _patches(folder: Path, pages: list[bytes]) -> Iterator[mock.MagicMock]:
+    """Serve the last of the pages as the directory page; yield a spy on the parser."""
+
+    def get_file(*_args: object, **_kwargs: object) -> bytes:
+        return pages[-1]
+
+    spy = mock.MagicMock(wraps=catalogue_module._parse_catalogue)  # noqa: SLF001
+    with (
+        mock.patch.object(catalogue_module, "get_file", get_file),
+        mock.patch.object(catalogue_module, "_parse_catalogue", spy),
+        mock.patch.object(parsed_module, "PARSED_CACHE_PATH", folder),
+    ):
+        yield spy
+
+
+# --- tests
+def test_parsed_once_per_page() -> None:
+    """A new session loads the parsed catalogue rather than parsing the same page again."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp, _patches(Path(tmp), [abs_directory_page(20)]) as spy:
+        first = ra.abs_catalogue()
+        ra.clear_caches()  # as if in a new session
+        second = ra.abs_catalogue()
+        saved = list(Path(tmp).glob("parsed--abs-catalogue--*.pkl"))
+
+    assert spy.call_count == 1
+    assert len(saved) == 1
+    assert second.equals(first)
+    assert len(first) == 20  # the row that links off the ABS statistics site is dropped
+    assert first.index.name == "Catalogue ID"
+    assert (first["Status"] == "Ceased").sum() == 4
+    assert "1004.0" in first.index  # " Ceased" is removed from the catalogue number
+    assert first.loc["1001.0", "URL"] == "https://www.abs.gov.au/statistics/labour/topic-1/release-1"
+    assert list(first.loc["1001.0", ["Theme", "Parent Topic", "Topic"]]) == ["Labour", "Topic 1", "Release 1"]
+    ra.clear_caches()
+
+
+def test_changed_page_parsed_again() -> None:
+    """A changed page is parsed afresh, and the parsed copy of the old page is removed."""
+    ra.clear_caches()
+    pages = [abs_directory_page(20)]
+    with TemporaryDirectory() as tmp, _patches(Path(tmp), pages) as spy:
+        ra.abs_catalogue()
+        pages.append(abs_directory_page(30))
+        ra.clear_caches()
+        changed = ra.abs_catalogue()
+        saved = list(Path(tmp).glob("parsed--abs-catalogue--*.pkl"))
+
+        saved[0].write_bytes(b"damaged")
+        ra.clear_caches()
+        repaired = ra.abs_catalogue()
+
+    assert spy.call_count == 3
+    assert len(saved) == 1
+    assert len(changed) == 30
+    assert repaired.equals(changed)
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_parsed_once_per_page()
+    test_changed_page_parsed_again()
+    print("All ABS catalogue tests passed.")
@@ -0,0 +1,86 @@
+"""Test get_abs_links() and LinkIndex, which find the data files linked on an ABS release's landing page.
+
+These tests are hermetic: the download of the landing page is patched to
+serve a synthetic page, and the parsed links are written to a temporary
+folder, so no network access is made.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from synthetic_abs import abs_landing_page
+
+links_module = import_module("readabs.get_abs_links")
+parsed_module = import_module("readabs.parsed_cache")
+
+URL = "https://www.abs.gov.au/statistics/synthetic/latest-release"
+ROOT = f"{URL}/"
+
+
+@contextmanager
+def _patches(folder: Path, pages: list[bytes]) -> Iterator[mock.MagicMock]:
+    """Serve the last of the pages as the landing page; yield a spy on the link parser."""
+
+    def get_file(*_args: object, **_kwargs: object) -> bytes:
+        return pages[-1]
+
+    spy = mock.MagicMock(wraps=links_module._parse_links)  # noqa: SLF001
+    with (
+        mock.patch.object(links_module, "get_file", get_file),
+        mock.patch.object(links_module, "_parse_links", spy),
+        mock.patch.object(parsed_module, "PARSED_CACHE_PATH", folder),
+    ):
+        yield spy
+
+
+# --- tests
+def test_links_by_file_type() -> None:
+    """The zip and Excel links are found, in page order, made absolute, and indexed by table name."""
+    with TemporaryDirectory() as tmp, _patches(Path(tmp), [abs_landing_page(5)]):
+        links = links_module.get_abs_links(URL)
+        history = links_module.get_abs_links(URL, history="dec-2022")
+
+    assert isinstance(links, links_module.LinkIndex)
+    assert dict(links) == {
+        ".zip": [f"{ROOT}6202_all.zip"],
+        ".xlsx": [f"{ROOT}6202{n:03d}.xlsx" for n in range(1, 6)] + [f"{ROOT}6202_old.XLSX"],
+    }  # not the Mock-up, the PDF, or the links without a file
+    assert links.url(".xlsx", "6202003") == f"{ROOT}6202003.xlsx"
+    assert links.url(".zip", "6202_all") == f"{ROOT}6202_all.zip"
+    assert links.url(".xlsx", "02003") == f"{ROOT}6202003.xlsx"  # the tail of a name, as before
+    assert links.url(".xlsx", "6202_old") == ""  # the extension's case differs, as before
+    assert links.url(".xlsx", "6202009") == ""
+    assert links.url(".csv", "6202001") == ""
+    assert isinstance(history, links_module.LinkIndex)
+    assert history.url(".xlsx", "6202003") == "https://www.abs.gov.au/statistics/synthetic/dec-2022/6202003.xlsx"
+
+
+def test_parsed_once_per_page() -> None:
+    """A new session loads the parsed links; a changed page is parsed again."""
+    pages = [abs_landing_page(5)]
+    with TemporaryDirectory() as tmp, _patches(Path(tmp), pages) as spy:
+        first = links_module.get_abs_links(URL)
+        second = links_module.get_abs_links(URL)
+        other = links_module.get_abs_links(f"{URL}/other")  # the same page at another URL keeps its own copy
+        assert spy.call_count == 2
+
+        pages.append(abs_landing_page(8))
+        changed = links_module.get_abs_links(URL)
+        saved = list(Path(tmp).glob("parsed--abs-links-*.pkl"))
+
+    assert spy.call_count == 3
+    assert len(saved) == 2  # one for each URL; the old page's copy is removed
+    assert second == first == other
+    assert second.url(".xlsx", "6202005") == f"{ROOT}6202005.xlsx"
+    assert len(changed[".xlsx"]) == 9
+    assert links_module.get_abs_links("") == {}
+
+
+if __name__ == "__main__":
+    test_links_by_file_type()
+    test_parsed_once_per_page()
+    print("All ABS link tests passed.")
@@ -0,0 +1,101 @@
+"""Test that memoised results are handed out as copy-on-write views.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+from pandas import DataFrame
+from synthetic_abs import abs_zip
+
+import readabs as ra
+from readabs import memo
+from readabs.memo import isolated, memoised
+
+
+# --- tests
+def test_mutation_does_not_leak() -> None:
+    """Changing the tables and metadata returned by one call does not change the next call."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = str(abs_zip(Path(tmp) / "synthetic.zip", n_tables=2))
+        data, meta = ra.read_abs_cat("9999.0", zip_file=zip_path)
+        pristine = {table: frame.copy() for table, frame in data.items()}
+        pristine_meta = meta.copy()
+
+        first = next(iter(data))
+        frame = data[first]
+        frame["extra"] = 1.0  # add a column
+        frame.iloc[0, 0] = -999.0  # set a value
+        frame.drop(index=frame.index[-3:], inplace=True)  # noqa: PD002 - drop rows in place
+        frame.columns.name = "renamed"
+        del data[next(reversed(data))]  # drop a table from the dictionary
+        meta.loc[meta.index[0], "Series ID"] = "CHANGED"
+
+        again, again_meta = ra.read_abs_cat("9999.0", zip_file=zip_path)
+
+    assert list(again) == list(pristine)
+    for table, expected in pristine.items():
+        assert again[table].equals(expected)
+        assert again[table].columns.name == expected.columns.name
+    assert again_meta.equals(pristine_meta)
+    ra.clear_caches()
+
+
+def test_views_share_data_until_written() -> None:
+    """The views are not up-front copies: the data is shared until a caller writes to it."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = str(abs_zip(Path(tmp) / "synthetic.zip", n_tables=1))
+        data, _meta = ra.read_abs_cat("9999.0", zip_file=zip_path)
+        again, _meta = ra.read_abs_cat("9999.0", zip_file=zip_path)
+
+    table = next(iter(data))
+    column = data[table].columns[0]
+    assert again is not data
+    assert again[table] is not data[table]
+    assert np.shares_memory(again[table][column].to_numpy(), data[table][column].to_numpy())
+    ra.clear_caches()
+
+
+def test_memoised_function_views() -> None:
+    """Functions memoised with the decorator (eg. the catalogue maps) hand out views too."""
+    ra.clear_caches()
+    calls: list[int] = []
+
+    @memoised("test_memoised_function_views")
+    def catalogue() -> DataFrame:
+        calls.append(1)
+        return DataFrame({"URL": ["a", "b"]}, index=["1", "2"])
+
+    first = catalogue()
+    first.loc["1", "URL"] = "changed"
+    first["Status"] = "Ceased"
+    second = catalogue()
+    assert len(calls) == 1
+    assert list(second.columns) == ["URL"]
+    assert second.loc["1", "URL"] == "a"
+    ra.clear_caches()
+
+
+def test_copy_on_write_mode_read_per_call() -> None:
+    """Before pandas 3, the copy-on-write option is read on each call, and only True counts as on."""
+    frame = DataFrame({"a": [1.0, 2.0, 3.0]})
+    for mode, shared in ((True, True), ("warn", False), (False, False)):
+        options = SimpleNamespace(options=SimpleNamespace(mode=SimpleNamespace(copy_on_write=mode)))
+        with mock.patch.object(memo, "PANDAS_3", new=False), mock.patch.object(memo, "pd", new=options):
+            view = isolated(frame)
+        assert np.shares_memory(view["a"].to_numpy(), frame["a"].to_numpy()) is shared, mode
+
+
+if __name__ == "__main__":
+    test_mutation_does_not_leak()
+    test_views_share_data_until_written()
+    test_memoised_function_views()
+    test_copy_on_write_mode_read_per_call()
+    print("All cached view tests passed.")
@@ -0,0 +1,126 @@
+"""Test the start/end date window of the ABS and RBA readers.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, and the RBA workbook is handed to read_rba_table()
+in place of a download, so no network access is made.
+"""
+
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import numpy as np
+from pandas import Period
+from synthetic_abs import abs_zip, rba_workbook
+
+import readabs as ra
+from readabs.read_support import date_window
+
+cat_module = import_module("readabs.read_abs_cat")  # the module, not the function of the same name
+rba_module = import_module("readabs.read_rba_table")
+
+
+# --- tests
+def test_window_bounds() -> None:
+    """Strings are read as periods: start at the first moment, end at the last."""
+    first, last = date_window("2010", "2015-06")
+    assert first is not None
+    assert last is not None
+    assert Period(first, freq="Q") == Period("2010Q1")
+    assert Period(last, freq="Q") == Period("2015Q2")
+    assert date_window(None, None) == (None, None)
+
+    raised = False
+    try:
+        date_window("2015", "2010")
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError when start is after end"
+
+
+def test_pushdown_matches_slicing() -> None:
+    """Trimming rows while parsing (iter_abs_cat) gives the same tables as slicing the full history."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2, n_data_sheets=2, freq="Quarter")
+        tables = ra.iter_abs_cat("9999.0", zip_file=str(zip_path), start="1995", end="2001-05")
+        trimmed = {table: frame for table, frame, _meta in tables}
+        full, full_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        sliced, sliced_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), start="1995", end="2001-05")
+
+    assert sliced_meta.equals(full_meta)
+    for table, frame in full.items():
+        expected = frame.loc["1995Q1":"2001Q2"]  # type: ignore[misc]
+        assert trimmed[table].equals(expected)
+        assert sliced[table].equals(expected)
+        assert len(trimmed[table]) < len(frame)
+
+
+def test_windows_share_one_parse() -> None:
+    """Each window is sliced from the memoised full history, which is parsed once."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2, freq="Quarter")
+        with mock.patch.object(
+            cat_module,
+            "_get_time_series_data",
+            wraps=cat_module._get_time_series_data,  # noqa: SLF001
+        ) as parse:
+            early, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), end="1990")
+            late, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), start="2000")
+            full, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+
+    assert parse.call_count == 1
+    for table, frame in full.items():
+        assert early[table].equals(frame.loc[:"1990Q4"])  # type: ignore[misc]
+        assert late[table].equals(frame.loc["2000Q1":])  # type: ignore[misc]
+
+
+def test_long_layout_window() -> None:
+    """The long layout is sliced to the window, keeping only the series found in it."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2)
+        trimmed, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), layout="long", start="1985-07")
+        full, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), layout="long")
+
+    expected = full.loc[full["period"] >= Period("1985-07", freq="M").ordinal].reset_index(drop=True)
+    assert trimmed.equals(expected)
+    assert set(trimmed["series_id"].cat.categories) == set(expected["series_id"])
+
+
+def test_read_abs_series_window() -> None:
+    """read_abs_series() passes the window through to read_abs_cat()."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=1, ragged=False)
+        data, _meta = ra.read_abs_series("9999.0", "A90010003X", zip_file=str(zip_path), end="1984-12")
+
+    assert str(data.index[-1]) == "1984-12"
+    assert data["A90010003X"].notna().all()
+
+
+def test_rba_window() -> None:
+    """read_rba_table() slices a daily table to the window, before converting to floats."""
+    ra.clear_caches()
+    excel = rba_workbook(n_periods=400, seed=1)
+    with mock.patch.object(rba_module, "_get_excel_file", return_value=excel) as get_excel:
+        trimmed, trimmed_meta = ra.read_rba_table("F9", dtype="float64", start="1990-03-01", end="1990-06-30")
+        full, full_meta = ra.read_rba_table("F9", dtype="float64")
+
+    assert get_excel.call_count == 1  # the window was sliced from the memoised full history
+    assert full.index.freqstr == "D"
+    assert trimmed_meta.equals(full_meta)
+    expected = full.loc["1990-03-01":"1990-06-30"]  # type: ignore[misc]
+    assert trimmed.equals(expected)
+    assert np.isin(trimmed.index, full.index).all()
+
+
+if __name__ == "__main__":
+    test_window_bounds()
+    test_pushdown_matches_slicing()
+    test_windows_share_one_parse()
+    test_long_layout_window()
+    test_read_abs_series_window()
+    test_rba_window()
+    print("All date window tests passed.")
@@ -0,0 +1,67 @@
+"""Test the compact float dtypes (float64 / float32 / auto) for parsed data.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from pandas import DataFrame
+from synthetic_abs import abs_zip
+
+import readabs as ra
+from readabs.read_support import to_float_dtype
+
+
+# --- tests
+def test_auto_narrows_only_lossless_columns() -> None:
+    """Auto -> float32 where the published decimals survive, float64 elsewhere."""
+    frame = DataFrame(
+        {
+            "short": [0.1, 12.3, 4567.8, np.nan],  # 1 decimal place, few significant digits
+            "long": [1234567.891, 2.0, 3.0, 4.0],  # 10 significant digits - too many for float32
+            "big": [1e40, 1.0, 2.0, 3.0],  # beyond the float32 range
+        }
+    )
+    result = to_float_dtype(frame, "auto")
+    assert result["short"].dtype == np.float32
+    assert result["long"].dtype == np.float64
+    assert result["big"].dtype == np.float64
+    restored = np.round(result["short"].to_numpy(np.float64), 1)
+    assert np.array_equal(restored, frame["short"].to_numpy(), equal_nan=True)
+
+
+def test_invalid_dtype_raises() -> None:
+    """An unknown dtype is rejected rather than silently ignored."""
+    raised = False
+    try:
+        to_float_dtype(DataFrame({"a": [1.0]}), "float16")
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for an unsupported dtype"
+
+
+def test_read_abs_cat_dtypes() -> None:
+    """read_abs_cat() honours dtype, and the narrowed values match float64 to published precision."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2, decimals=1)
+        wide, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        narrow, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), dtype="float32")
+        auto, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), dtype="auto")
+
+    for table, frame in wide.items():
+        assert (frame.dtypes == np.float64).all()
+        assert (narrow[table].dtypes == np.float32).all()
+        assert (auto[table].dtypes == np.float32).all()  # one decimal place is always lossless here
+        restored = np.round(auto[table].to_numpy(np.float64), 1)
+        assert np.array_equal(restored, frame.to_numpy(), equal_nan=True)
+        assert auto[table].memory_usage(index=False).sum() < frame.memory_usage(index=False).sum()
+
+
+if __name__ == "__main__":
+    test_auto_narrows_only_lossless_columns()
+    test_invalid_dtype_raises()
+    test_read_abs_cat_dtypes()
+    print("All float dtype tests passed.")
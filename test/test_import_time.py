@@ -0,0 +1,78 @@
+"""Guard the import time of readabs, which loads its public names on first use.
+
+Each check runs a fresh interpreter with "-X importtime", which reports every
+module imported and its cumulative import time (in microseconds) on stderr.
+"""
+
+import subprocess
+import sys
+from types import ModuleType
+
+import readabs as ra
+
+IMPORT_BUDGET_US = 100_000  # "import readabs" should take well under 100 ms
+HEAVY = ("pandas", "numpy", "requests", "bs4", "lxml", "openpyxl", "pyxlsb", "tabulate", "pyarrow", "polars")
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run the code in a new interpreter; return the cumulative import time of each module imported."""
+    result = subprocess.run(  # noqa: S603 - the interpreter running these tests
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _heavy(times: dict[str, int]) -> list[str]:
+    """Return the heavy third-party packages that were imported."""
+    return [name for name in times if name.split(".")[0] in HEAVY]
+
+
+# --- tests
+def test_import_is_light() -> None:
+    """Importing the package imports none of its heavy dependencies, and is quick."""
+    times = _import_times("import readabs")
+    assert not _heavy(times), _heavy(times)
+    assert times["readabs"] < IMPORT_BUDGET_US, f"import readabs took {times['readabs'] / 1000:.0f} ms"
+
+
+def test_light_names_stay_light() -> None:
+    """The metadata column names, and recalibrate_value(), do without pandas."""
+    times = _import_times("from readabs import Datatype, metacol, rba_metacol, recalibrate_value")
+    assert not [name for name in _heavy(times) if not name.startswith("numpy")], _heavy(times)
+    assert "pandas" not in times
+
+
+def test_public_names_resolve() -> None:
+    """Every public name loads on use, and is not hidden by a submodule of the same name."""
+    times = _import_times(
+        "import readabs, readabs.abs_catalogue, readabs.splice; "
+        "assert callable(readabs.abs_catalogue) and callable(readabs.splice)"
+    )
+    assert "pandas" in times  # the submodules were imported
+    for name in ra.__all__:
+        assert not isinstance(getattr(ra, name), ModuleType), name
+    assert set(ra.__all__) <= set(dir(ra))
+    assert isinstance(ra.__version__, str)
+
+    raised = False
+    try:
+        _ = ra.no_such_name  # type: ignore[attr-defined]
+    except AttributeError:
+        raised = True
+    assert raised, "expected AttributeError for a name readabs does not have"
+
+
+if __name__ == "__main__":
+    test_import_is_light()
+    test_light_names_stay_light()
+    test_public_names_resolve()
+    print("All import time tests passed.")
@@ -0,0 +1,57 @@
+"""Test iter_abs_cat(), which yields the tables of a catalogue one at a time.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from synthetic_abs import abs_zip
+
+import readabs as ra
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+
+
+# --- tests
+def test_iter_matches_read_abs_cat() -> None:
+    """The streamed tables and metadata are those that read_abs_cat() returns."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=3, n_data_sheets=2)
+        data, meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        streamed = list(ra.iter_abs_cat("9999.0", zip_file=str(zip_path)))
+
+    assert [table for table, _data, _meta in streamed] == list(data)
+    for table, frame, table_meta in streamed:
+        assert frame.equals(data[table])
+        assert table_meta.equals(meta[meta["Table"] == table])
+
+
+def test_iter_is_lazy() -> None:
+    """Nothing after the first workbook is parsed until it is asked for."""
+    parsed: list[str] = []
+    original = grab_module._add_excel_bytes  # noqa: SLF001
+
+    def counting(abs_dict: dict, raw_bytes: bytes, name: str, args: dict) -> dict:
+        parsed.append(name)
+        return original(abs_dict, raw_bytes, name, args)
+
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=3)
+        with mock.patch.object(grab_module, "_add_excel_bytes", side_effect=counting):
+            tables = ra.iter_abs_cat("9999.0", zip_file=str(zip_path), start="1985")
+            table, frame, _meta = next(tables)
+            assert parsed == ["9999001"]
+            tables.close()
+
+    assert table == "9999001"
+    assert str(frame.index[0]) >= "1985-01"
+
+
+if __name__ == "__main__":
+    test_iter_matches_read_abs_cat()
+    test_iter_is_lazy()
+    print("All iter_abs_cat tests passed.")
@@ -0,0 +1,65 @@
+"""Test the long (tidy) layout of read_abs_cat().
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from pandas import PeriodIndex, Series
+from synthetic_abs import abs_zip
+
+import readabs as ra
+
+
+# --- tests
+def test_long_matches_wide() -> None:
+    """Every observed value in the wide tables appears once in the long frame, and nothing else."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2, n_data_sheets=2, freq="Quarter")
+        wide, wide_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        long, long_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), layout="long")
+
+    assert long_meta.equals(wide_meta)
+    assert long["series_id"].dtype == "category"
+    assert long["period"].dtype == np.int32
+    assert long["value"].notna().all()
+    assert len(long) == sum(int(frame.notna().sum().sum()) for frame in wide.values())
+
+    for frame in wide.values():
+        for series_id in frame.columns:
+            rows = long[long["series_id"] == series_id]
+            index = PeriodIndex.from_ordinals(rows["period"], freq=rows["freq"].iloc[0])
+            rebuilt = Series(rows["value"].to_numpy(), index=index)
+            expected = frame[series_id].dropna()
+            assert rebuilt.index.equals(expected.index)
+            assert np.array_equal(rebuilt.to_numpy(), expected.to_numpy())
+
+
+def test_long_joins_metadata_on_series_id() -> None:
+    """Each series in the long frame has a metadata row."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2)
+        long, meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), layout="long", dtype="float32")
+
+    assert long["value"].dtype == np.float32
+    assert set(long["series_id"].cat.categories) == set(meta["Series ID"])
+
+
+def test_invalid_layout_raises() -> None:
+    """An unknown layout is rejected before anything is read."""
+    raised = False
+    try:
+        ra.read_abs_cat("9999.0", zip_file="never-read.zip", layout="tall")  # type: ignore[call-overload]
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for an unsupported layout"
+
+
+if __name__ == "__main__":
+    test_long_matches_wide()
+    test_long_joins_metadata_on_series_id()
+    test_invalid_layout_raises()
+    print("All long layout tests passed.")
@@ -0,0 +1,143 @@
+"""Test the byte-bounded, in-memory cache of results.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from pandas import DataFrame
+from synthetic_abs import abs_zip
+
+import readabs as ra
+from readabs import memo
+from readabs.memo import DEFAULT_LIMIT, estimate_bytes, memo_get, memo_put
+from readabs.read_support import NON_RESULT_ARGS, result_key
+
+# the arguments of a plain read_abs_cat("6202.0") call
+BASE_NAMED = {"cat": "6202.0", "url": "", "layout": "wide"}
+
+
+def _same_data(first: dict[str, DataFrame], second: dict[str, DataFrame]) -> bool:
+    """Check whether two results are views of the same cached tables (not two reads)."""
+    table = next(iter(first))
+    return np.shares_memory(first[table].to_numpy(), second[table].to_numpy())
+
+
+# --- tests
+def test_least_recently_used_evicted() -> None:
+    """Once over budget, the least recently used entry goes first."""
+    ra.clear_caches()
+    frame = DataFrame({"a": range(100)})
+    size = estimate_bytes(frame)
+    try:
+        ra.set_cache_limit(int(size * 3.5))
+        for name in ("x", "y", "z"):
+            memo_put(name, frame.copy())
+        assert memo_get("x") is not None  # "y" is now the oldest
+        memo_put("w", frame.copy())
+        assert memo_get("y") is None
+        assert memo_get("x") is not None
+        assert memo._store.nbytes <= int(size * 3.5)  # noqa: SLF001
+
+        memo_put("big", DataFrame({"a": range(10_000)}))
+        assert memo_get("big") is None, "an entry bigger than the budget is not held"
+    finally:
+        ra.set_cache_limit(DEFAULT_LIMIT)
+        ra.clear_caches()
+
+
+def test_clear_one_catalogue() -> None:
+    """clear_caches(cat) drops the results for one catalogue and keeps the rest."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        first = str(abs_zip(Path(tmp) / "first.zip", n_tables=1))
+        second = str(abs_zip(Path(tmp) / "second.zip", n_tables=1))
+        data_9999, _meta = ra.read_abs_cat("9999.0", zip_file=first)
+        data_8888, _meta = ra.read_abs_cat("8888.0", zip_file=second)
+        assert _same_data(ra.read_abs_cat("9999.0", zip_file=first)[0], data_9999)
+
+        ra.clear_caches("9999.0")
+        assert not _same_data(ra.read_abs_cat("9999.0", zip_file=first)[0], data_9999)
+        assert _same_data(ra.read_abs_cat("8888.0", zip_file=second)[0], data_8888)
+
+        ra.clear_caches()
+        assert not _same_data(ra.read_abs_cat("8888.0", zip_file=second)[0], data_8888)
+    ra.clear_caches()
+
+
+def test_raw_sheets_not_retained() -> None:
+    """Only the parsed tables are held; the raw sheets are released."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = str(abs_zip(Path(tmp) / "synthetic.zip", n_tables=2))
+        data, meta = ra.read_abs_cat("9999.0", zip_file=zip_path)
+        ra.read_abs_meta("9999.0", zip_file=zip_path)
+
+    entries = memo._store._entries  # noqa: SLF001
+    assert len(entries) == 2
+    assert {key[0] for key in entries} == {"read_abs_cat", "read_abs_meta"}
+    assert memo._store.nbytes >= estimate_bytes((data, meta))  # noqa: SLF001
+    ra.clear_caches()
+
+
+def test_result_key_relevance() -> None:
+    """Pin which arguments are part of the memo key, and which are not."""
+    base = result_key(BASE_NAMED, {})
+    assert NON_RESULT_ARGS == ("verbose", "cache_only")
+
+    # logging and cache freshness do not change the result
+    for kwargs in ({"verbose": True}, {"cache_only": True}):
+        assert result_key(BASE_NAMED, kwargs) == base, kwargs
+
+    # equivalent spellings share a key
+    assert result_key(BASE_NAMED, {"get_zip": True, "dtype": "float64"}) == base
+    assert result_key({**BASE_NAMED, "cat": " 6202.0 "}, {}) == base
+    assert result_key(BASE_NAMED, {"tables": "62020001"}) == result_key(BASE_NAMED, {"tables": ("62020001",)})
+    assert result_key(BASE_NAMED, {"zip_file": Path("a.zip")}) == result_key(BASE_NAMED, {"zip_file": "a.zip"})
+    assert result_key(BASE_NAMED, {"unknown": 1}) == base
+
+    # the source selection, history, table filtering and parsing options do
+    relevant: list[dict[str, object]] = [
+        {"get_zip": False, "get_excel": True},
+        {"get_excel_if_no_zip": False},
+        {"single_zip_only": "6202001"},
+        {"single_excel_only": "62020001"},
+        {"selected_excel": ("62020001",)},
+        {"tables": ("62020001",)},
+        {"history": "mar-2020"},
+        {"keep_non_ts": True},
+        {"zip_file": "a.zip"},
+        {"dtype": "float32"},
+        {"ignore_errors": True},  # a read that swallows errors may be partial
+    ]
+    for kwargs in relevant:
+        assert result_key(BASE_NAMED, kwargs) != base, kwargs
+    for named in ({"cat": "6291.0"}, {"url": "https://www.abs.gov.au/x"}, {"layout": "long"}):
+        assert result_key({**BASE_NAMED, **named}, {}) != base, named
+
+
+def test_flags_reuse_cached_result() -> None:
+    """A repeat call that only differs in verbose or cache_only is not re-read; one with ignore_errors is."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        zip_path = str(abs_zip(Path(tmp) / "synthetic.zip", n_tables=1))
+        data, _meta = ra.read_abs_cat("9999.0", zip_file=zip_path)
+        again, _meta = ra.read_abs_cat("9999.0 ", zip_file=zip_path, verbose=False, cache_only=True)
+        lenient, _meta = ra.read_abs_cat("9999.0", zip_file=zip_path, ignore_errors=True)
+        keep, _meta = ra.read_abs_cat("9999.0", zip_file=zip_path, keep_non_ts=True)
+    assert _same_data(again, data)
+    assert not _same_data(lenient, data)
+    assert not _same_data(keep, data)
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_least_recently_used_evicted()
+    test_clear_one_catalogue()
+    test_raw_sheets_not_retained()
+    test_result_key_relevance()
+    test_flags_reuse_cached_result()
+    print("All memo tests passed.")
@@ -0,0 +1,116 @@
+"""Test the memory_limit= spill-to-disk mode of read_abs_cat() and grab_abs_url().
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+import tracemalloc
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import numpy as np
+from synthetic_abs import abs_zip
+
+import readabs as ra
+from readabs.memo import clear_caches
+from readabs.spill import SpilledFrames, parse_bytes
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+
+
+def _peak_bytes(zip_path: Path, **kwargs: str) -> tuple[int, object]:
+    """Return the peak traced memory of a fresh read, and the data read."""
+    clear_caches()
+    tracemalloc.start()
+    try:
+        data, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), **kwargs)
+        return tracemalloc.get_traced_memory()[1], data
+    finally:
+        tracemalloc.stop()
+
+
+# --- tests
+def test_parse_bytes() -> None:
+    """Sizes may be given as bytes, or with a K/M/G unit."""
+    assert parse_bytes(1000) == 1000
+    assert parse_bytes("512MB") == 512 * 1024**2
+    assert parse_bytes(" 1.5 gb ") == int(1.5 * 1024**3)
+    assert parse_bytes("64K") == 64 * 1024
+    for bad in ("lots", "0MB", -1):
+        raised = False
+        try:
+            parse_bytes(bad)
+        except ValueError:
+            raised = True
+        assert raised, f"expected ValueError for {bad!r}"
+
+
+def test_spilled_matches_in_memory() -> None:
+    """With a tiny limit every table is spilled, and each one reads back unchanged."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=3, n_data_sheets=2)
+        data, meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        spilled, spilled_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), memory_limit=1000)
+        workbooks = grab_module.iter_abs_zip(str(zip_path))
+        with mock.patch.object(grab_module, "_iter_url", return_value=workbooks):
+            raw = ra.grab_abs_url(url="https://www.abs.gov.au/synthetic", memory_limit=1000)
+
+    assert isinstance(spilled, SpilledFrames)
+    assert list(spilled) == list(data)
+    assert sorted(spilled.spilled) == sorted(data)
+    assert spilled_meta.equals(meta)
+    for table, frame in data.items():
+        loaded = spilled[table]
+        assert isinstance(loaded.to_numpy(), np.ndarray)
+        assert loaded.equals(frame)
+    assert isinstance(raw, SpilledFrames)
+    assert len(raw) > len(data)  # the raw sheets include each workbook's Index
+    assert all(len(raw[name]) for name in raw)
+
+
+def test_peak_memory_within_limit() -> None:
+    """The peak memory of a read stays within the limit, where an unlimited read goes over it."""
+    limit = 5 * 1024**2
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=6, n_series=40, n_periods=600)
+        unlimited_peak, data = _peak_bytes(zip_path)
+        limited_peak, spilled = _peak_bytes(zip_path, memory_limit="5MB")
+
+    assert unlimited_peak > limit
+    assert limited_peak < limit
+    assert isinstance(spilled, SpilledFrames)
+    assert spilled.spilled
+    assert isinstance(data, dict)
+    for table, frame in data.items():
+        assert spilled[table].equals(frame)
+
+
+def test_memory_limit_with_output() -> None:
+    """Spilled tables are converted to the requested output as they are looked up."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2)
+        data, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), memory_limit=1000, output="polars")
+
+    for table in data:
+        assert data[table].columns[0] == "period"
+
+
+def test_memory_limit_needs_wide_layout() -> None:
+    """The long layout is a single frame, so it cannot be spilled table by table."""
+    raised = False
+    try:
+        ra.read_abs_cat("9999.0", zip_file="never-read.zip", layout="long", memory_limit="1GB")  # type: ignore[call-overload]
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for memory_limit with the long layout"
+
+
+if __name__ == "__main__":
+    test_parse_bytes()
+    test_spilled_matches_in_memory()
+    test_peak_memory_within_limit()
+    test_memory_limit_with_output()
+    test_memory_limit_needs_wide_layout()
+    print("All memory limit tests passed.")
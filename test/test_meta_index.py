@@ -0,0 +1,217 @@
+"""Test MetaIndex, the search index behind search_abs_meta() and find_abs_id().
+
+These tests are hermetic: the metadata is built locally, in the shape that
+read_abs_cat() returns, and each search is checked against a direct scan of
+the DataFrame (the way search_abs_meta() used to search).
+"""
+
+from importlib import import_module
+
+import numpy as np
+from pandas import DataFrame, Index
+
+import readabs as ra
+from readabs import metacol as mc
+
+index_module = import_module("readabs.meta_index")
+
+ITEMS = (
+    "Unemployment rate ;  Persons ;",
+    "Unemployment rate ;  Males ;",
+    "Unemployment rate ;  Looked for full-time work ;  Persons ;",
+    "Employed total ;  Persons ;",
+    "Employed total ;  Females ;",
+    "Participation rate ;  Persons ;",
+    "Gross domestic product: Chain volume measures ;",
+    "Gross domestic product: Current prices ;",
+)
+SEARCHES = (  # (search terms, exact_match, regex)
+    ({"Unemployment rate": mc.did}, False, False),
+    ({"employment rate ;  Per": mc.did}, False, False),  # partial words at both ends
+    ({"ployed": mc.did, "Seasonally Adjusted": mc.stype}, False, False),
+    ({";  Persons ;": mc.did, "Percent": mc.unit}, False, False),
+    ({"rate ;  Looked for": mc.did}, False, False),
+    ({"Gross domestic product: Current prices ;": mc.did}, True, False),
+    ({"unemployment rate": mc.did}, False, False),  # case matters
+    ({r"^(?:Un)?[Ee]mploy": mc.did, "Trend": mc.stype}, False, True),
+    ({r"rate ;\s+Persons": mc.did}, False, True),
+    ({"62020001": mc.table, "Original": mc.stype}, False, False),
+    ({"6202000": mc.table}, False, False),  # tables always match exactly
+    ({"Nothing like this": mc.did}, False, False),
+    ({"Chain volume": mc.did, "5206001": mc.table}, False, False),
+)
+
+
+def _metadata() -> DataFrame:
+    """Return metadata for three tables, with repeated descriptions, a series in two tables, and gaps."""
+    rows = []
+    for table, items in (("62020001", ITEMS[:6]), ("62020002", ITEMS[:6]), ("5206001", ITEMS[6:])):
+        for number, item in enumerate(items):
+            for stype in ("Original", "Seasonally Adjusted", "Trend"):
+                unit = "Percent" if "rate" in item else "000"
+                rows.append({mc.did: item, mc.stype: stype, mc.unit: unit, mc.table: table, "n": number})
+    meta = DataFrame(rows)
+    meta[mc.id] = [
+        f"A{table[-3:]}{n:03d}{stype[0]}"
+        for table, n, stype in zip(meta[mc.table], meta["n"], meta[mc.stype], strict=True)
+    ]
+    meta.loc[meta[mc.table] == "62020002", mc.id] = meta.loc[meta[mc.table] == "62020001", mc.id].to_numpy()
+    meta.loc[3, mc.did] = np.nan
+    meta.loc[4, mc.unit] = np.nan
+    return meta.drop(columns="n").set_axis(Index(meta[mc.id]), axis=0)
+
+
+def _scan_reference(meta: DataFrame, search_terms: dict[str, str], *, exact_match: bool, regex: bool) -> DataFrame:
+    """Search by scanning the DataFrame one term at a time."""
+    meta_select = meta.copy()
+    for phrase, column in search_terms.items():
+        pick_me = (
+            (meta_select[column] == phrase)
+            if (exact_match or column == mc.table)
+            else meta_select[column].str.contains(phrase, regex=regex).fillna(value=False).astype(bool)
+        )
+        meta_select = meta_select[pick_me]
+    meta_select.index = Index(meta_select[mc.id])
+    return meta_select[~meta_select.index.duplicated(keep="first")]
+
+
+def _fuzzy_reference(meta: DataFrame, phrase: str, top_k: int) -> list[tuple[str, float]]:
+    """Score every row against the phrase, one at a time; return the best (series ID, score) pairs."""
+    query = index_module._trigrams(phrase)  # noqa: SLF001
+    scored = []
+    for position, (series_id, did) in enumerate(zip(meta[mc.id], meta[mc.did], strict=True)):
+        value = index_module._trigrams(did) if isinstance(did, str) else set()  # noqa: SLF001
+        shared = len(query & value)
+        score = (shared / len(query) + 2 * shared / (len(query) + len(value))) / 2
+        if score > 0:
+            scored.append((-score, position, series_id))
+    best: dict[str, float] = {}
+    for negative, _position, series_id in sorted(scored):
+        best.setdefault(series_id, -negative)
+    return list(best.items())[:top_k]
+
+
+# --- tests
+def test_matches_scan() -> None:
+    """Every search gives the same rows, in the same order, from the DataFrame or a MetaIndex."""
+    meta = _metadata()
+    meta_index = ra.MetaIndex(meta)
+    for terms, exact_match, regex in SEARCHES:
+        expected = _scan_reference(meta, terms, exact_match=exact_match, regex=regex)
+        for source in (meta, meta_index):
+            found = ra.search_abs_meta(source, terms, exact_match=exact_match, regex=regex)
+            assert found.equals(expected), f"{terms} with {type(source).__name__}"
+    assert len(ra.search_abs_meta(meta_index, {"Unemployment rate": mc.did})) == 9  # each ID once
+
+
+def test_find_abs_id_with_index() -> None:
+    """find_abs_id() takes an index, and still insists on a unique match."""
+    meta = _metadata()
+    meta_index = ra.MetaIndex(meta)
+    terms = {"Participation rate ;  Persons ;": mc.did, "Trend": mc.stype, "62020001": mc.table}
+    assert ra.find_abs_id(meta_index, terms) == ra.find_abs_id(meta, terms)
+    assert ra.find_abs_id(meta_index, terms) == ("62020001", "A001005T", "Percent")
+
+    raised = False
+    try:
+        ra.find_abs_id(meta_index, {"Unemployment rate": mc.did})
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for an ambiguous search"
+
+
+def test_repeat_searches_use_cached_masks() -> None:
+    """A repeated term is served from the index, and the cached masks cannot be changed."""
+    meta_index = ra.MetaIndex(_metadata())
+    first = meta_index.mask("Unemployment rate", mc.did)
+    assert meta_index.mask("Unemployment rate", mc.did) is first
+    assert not first.flags.writeable
+    assert meta_index.mask("Unemployment rate", mc.did, exact_match=True) is not first
+
+    raised = False
+    try:
+        meta_index.mask("anything", "No such column")
+    except KeyError:
+        raised = True
+    assert raised, "expected KeyError for a missing column"
+
+
+def test_find_abs_ids_matches_find_abs_id() -> None:
+    """Each selector resolves as find_abs_id() would, and the failures are reported, not raised."""
+    meta = _metadata()
+    selectors = [
+        {item: mc.did, stype: mc.stype, table: mc.table}
+        for table in ("62020001", "5206001")
+        for item in ITEMS
+        for stype in ("Original", "Trend")
+    ]
+    found, errors = ra.find_abs_ids(meta, selectors)
+
+    assert len(found) == len(selectors)
+    for position, selector in enumerate(selectors):
+        try:
+            expected = ra.find_abs_id(meta, selector)
+        except (ValueError, IndexError):
+            assert found[position] is None
+            assert isinstance(errors[position], ValueError)
+            continue
+        assert found[position] == expected
+        assert position not in errors
+    assert errors, "expected some selectors (items not in their table) to fail"
+
+    ambiguous = [{"Unemployment rate": mc.did}, {"Nothing like this": mc.did}]
+    found, errors = ra.find_abs_ids(ra.MetaIndex(meta), ambiguous)
+    assert found == [None, None]
+    assert "9 series match" in str(errors[0])
+    assert "no series matches" in str(errors[1])
+    found, errors = ra.find_abs_ids(meta, ambiguous, validate_unique=False)
+    assert found[0] == ("62020001", "A001000O", "Percent")  # the first match
+    assert list(errors) == [1]
+
+
+def test_select_shares_index() -> None:
+    """splice.select() resolves sources that share a metadata frame, as select_one() does."""
+    meta = _metadata()
+    tables = {
+        table: DataFrame({sid: [1.0, 2.0] for sid in meta.loc[meta[mc.table] == table, mc.id]})
+        for table in meta[mc.table].unique()
+    }
+    selectors = [{"Participation rate ;  Persons ;": mc.did, stype: mc.stype} for stype in ("Original", "Trend")]
+    selected = ra.select([(tables, meta, selector) for selector in selectors])
+    assert [series.name for series in selected] == ["A001005O", "A001005T"]
+    assert [ra.select_one(tables, meta, selector).name for selector in selectors] == ["A001005O", "A001005T"]
+
+
+def test_fuzzy_search_ranks() -> None:
+    """A fuzzy search ranks the series by trigram similarity, tolerating misspellings, as a direct scoring does."""
+    meta = _metadata()
+    meta_index = ra.MetaIndex(meta)
+    for phrase, top_k in (("unemploymnet rate persons", 4), ("EMPLOYED, females", 3), ("gross product", 10)):
+        expected = _fuzzy_reference(meta, phrase, top_k)
+        for source in (meta, meta_index):
+            found = ra.search_abs_meta(source, {phrase: mc.did}, fuzzy=True, top_k=top_k)
+            assert list(found.index) == [series_id for series_id, _score in expected], phrase
+            assert np.allclose(found["Score"], [score for _series_id, score in expected])
+
+    found = ra.search_abs_meta(meta_index, {"unemploymnet rate persons": mc.did, "Trend": mc.stype}, fuzzy=True)
+    assert found.index[0] == "A001000T"
+    assert set(found[mc.stype]) == {"Trend"}  # other columns still filter
+    assert found["Score"].is_monotonic_decreasing
+    assert len(ra.search_abs_meta(meta_index, {"zzzz": mc.did}, fuzzy=True)) == 0
+
+    raised = False
+    try:
+        ra.search_abs_meta(meta_index, {"Trend": mc.stype}, fuzzy=True)
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for a fuzzy search with no description term"
+
+
+if __name__ == "__main__":
+    test_matches_scan()
+    test_find_abs_id_with_index()
+    test_repeat_searches_use_cached_masks()
+    test_find_abs_ids_matches_find_abs_id()
+    test_select_shares_index()
+    test_fuzzy_search_ranks()
+    print("All metadata index tests passed.")
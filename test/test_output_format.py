@@ -0,0 +1,88 @@
+"""Test the Arrow-backed pandas and Polars output modes of the readers.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from synthetic_abs import abs_zip
+
+import readabs as ra
+
+
+# --- tests
+def test_arrow_output_matches_pandas() -> None:
+    """output="arrow" gives ArrowDtype columns holding the same values, with NaN as null."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2)
+        data, meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        arrow_data, arrow_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), output="arrow")
+
+    assert list(arrow_data) == list(data)
+    for table, frame in data.items():
+        converted = arrow_data[table]
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in converted.dtypes)
+        assert list(converted.columns) == list(frame.columns)
+        assert list(converted.index) == list(frame.index.start_time.date)
+        assert np.array_equal(converted.isna().to_numpy(), frame.isna().to_numpy())
+        assert np.array_equal(converted.to_numpy(dtype=float, na_value=np.nan), frame.to_numpy(), equal_nan=True)
+    assert list(arrow_meta["Series ID"]) == list(meta["Series ID"])
+
+
+def test_polars_output_matches_pandas() -> None:
+    """output="polars" gives Polars frames with a leading period date column."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=1, freq="Quarter")
+        data, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        polars_data, polars_meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), output="polars")
+
+    assert isinstance(polars_meta, pl.DataFrame)
+    for table, frame in data.items():
+        converted = polars_data[table]
+        assert isinstance(converted, pl.DataFrame)
+        assert converted.columns == ["period", *frame.columns]
+        assert converted.schema["period"] == pl.Date
+        for series_id in frame.columns:
+            assert converted[series_id].null_count() == frame[series_id].isna().sum()
+
+
+def test_invalid_output_raises() -> None:
+    """An unknown output format is rejected before anything is read."""
+    raised = False
+    try:
+        ra.read_abs_cat("9999.0", zip_file="never-read.zip", output="numpy")  # type: ignore[call-overload]
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for an unsupported output"
+
+
+def test_duplicate_labels_raise() -> None:
+    """Columns whose labels clash as strings are rejected rather than silently merged."""
+    output_format = import_module("readabs.output_format")
+    index = pd.period_range("2020-01", periods=3, freq="M")
+    for frame in (
+        pd.DataFrame([[1.0, 2.0]] * 3, index=index, columns=["A1", "A1"]),
+        pd.DataFrame([[1.0, 2.0]] * 3, index=index, columns=[1, "1"]),
+        pd.DataFrame([[1.0]] * 3, index=index, columns=["period"]),
+    ):
+        for output in ("arrow", "polars"):
+            raised = False
+            try:
+                output_format.frame_to_output(frame, output)
+            except ValueError:
+                raised = True
+            assert raised, f"expected ValueError for duplicate labels {list(frame.columns)} ({output})"
+
+
+if __name__ == "__main__":
+    test_arrow_output_matches_pandas()
+    test_polars_output_matches_pandas()
+    test_invalid_output_raises()
+    test_duplicate_labels_raise()
+    print("All output format tests passed.")
@@ -0,0 +1,135 @@
+"""Test rba_catalogue(): the concurrent fetch of the RBA pages, and the parsed copy kept between sessions.
+
+These tests are hermetic: the download of the RBA statistical tables and
+historical data pages is patched to serve synthetic pages, and the parsed
+copy is written to a temporary folder, so no network access is made.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from synthetic_abs import rba_links_page
+
+import readabs as ra
+
+catalogue_module = import_module("readabs.rba_catalogue")
+parsed_module = import_module("readabs.parsed_cache")
+
+
+class _FakeRBA:
+    """Serve synthetic RBA pages, counting how many fetches run at once."""
+
+    def __init__(self, n_tables: int = 12, delay: float = 0.0) -> None:
+        self.pages = {
+            catalogue_module.RBA_PAGES[0][0]: rba_links_page(n_tables=n_tables),
+            catalogue_module.RBA_PAGES[1][0]: rba_links_page(history=True, n_tables=n_tables),
+        }
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.fetches = 0
+        self.lock = threading.Lock()
+
+    def get_file(self, url: str, **_kwargs: object) -> bytes:
+        with self.lock:
+            self.active += 1
+            self.fetches += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)  # a slow download
+            return self.pages[url]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    @contextmanager
+    def patches(self, folder: Path) -> Iterator[mock.MagicMock]:
+        """Patch in the fake pages and the temporary folder; yield a spy on the link capture."""
+        spy = mock.MagicMock(wraps=catalogue_module._excel_link_capture)  # noqa: SLF001
+        with (
+            mock.patch.object(catalogue_module, "get_file", self.get_file),
+            mock.patch.object(catalogue_module, "_excel_link_capture", spy),
+            mock.patch.object(parsed_module, "PARSED_CACHE_PATH", folder),
+        ):
+            yield spy
+
+
+# --- tests
+def test_catalogue_entries() -> None:
+    """The Excel links on both pages are captured, with the names of the historical tables tidied."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp, _FakeRBA().patches(Path(tmp)):
+        catalogue = ra.rba_catalogue()
+
+    assert catalogue.index.name == "Table"
+    assert list(catalogue.columns) == ["Description", "URL"]
+    assert len(catalogue) == 25  # 12 current, 12 historical and one exchange rates table
+    assert catalogue.loc["F1", "Description"] == "Synthetic Table & Series 1"  # spans and entities are tidied
+    assert catalogue.loc["F1", "URL"] == "https://www.rba.gov.au/statistics/tables/xls/f01hist.xlsx"
+    assert catalogue.loc["F0", "URL"].endswith("f00hist.xlsx")  # a later .xls link does not replace .xlsx
+    assert catalogue.loc["Z:F3-Daily-1963", "Description"] == "Interest Rates & Yields - Daily - 1963"
+    assert catalogue.loc["Z:F11.1", "URL"].endswith("f11hist-1969-2009.xls")
+    assert "X1" not in catalogue.index  # not an Excel file
+    assert "Z:E4" not in catalogue.index  # an excluded historical table
+    ra.clear_caches()
+
+
+def test_pages_fetched_concurrently() -> None:
+    """The two RBA pages are downloaded at the same time, not one after another."""
+    ra.clear_caches()
+    fake = _FakeRBA(delay=0.2)
+    with TemporaryDirectory() as tmp, fake.patches(Path(tmp)):
+        ra.rba_catalogue()
+    assert fake.peak == len(catalogue_module.RBA_PAGES)
+    ra.clear_caches()
+
+
+def test_parsed_once_per_page() -> None:
+    """A new session loads the parsed catalogue; a changed page is parsed again."""
+    ra.clear_caches()
+    fake = _FakeRBA()
+    with TemporaryDirectory() as tmp, fake.patches(Path(tmp)) as spy:
+        first = ra.rba_catalogue()
+        ra.clear_caches()  # as if in a new session
+        second = ra.rba_catalogue()
+        assert spy.call_count == len(catalogue_module.RBA_PAGES)  # one capture per page, in the first session
+        assert fake.fetches == 2 * len(catalogue_module.RBA_PAGES)  # the pages are still fetched, for the key
+
+        fake.pages[catalogue_module.RBA_PAGES[0][0]] = rba_links_page(n_tables=15)
+        ra.clear_caches()
+        changed = ra.rba_catalogue()
+        saved = list(Path(tmp).glob("parsed--rba-catalogue--*.pkl"))
+
+    assert second.equals(first)
+    assert spy.call_count == 2 * len(catalogue_module.RBA_PAGES)
+    assert len(saved) == 1
+    assert len(changed) == len(first) + 3
+    ra.clear_caches()
+
+
+def test_parse_uses_given_content() -> None:
+    """The parse reads the pages it is given, not those fetched in the current call."""
+    ra.clear_caches()
+    fake = _FakeRBA()
+    with TemporaryDirectory() as tmp, fake.patches(Path(tmp)):
+        catalogue = ra.rba_catalogue()
+        fake.pages[catalogue_module.RBA_PAGES[0][0]] = rba_links_page(n_tables=15)
+        joined = b"\0".join(fake.pages[url] for url, _prefix in catalogue_module.RBA_PAGES)
+        parsed = catalogue_module._parse_joined(joined)  # noqa: SLF001
+
+    assert len(parsed) == len(catalogue) + 3
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_catalogue_entries()
+    test_pages_fetched_concurrently()
+    test_parsed_once_per_page()
+    test_parse_uses_given_content()
+    print("All RBA catalogue tests passed.")
@@ -0,0 +1,201 @@
+"""Test read_abs_by_desc(), which gets ABS series by searching their descriptions.
+
+These tests are hermetic: the ABS catalogue map is patched to point each
+catalogue at a synthetic landing page, and the workbooks on that page are
+synthesised locally and read through the zip_file path, so no network
+access is made.
+"""
+
+import copy
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import mock
+
+import pandas as pd
+from pandas import DataFrame
+from synthetic_abs import abs_zip
+
+import readabs as ra
+from readabs import metacol as mc
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+cats_module = import_module("readabs.read_abs_cats")
+directory_module = import_module("readabs.series_directory")
+
+CATS = {"1111.0": "1111", "2222.0": "2222", "3333.0": "3333"}  # catalogue -> table prefix
+URL_ROOT = "https://www.abs.gov.au/synthetic/"
+
+
+class _FakeABS:
+    """Serve a synthetic zip per catalogue, counting the reads of each, and how many run at once."""
+
+    def __init__(self, folder: Path, delay: float = 0.0) -> None:
+        self.zips = {
+            f"{URL_ROOT}{cat}": abs_zip(folder / f"{cat}.zip", n_tables=2, table_prefix=prefix)
+            for cat, prefix in CATS.items()
+        }
+        self.folder = folder
+        self.delay = delay
+        self.reads: Counter[str] = Counter()
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def catalogue(self, **_kwargs: bool) -> DataFrame:
+        return DataFrame({"URL": [f"{URL_ROOT}{cat}" for cat in CATS]}, index=list(CATS))
+
+    def iter_url(self, url: str, args: dict[str, object]) -> Iterator[dict[str, DataFrame]]:
+        with self.lock:
+            self.reads[url.removeprefix(URL_ROOT)] += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)  # a slow download
+            yield from grab_module.iter_abs_zip(self.zips[url], index_only=bool(args["index_only"]))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    @contextmanager
+    def patches(self) -> Iterator[None]:
+        with (
+            mock.patch.multiple(grab_module, abs_catalogue=self.catalogue, _iter_url=self.iter_url),
+            mock.patch.object(cats_module, "abs_catalogue", self.catalogue),
+            mock.patch.object(directory_module, "DIRECTORY_PATH", self.folder / "series-directory.pkl"),
+        ):
+            yield
+
+
+def _wanted() -> dict[str, dict[str, Any]]:
+    """Return a wanted dictionary that spans the catalogues, in an interleaved order."""
+    wanted = {}
+    for number in range(6):
+        for cat, prefix in CATS.items():
+            table = f"{prefix}{number % 2 + 1:03d}"
+            wanted[f"{cat} {table} {number}"] = {
+                "cat": cat,
+                "table": table,
+                "did": f"Synthetic item {number} ;  Persons ;",
+            }
+    wanted["one table"] = {
+        "cat": "1111.0",
+        "table": "1111002",
+        "did": "Synthetic item 7 ;",
+        "tables": ("1111002",),
+    }
+    return wanted
+
+
+def _one_at_a_time(wanted: dict[str, dict[str, Any]]) -> tuple[dict[str, pd.Series], DataFrame]:
+    """Get each item with its own read and search, and grow the metadata one item at a time."""
+    found, found_meta = {}, DataFrame()
+    for key, item in wanted.items():
+        retrieval = {"tables": item["tables"]} if "tables" in item else {}
+        data, meta = ra.read_abs_cat(item["cat"], **retrieval)
+        selector = {item["cat"]: mc.cat, item["table"]: mc.table, item["did"]: mc.did}
+        table, series_id, units = ra.find_abs_id(meta, selector)
+        found[key] = data[table][series_id]
+        rows = (meta[mc.table] == table) & (meta[mc.id] == series_id) & (meta[mc.unit] == units)
+        found_meta = pd.concat([found_meta, meta.loc[rows]])
+    return found, found_meta
+
+
+# --- tests
+def test_matches_one_at_a_time() -> None:
+    """The batched reads and searches give the same series and metadata, in the same order."""
+    ra.clear_caches()
+    wanted = _wanted()
+    unchanged = copy.deepcopy(wanted)
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp))
+        with fake.patches():
+            selected, selected_meta = ra.read_abs_by_desc(wanted)
+            reads = dict(fake.reads)
+            expected, expected_meta = _one_at_a_time(wanted)
+
+    assert wanted == unchanged  # the wanted dictionaries are not consumed
+    assert list(selected) == list(expected)
+    for key, series in selected.items():
+        assert series.equals(expected[key]), key
+        assert series.name == expected[key].name
+    assert selected_meta.equals(expected_meta)
+    assert reads == {"1111.0": 2, "2222.0": 1, "3333.0": 1}  # once for each set of retrieval arguments
+    ra.clear_caches()
+
+
+def test_reads_catalogues_concurrently() -> None:
+    """The catalogues wanted are read at the same time, not one after another."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp), delay=0.2)
+        with fake.patches():
+            ra.read_abs_by_desc(_wanted())
+    assert fake.peak > 1
+    ra.clear_caches()
+
+
+def test_given_data_and_errors() -> None:
+    """A list of descriptions is searched in the data given; the first bad item raises as before."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp))
+        with fake.patches():
+            data, meta = ra.read_abs_cat("2222.0")
+            dids = [f"Synthetic item {number} ;  Persons ;" for number in (3, 1, 4)]
+            selected, selected_meta = ra.read_abs_by_desc(dids, abs_dict=data, abs_meta=meta, table="2222002")
+
+            raised = False
+            try:
+                ra.read_abs_by_desc(dids, abs_dict=data, abs_meta=meta)  # each item is in both tables
+            except ValueError:
+                raised = True
+            assert raised, "expected ValueError for an ambiguous description"
+
+            raised = False
+            try:
+                ra.read_abs_by_desc({"good": dids[0], "bad": 42}, abs_dict=data, abs_meta=meta)  # type: ignore[dict-item]
+            except TypeError:
+                raised = True
+            assert raised, "expected TypeError for a wanted value that is neither a string nor a dictionary"
+
+    assert list(selected) == dids
+    assert [series.name for series in selected.values()] == list(selected_meta[mc.id])
+    assert set(selected_meta[mc.table]) == {"2222002"}
+    ra.clear_caches()
+
+
+def test_selects_on_data_type() -> None:
+    """A "dtype" key selects on the data type column; it is not passed to read_abs_cat()."""
+    ra.clear_caches()
+    item = {"cat": "1111.0", "table": "1111001", "did": "Synthetic item 1 ;  Persons ;"}
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp))
+        with fake.patches():
+            selected, selected_meta = ra.read_abs_by_desc({"x": {**item, "dtype": "STOCK"}})
+            expected, _meta = ra.read_abs_by_desc({"x": item})
+
+            raised = False
+            try:
+                ra.read_abs_by_desc({"x": {**item, "dtype": "FLOW"}})
+            except ValueError:
+                raised = True
+            assert raised, "expected ValueError for a data type no series has"
+
+    assert selected["x"].equals(expected["x"])
+    assert list(selected_meta[mc.dtype]) == ["STOCK"]
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_matches_one_at_a_time()
+    test_reads_catalogues_concurrently()
+    test_given_data_and_errors()
+    test_selects_on_data_type()
+    print("All read_abs_by_desc tests passed.")
@@ -0,0 +1,124 @@
+"""Test read_abs_cats(), which reads several ABS catalogues concurrently.
+
+These tests are hermetic: the ABS catalogue map is patched to point each
+catalogue at a synthetic landing page, and the workbooks on that page are
+synthesised locally and read through the zip_file path, so no network
+access is made.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from pandas import DataFrame
+from synthetic_abs import abs_zip
+
+import readabs as ra
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+cats_module = import_module("readabs.read_abs_cats")
+directory_module = import_module("readabs.series_directory")
+
+CATS = ("1111.0", "2222.0", "3333.0", "4444.0")
+URL_ROOT = "https://www.abs.gov.au/synthetic/"
+
+
+class _FakeABS:
+    """Serve a synthetic zip per catalogue, counting how many are being read at once."""
+
+    def __init__(self, folder: Path, delay: float = 0.0) -> None:
+        self.zips = {
+            f"{URL_ROOT}{cat}": abs_zip(folder / f"{cat}.zip", n_tables=1, n_periods=200 + 10 * number)
+            for number, cat in enumerate(CATS)
+        }
+        self.folder = folder
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def catalogue(self, **_kwargs: bool) -> DataFrame:
+        return DataFrame({"URL": [f"{URL_ROOT}{cat}" for cat in CATS]}, index=list(CATS))
+
+    def iter_url(self, url: str, args: dict[str, object]) -> Iterator[dict[str, DataFrame]]:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)  # a slow download
+            yield from grab_module.iter_abs_zip(self.zips[url], index_only=bool(args["index_only"]))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    @contextmanager
+    def patches(self) -> Iterator[None]:
+        with (
+            mock.patch.multiple(grab_module, abs_catalogue=self.catalogue, _iter_url=self.iter_url),
+            mock.patch.object(directory_module, "DIRECTORY_PATH", self.folder / "series-directory.pkl"),
+        ):
+            yield
+
+
+# --- tests
+def test_matches_sequential_reads() -> None:
+    """Each catalogue gets the same (data, meta) as a read_abs_cat() call of its own."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp))
+        with fake.patches(), mock.patch.object(cats_module, "abs_catalogue", fake.catalogue):
+            results = ra.read_abs_cats([*CATS, CATS[0]], workers=2)
+            ra.clear_caches()
+            expected = {cat: ra.read_abs_cat(cat) for cat in CATS}
+
+    assert list(results) == list(CATS)
+    for cat, (data, meta) in results.items():
+        expected_data, expected_meta = expected[cat]
+        assert list(data) == list(expected_data)
+        assert all(data[table].equals(expected_data[table]) for table in data)
+        assert meta.equals(expected_meta)
+    ra.clear_caches()
+
+
+def test_reads_concurrently() -> None:
+    """The catalogues are read at the same time, not one after another."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp), delay=0.2)
+        with fake.patches(), mock.patch.object(cats_module, "abs_catalogue", fake.catalogue):
+            ra.read_abs_cats(CATS, workers=4)
+    assert fake.peak > 1
+    ra.clear_caches()
+
+
+def test_failures_reported_per_catalogue() -> None:
+    """A catalogue that cannot be read does not stop the others."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp:
+        fake = _FakeABS(Path(tmp))
+        with fake.patches(), mock.patch.object(cats_module, "abs_catalogue", fake.catalogue):
+            group: ExceptionGroup | None = None
+            try:
+                ra.read_abs_cats([CATS[0], "9999.0", CATS[1]])
+            except ExceptionGroup as e:
+                group = e
+            lenient = ra.read_abs_cats([CATS[0], "9999.0", CATS[1]], ignore_errors=True)
+
+    assert group is not None, "expected an ExceptionGroup for the unknown catalogue"
+    assert len(group.exceptions) == 1
+    assert isinstance(group.exceptions[0], ValueError)
+    assert any("9999.0" in note for note in group.exceptions[0].__notes__)
+    assert list(lenient) == [CATS[0], CATS[1]]
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_matches_sequential_reads()
+    test_reads_concurrently()
+    test_failures_reported_per_catalogue()
+    print("All read_abs_cats tests passed.")
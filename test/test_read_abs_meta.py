@@ -0,0 +1,76 @@
+"""Test read_abs_meta(), which reads only the Index sheets of the ABS workbooks.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+import zipfile
+from collections import Counter
+from importlib import import_module
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from synthetic_abs import abs_workbook, abs_zip
+
+import readabs as ra
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+
+
+# --- tests
+def test_meta_matches_read_abs_cat() -> None:
+    """read_abs_meta() returns the same metadata as read_abs_cat()."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=3, n_data_sheets=2, header_row=11)
+        _data, expected = ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        meta = ra.read_abs_meta("9999.0", zip_file=str(zip_path))
+
+    assert meta.equals(expected)
+    assert len(meta) == 30
+
+
+def test_index_only_skips_data_sheets() -> None:
+    """grab_abs_zip(index_only=True) returns just the Index sheet of each workbook."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=2, n_data_sheets=3)
+        everything = ra.grab_abs_zip(zip_path)
+        index_only = ra.grab_abs_zip(zip_path, index_only=True)
+
+    assert len(everything) == 8
+    assert sorted(index_only) == ["9999001---Index", "9999002---Index"]
+    for name, frame in index_only.items():
+        assert frame.equals(everything[name])
+
+
+def test_index_only_inflates_only_the_head_of_data_sheets() -> None:
+    """With index_only, each Data sheet's XML is inflated only as far as its <dimension>, never parsed."""
+    raw = abs_workbook("9999001", n_series=40, n_periods=780, n_data_sheets=2)
+    with zipfile.ZipFile(BytesIO(raw)) as archive:
+        sizes = {i.filename: i.file_size for i in archive.infolist() if i.filename.startswith("xl/worksheets/")}
+
+    inflated: Counter[str] = Counter()
+    read = zipfile.ZipExtFile.read
+
+    def counting_read(self: zipfile.ZipExtFile, n: int = -1) -> bytes:
+        data = read(self, n)
+        inflated[self.name] += len(data)
+        return data
+
+    with mock.patch.object(zipfile.ZipExtFile, "read", counting_read):
+        workbook = grab_module._add_excel_bytes({}, raw, "9999001", {"index_only": True})  # noqa: SLF001
+
+    assert list(workbook) == ["9999001---Index"]
+    index_part, *data_parts = sorted(sizes)  # the Index sheet is the first sheet
+    assert inflated[index_part] >= sizes[index_part]
+    for part in data_parts:
+        assert sizes[part] > 200_000
+        assert inflated[part] < sizes[part] / 10, (part, inflated[part], sizes[part])
+
+
+if __name__ == "__main__":
+    test_meta_matches_read_abs_cat()
+    test_index_only_skips_data_sheets()
+    test_index_only_inflates_only_the_head_of_data_sheets()
+    print("All read_abs_meta tests passed.")
@@ -0,0 +1,106 @@
+"""Test read_abs_panel(), which aligns series drawn from several catalogues.
+
+These tests are hermetic: the ABS catalogue map is patched to point each
+catalogue at a synthetic landing page, and the workbooks on that page are
+synthesised locally and read through the zip_file path, so no network
+access is made.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from pandas import DataFrame
+from synthetic_abs import abs_zip, series_ids
+
+import readabs as ra
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+cats_module = import_module("readabs.read_abs_cats")
+directory_module = import_module("readabs.series_directory")
+
+URL_ROOT = "https://www.abs.gov.au/synthetic/"
+MONTHLY, QUARTERLY = "1111.0", "2222.0"
+
+
+@contextmanager
+def _patches(folder: Path) -> Iterator[None]:
+    """Patch the catalogue map and the downloads, for a monthly and a quarterly catalogue."""
+    zips = {
+        f"{URL_ROOT}{MONTHLY}": abs_zip(folder / "monthly.zip", n_tables=2, table_prefix="1111"),
+        f"{URL_ROOT}{QUARTERLY}": abs_zip(
+            folder / "quarterly.zip", n_tables=1, table_prefix="2222", freq="Quarter"
+        ),
+    }
+    catalogue = DataFrame({"URL": list(zips)}, index=[MONTHLY, QUARTERLY])
+
+    def iter_url(url: str, args: dict[str, object]) -> Iterator[dict[str, DataFrame]]:
+        yield from grab_module.iter_abs_zip(zips[url], index_only=bool(args["index_only"]))
+
+    def lookup(**_kwargs: bool) -> DataFrame:
+        return catalogue
+
+    with (
+        mock.patch.multiple(grab_module, abs_catalogue=lookup, _iter_url=iter_url),
+        mock.patch.object(cats_module, "abs_catalogue", lookup),
+        mock.patch.object(directory_module, "DIRECTORY_PATH", folder / "series-directory.pkl"),
+    ):
+        yield
+
+
+# --- tests
+def test_panel_aligned_by_frequency() -> None:
+    """One DataFrame per frequency, matching read_abs_series(), in the order requested."""
+    ra.clear_caches()
+    monthly_ids = series_ids("1111002", 2) + series_ids("1111001", 1)  # across two tables
+    quarterly_ids = series_ids("2222001", 2)
+    wanted = [
+        (MONTHLY, monthly_ids[0]),
+        (QUARTERLY, quarterly_ids[1]),
+        (MONTHLY, monthly_ids[1]),
+        (MONTHLY, monthly_ids[2]),
+        (QUARTERLY, quarterly_ids[0]),
+        (MONTHLY, monthly_ids[0]),  # a repeat
+    ]
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)):
+        panel, meta = ra.read_abs_panel(wanted, workers=2)
+        monthly, monthly_meta = ra.read_abs_series(MONTHLY, monthly_ids)
+        quarterly, quarterly_meta = ra.read_abs_series(QUARTERLY, [quarterly_ids[1], quarterly_ids[0]])
+
+    assert sorted(panel) == ["M", "Q-DEC"]
+    assert panel["M"].equals(monthly)
+    assert panel["Q-DEC"].equals(quarterly)
+    assert list(meta.index) == [monthly_ids[0], quarterly_ids[1], *monthly_ids[1:], quarterly_ids[0]]
+    # read_abs_series() metadata is transposed, so its columns are all of object dtype
+    assert meta.loc[monthly_ids].astype(object).equals(monthly_meta)
+    assert meta.loc[[quarterly_ids[1], quarterly_ids[0]]].astype(object).equals(quarterly_meta)
+    ra.clear_caches()
+
+
+def test_missing_series() -> None:
+    """A series that is not in its catalogue raises, unless errors are ignored."""
+    ra.clear_caches()
+    present = series_ids("1111001", 1)[0]
+    wanted = [(MONTHLY, present), (MONTHLY, "A9999999X")]
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)):
+        raised = False
+        try:
+            ra.read_abs_panel(wanted)
+        except ValueError:
+            raised = True
+        panel, meta = ra.read_abs_panel(wanted, ignore_errors=True)
+
+    assert raised, "expected ValueError for a series that is not in the catalogue"
+    assert list(panel) == ["M"]
+    assert list(panel["M"].columns) == [present]
+    assert list(meta.index) == [present]
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_panel_aligned_by_frequency()
+    test_missing_series()
+    print("All read_abs_panel tests passed.")
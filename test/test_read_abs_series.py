@@ -0,0 +1,103 @@
+"""Test that read_abs_series() assembles its result as the series-by-series loop did.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from pandas import DataFrame, Index, concat
+from synthetic_abs import abs_workbook, series_ids
+
+import readabs as ra
+from readabs import metacol as mc
+
+MONTHLY_A, MONTHLY_B, QUARTERLY = "9999001", "9999002", "9999003"
+
+
+def _mixed_zip(path: Path) -> str:
+    """Write a catalogue of two monthly tables (one over two Data sheets) and a quarterly table."""
+    with zipfile.ZipFile(path, "w") as zipped:
+        zipped.writestr(f"{MONTHLY_A}.xlsx", abs_workbook(MONTHLY_A, n_data_sheets=2, seed=1))
+        zipped.writestr(f"{MONTHLY_B}.xlsx", abs_workbook(MONTHLY_B, n_periods=150, start_year=1978, seed=2))
+        zipped.writestr(f"{QUARTERLY}.xlsx", abs_workbook(QUARTERLY, freq="Quarter", seed=3))
+    return str(path)
+
+
+def _loop_reference(
+    zip_file: str, wanted: list[str], *, ignore_errors: bool = False
+) -> tuple[DataFrame, DataFrame]:
+    """Assemble the result one series at a time, as read_abs_series() used to."""
+    cat_data, cat_meta = ra.read_abs_cat("9999.0", zip_file=zip_file)
+    cat_meta.index = Index(cat_meta[mc.id])
+    cat_meta = cat_meta.groupby(cat_meta.index).first()
+    return_data, return_meta = DataFrame(), DataFrame()
+    for identifier in wanted:
+        if identifier not in cat_meta.index:
+            if ignore_errors:
+                continue
+            raise ValueError(identifier)
+        data_series = cat_data[str(cat_meta.loc[identifier, mc.table])][identifier]
+        if len(return_data) > 0 and return_data.index.freq != data_series.index.freq:  # type: ignore[attr-defined]
+            if ignore_errors:
+                continue
+            raise ValueError(identifier)
+        if len(return_data) > 0:
+            return_data = return_data.reindex(return_data.index.union(data_series.index))
+        return_data[identifier] = data_series
+        return_meta = concat([return_meta, cat_meta.loc[identifier]], axis=1)
+    return return_data, return_meta.T
+
+
+# --- tests
+def test_matches_loop_assembly() -> None:
+    """The vectorised assembly gives the same data and metadata as the loop."""
+    a_ids, b_ids, q_ids = series_ids(MONTHLY_A, 10), series_ids(MONTHLY_B, 10), series_ids(QUARTERLY, 10)
+    cases = [
+        [a_ids[3]],
+        [b_ids[2], a_ids[7], a_ids[1], b_ids[9]],  # across tables and Data sheets, with ragged starts
+        [a_ids[0], a_ids[5], a_ids[0]],  # a repeat
+        [q_ids[4], q_ids[0]],
+    ]
+    lenient = [
+        [a_ids[2], "A0000000X", b_ids[4]],  # a missing series
+        [a_ids[2], q_ids[1], b_ids[4]],  # a frequency mismatch
+        ["A0000000X"],  # nothing found
+    ]
+    with TemporaryDirectory() as tmp:
+        zip_file = _mixed_zip(Path(tmp) / "mixed.zip")
+        for wanted in cases:
+            data, meta = ra.read_abs_series("9999.0", wanted, zip_file=zip_file)
+            expected_data, expected_meta = _loop_reference(zip_file, wanted)
+            assert data.equals(expected_data), wanted
+            assert meta.equals(expected_meta), wanted
+        for wanted in lenient:
+            data, meta = ra.read_abs_series("9999.0", wanted, zip_file=zip_file, ignore_errors=True)
+            expected_data, expected_meta = _loop_reference(zip_file, wanted, ignore_errors=True)
+            assert data.equals(expected_data), wanted
+            assert meta.equals(expected_meta), wanted
+
+
+def test_errors_raised_in_request_order() -> None:
+    """Without ignore_errors, the first problem in the request is reported."""
+    a_ids, q_ids = series_ids(MONTHLY_A, 10), series_ids(QUARTERLY, 10)
+    with TemporaryDirectory() as tmp:
+        zip_file = _mixed_zip(Path(tmp) / "mixed.zip")
+        for wanted, problem in (
+            ([a_ids[0], "A0000000X", q_ids[0]], "not found"),
+            ([a_ids[0], q_ids[0], "A0000000X"], "Frequency mismatch"),
+        ):
+            message = ""
+            try:
+                ra.read_abs_series("9999.0", wanted, zip_file=zip_file)
+            except ValueError as e:
+                message = str(e)
+            assert problem in message, (wanted, message)
+
+
+if __name__ == "__main__":
+    test_matches_loop_assembly()
+    test_errors_raised_in_request_order()
+    print("All read_abs_series tests passed.")
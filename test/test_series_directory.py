@@ -0,0 +1,166 @@
+"""Test the persistent directory of ABS series (lookup_series() and directory()).
+
+These tests are hermetic: the ABS catalogue map, the landing page links and
+the downloads are patched to serve synthetic zip files, and the directory is
+written to a temporary folder, so no network access is made.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from pandas import DataFrame
+from synthetic_abs import abs_zip, series_ids
+
+import readabs as ra
+from readabs import metacol as mc
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+directory_module = import_module("readabs.series_directory")
+
+URL_ROOT = "https://www.abs.gov.au/synthetic/"
+MONTHLY, QUARTERLY = "1111.0", "2222.0"
+
+
+@contextmanager
+def _patches(folder: Path) -> Iterator[Path]:
+    """Serve two synthetic catalogues, each a landing page with one zip file; yield the directory file."""
+    zips = {
+        f"{URL_ROOT}{MONTHLY}": abs_zip(folder / "monthly.zip", n_tables=2, table_prefix="1111"),
+        f"{URL_ROOT}{QUARTERLY}": abs_zip(
+            folder / "quarterly.zip", n_tables=1, table_prefix="2222", freq="Quarter"
+        ),
+    }
+    catalogue = DataFrame({"URL": list(zips)}, index=[MONTHLY, QUARTERLY])
+
+    def lookup(**_kwargs: bool) -> DataFrame:
+        return catalogue
+
+    def links(url: str, **_kwargs: object) -> dict[str, list[str]]:
+        return {".zip": [f"{url}/all-tables.zip"]}
+
+    def get_file(link: str, **_kwargs: object) -> bytes:
+        return zips[link.removesuffix("/all-tables.zip")].read_bytes()
+
+    path = folder / "series-directory.pkl"
+    with (
+        mock.patch.multiple(grab_module, abs_catalogue=lookup, get_abs_links=links, get_file=get_file),
+        mock.patch.object(directory_module, "DIRECTORY_PATH", path),
+        mock.patch.object(directory_module, "_held", directory_module._Held()),  # noqa: SLF001
+    ):
+        yield path
+
+
+# --- tests
+def test_lookup_after_read() -> None:
+    """Reading a catalogue adds its series, with their table, workbook URL and metadata."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as path:
+        _data, meta = ra.read_abs_cat(MONTHLY)
+        series_id = series_ids("1111002", 1)[0]
+        entry = ra.lookup_series(series_id)
+        found = ra.directory()
+        assert path.exists()
+
+    assert entry[mc.cat] == MONTHLY
+    assert entry[mc.table] == "1111002"
+    assert entry[directory_module.WORKBOOK_URL] == f"{URL_ROOT}{MONTHLY}/all-tables.zip"
+    for column in (mc.did, mc.unit, mc.freq, mc.stype, mc.tdesc):
+        assert entry[column] == meta.loc[series_id, column]
+    assert sorted(found.index) == sorted(meta[mc.id])
+    assert found[mc.unit].dtype == "category"
+    ra.clear_caches()
+
+
+def test_persists_and_grows() -> None:
+    """The directory survives a new session, and each catalogue read adds to it."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)):
+        ra.read_abs_meta(MONTHLY)
+        with mock.patch.object(directory_module, "_held", directory_module._Held()):  # noqa: SLF001
+            ra.read_abs_cat(QUARTERLY)  # as if in a new session
+        monthly = ra.directory(MONTHLY)
+        quarterly = ra.directory(QUARTERLY)
+        everything = ra.directory()
+
+    assert len(monthly) == 20
+    assert len(quarterly) == 10
+    assert len(everything) == len(monthly) + len(quarterly)
+    assert set(quarterly[mc.freq]) == {"Quarter"}
+    ra.clear_caches()
+
+
+def test_partial_read_replaces_its_tables() -> None:
+    """A read of some tables replaces those tables only; a full read replaces the whole catalogue."""
+    ra.clear_caches()
+    stale = DataFrame(
+        {mc.id: ["A11110099X", "A11119999X"], mc.table: ["1111001", "1111999"], mc.cat: [MONTHLY, MONTHLY]}
+    )
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)):
+        directory_module.update_directory(stale)
+        ra.read_abs_cat(MONTHLY, tables=("1111001",))
+        after_partial = ra.directory(MONTHLY)
+        ra.read_abs_cat(MONTHLY)
+        after_full = ra.directory(MONTHLY)
+
+    assert "A11110099X" not in after_partial.index  # its table was re-read
+    assert "A11119999X" in after_partial.index  # another table, not re-read
+    assert set(after_partial[mc.table]) == {"1111001", "1111999"}
+    assert "A11119999X" not in after_full.index
+    assert len(after_full) == 20
+    ra.clear_caches()
+
+
+def test_unchanged_catalogue_not_rewritten() -> None:
+    """Reading a catalogue again, with the same series, leaves the file alone; a change is saved."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as path:
+        ra.read_abs_cat(MONTHLY)
+        written = path.stat().st_mtime_ns
+        save = directory_module._save  # noqa: SLF001
+        with mock.patch.object(directory_module, "_save", wraps=save) as saves:
+            ra.clear_caches()  # not memoised: parsed and added again
+            ra.read_abs_cat(MONTHLY)
+            ra.read_abs_meta(MONTHLY)
+            assert saves.call_count == 0
+            assert path.stat().st_mtime_ns == written
+
+            meta = ra.read_abs_meta(MONTHLY)
+            sources = dict.fromkeys(meta[mc.table], f"{URL_ROOT}{MONTHLY}/all-tables.zip")
+            directory_module.update_directory(meta, sources, complete=True)
+            assert saves.call_count == 0
+
+            series_id = meta.index[0]
+            meta.loc[series_id, mc.unit] = "Changed"
+            directory_module.update_directory(meta, sources, complete=True)
+            assert saves.call_count == 1
+            assert ra.lookup_series(series_id)[mc.unit] == "Changed"
+    ra.clear_caches()
+
+
+def test_local_zip_not_added() -> None:
+    """Reads of a local zip file leave the directory alone; an unknown ID raises KeyError."""
+    ra.clear_caches()
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as path:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=1)
+        ra.read_abs_cat("9999.0", zip_file=str(zip_path))
+        assert not path.exists()
+        raised = False
+        try:
+            ra.lookup_series(series_ids("9999001", 1)[0])
+        except KeyError:
+            raised = True
+    assert raised, "expected KeyError for a series that is not in the directory"
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_lookup_after_read()
+    test_persists_and_grows()
+    test_partial_read_replaces_its_tables()
+    test_unchanged_catalogue_not_rewritten()
+    test_local_zip_not_added()
+    print("All series directory tests passed.")
@@ -0,0 +1,153 @@
+"""Test read_abs_series() without a catalogue number, through the series directory.
+
+These tests are hermetic: the ABS catalogue map, the landing page links and
+the downloads are patched to serve synthetic workbooks (one zip file and one
+Excel file per table on each landing page), and the series directory is
+written to a temporary folder, so no network access is made.
+"""
+
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import import_module
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from pandas import DataFrame
+from synthetic_abs import abs_workbook, series_ids
+
+import readabs as ra
+from readabs import metacol as mc
+
+grab_module = import_module("readabs.grab_abs_url")  # the module, not the function of the same name
+directory_module = import_module("readabs.series_directory")
+cat_module = import_module("readabs.read_abs_cat")
+
+URL_ROOT = "https://www.abs.gov.au/synthetic/"
+CATALOGUES = {  # catalogue -> (tables, frequency)
+    "1111.0": (("1111001", "1111002"), "Month"),
+    "2222.0": (("2222001",), "Quarter"),
+}
+
+
+@contextmanager
+def _patches(folder: Path) -> Iterator[list[str]]:
+    """Serve the synthetic catalogues; yield the list of the files downloaded."""
+    files: dict[str, bytes] = {}
+    for cat, (tables, freq) in CATALOGUES.items():
+        page = f"{URL_ROOT}{cat}"
+        with zipfile.ZipFile(folder / f"{cat}.zip", "w") as zipped:
+            for number, table in enumerate(tables):
+                files[f"{page}/{table}.xlsx"] = abs_workbook(table, seed=number, freq=freq)
+                zipped.writestr(f"{table}.xlsx", files[f"{page}/{table}.xlsx"])
+        files[f"{page}/all.zip"] = (folder / f"{cat}.zip").read_bytes()
+    catalogue = DataFrame({"URL": [f"{URL_ROOT}{cat}" for cat in CATALOGUES]}, index=list(CATALOGUES))
+    downloads: list[str] = []
+
+    def lookup(**_kwargs: bool) -> DataFrame:
+        return catalogue
+
+    def links(url: str, **_kwargs: object) -> dict[str, list[str]]:
+        on_page = [link for link in files if link.startswith(f"{url}/")]
+        return {
+            ".zip": [link for link in on_page if link.endswith(".zip")],
+            ".xlsx": [link for link in on_page if link.endswith(".xlsx")],
+        }
+
+    def get_file(link: str, **_kwargs: object) -> bytes:
+        downloads.append(link.removeprefix(URL_ROOT))
+        return files[link]
+
+    with (
+        mock.patch.multiple(grab_module, abs_catalogue=lookup, get_abs_links=links, get_file=get_file),
+        mock.patch.object(directory_module, "DIRECTORY_PATH", folder / "series-directory.pkl"),
+        mock.patch.object(directory_module, "_held", directory_module._Held()),  # noqa: SLF001
+    ):
+        yield downloads
+
+
+# --- tests
+def test_reads_only_owning_workbooks() -> None:
+    """Known series are read from their own Excel files, across catalogues, with no catalogue given."""
+    ra.clear_caches()
+    monthly, quarterly = series_ids("1111002", 2), series_ids("2222001", 1)
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as downloads:
+        ra.read_abs_meta("1111.0")
+        ra.read_abs_meta("2222.0")
+        downloads.clear()
+        data, meta = ra.read_abs_series(series_id=monthly)
+        assert sorted(downloads) == ["1111.0/1111002.xlsx"]
+        downloads.clear()
+        _both, both_meta = ra.read_abs_series(series_id=[quarterly[0], monthly[0]], ignore_errors=True)
+        # a lenient read does not reuse the strict read of the monthly workbook; a mixed frequency is dropped
+        assert sorted(downloads) == ["1111.0/1111002.xlsx", "2222.0/2222001.xlsx"]
+        expected, expected_meta = ra.read_abs_series("1111.0", monthly, single_excel_only="1111002")
+
+    assert data.equals(expected)
+    assert meta.equals(expected_meta)
+    assert list(both_meta.index) == quarterly
+    ra.clear_caches()
+
+
+def test_full_read_is_reused() -> None:
+    """After a full read_abs_cat(), the owning tables are taken from its memoised result, with no new download."""
+    ra.clear_caches()
+    wanted = series_ids("1111002", 2)
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as downloads:
+        full, _full_meta = ra.read_abs_cat("1111.0")
+        downloads.clear()
+        parse = mock.Mock(wraps=cat_module._get_time_series_data)  # noqa: SLF001
+        with mock.patch.object(cat_module, "_get_time_series_data", parse):
+            data, meta = ra.read_abs_series(series_id=wanted)
+            windowed, _meta = ra.read_abs_series("1111.0", wanted, start="2020-01")
+        assert downloads == []
+        assert parse.call_count == 0
+
+    assert data.equals(full["1111002"][wanted])
+    assert list(meta.index) == wanted
+    assert windowed.equals(data.loc["2020-01":])
+    ra.clear_caches()
+
+
+def test_miss_reads_whole_catalogue() -> None:
+    """With a catalogue, a series not in the directory is found by a full read, which fills the directory."""
+    ra.clear_caches()
+    wanted = series_ids("1111001", 1)
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as downloads:
+        data, _meta = ra.read_abs_series("1111.0", wanted)
+        assert downloads == ["1111.0/all.zip"]
+        assert ra.lookup_series(wanted[0])[mc.table] == "1111001"
+        assert len(ra.directory("1111.0")) == 20
+
+        raised = False
+        try:
+            ra.read_abs_series(series_id=series_ids("2222001", 1))  # no catalogue, and not yet read
+        except ValueError:
+            raised = True
+        assert raised, "expected ValueError for a series with no catalogue"
+    assert list(data.columns) == wanted
+    ra.clear_caches()
+
+
+def test_stale_directory_reads_whole_catalogue() -> None:
+    """A series that has moved table since the directory was written is found by a full read."""
+    ra.clear_caches()
+    moved = series_ids("1111002", 1)
+    stale = DataFrame({mc.id: moved, mc.table: ["1111001"], mc.cat: ["1111.0"]})
+    with TemporaryDirectory() as tmp, _patches(Path(tmp)) as downloads:
+        directory_module.update_directory(stale)
+        data, _meta = ra.read_abs_series(series_id=moved)
+        assert downloads == ["1111.0/1111001.xlsx", "1111.0/all.zip"]
+        assert ra.lookup_series(moved[0])[mc.table] == "1111002"  # the directory is corrected
+    assert list(data.columns) == moved
+    assert data[moved[0]].notna().any()
+    ra.clear_caches()
+
+
+if __name__ == "__main__":
+    test_reads_only_owning_workbooks()
+    test_full_read_is_reused()
+    test_miss_reads_whole_catalogue()
+    test_stale_directory_reads_whole_catalogue()
+    print("All series resolution tests passed.")
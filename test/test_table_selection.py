@@ -0,0 +1,59 @@
+"""Test the tables= option, which selects tables by name or pattern.
+
+These tests are hermetic: the ABS workbooks are synthesised locally and read
+through the zip_file path, so no network access is made.
+"""
+
+import zipfile
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from synthetic_abs import abs_zip
+
+import readabs as ra
+
+
+# --- tests
+def test_tables_by_name_and_pattern() -> None:
+    """Names and regular expressions select whole table names."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=4)
+        by_name, meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), tables=("9999002",))
+        by_pattern, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), tables=(r"999900[13]",))
+        partial, _meta = ra.read_abs_cat("9999.0", zip_file=str(zip_path), tables=("99990",))
+
+    assert list(by_name) == ["9999002"]
+    assert set(meta["Table"]) == {"9999002"}
+    assert list(by_pattern) == ["9999001", "9999003"]
+    assert not partial  # a pattern must match the whole name
+
+
+def test_unwanted_members_are_not_read() -> None:
+    """Zip members that are not selected are never decompressed."""
+    with TemporaryDirectory() as tmp:
+        zip_path = abs_zip(Path(tmp) / "synthetic.zip", n_tables=5)
+        original_read = zipfile.ZipFile.read
+        with mock.patch.object(zipfile.ZipFile, "read", autospec=True, side_effect=original_read) as read:
+            raw = ra.grab_abs_zip(zip_path, tables=("9999004",))
+
+    members = [call.args[1] for call in read.call_args_list if str(call.args[1]).endswith(".xlsx")]
+    assert members == ["9999004.xlsx"]  # (openpyxl also reads the parts inside the xlsx)
+    assert {name.split("---")[0] for name in raw} == {"9999004"}
+
+
+def test_invalid_pattern_raises() -> None:
+    """A pattern that is not a valid regular expression is rejected."""
+    raised = False
+    try:
+        ra.grab_abs_zip("never-read.zip", tables=("62020[",))
+    except ValueError:
+        raised = True
+    assert raised, "expected ValueError for an invalid table pattern"
+
+
+if __name__ == "__main__":
+    test_tables_by_name_and_pattern()
+    test_unwanted_members_are_not_read()
+    test_invalid_pattern_raises()
+    print("All table selection tests passed.")